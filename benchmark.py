@@ -0,0 +1,330 @@
+"""Benchmark SAW, WP, TOPSIS dan AHP untuk berbagai ukuran matriks, tanpa Streamlit.
+
+Contoh:
+    python benchmark.py --output bench.json
+    python benchmark.py --output bench_baru.json --bandingkan bench.json --ambang 0.2
+    python benchmark.py --maks-baris 100000 --output cepat.json
+
+Matriks keputusan (nilai 1..100, bobot Dirichlet, tipe acak) dan matriks
+perbandingan AHP (skala Saaty acak) dibuat dari seed per ukuran, jadi
+ukuran yang sama selalu memakai data yang sama di setiap commit. Untuk
+setiap metode, implementasi dan ukuran dicatat waktu (minimum dan median
+beberapa ulangan), puncak memori (tracemalloc, dijalankan terpisah agar
+tidak mengganggu waktu) dan throughput. Implementasi manual (list of
+lists) hanya dijalankan sampai ``--batas-manual`` sel dan hasilnya
+dibandingkan dengan mesin NumPy (parity), begitu juga TOPSIS paralel
+(per chunk di thread pool). Laporan JSON menyimpan hash
+commit sehingga dua laporan bisa dibandingkan dengan ``--bandingkan``.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+
+from spk.ahp import hitung_ahp_batch, hitung_ahp_np
+from spk.engine import hitung_saw_np, hitung_topsis_np, hitung_wp_np
+from spk.indeks_acak import matriks_acak
+from spk.manual import hitung_ahp, hitung_saw, hitung_topsis, hitung_wp
+from spk.topsis_paralel import hitung_topsis_paralel
+
+VERSI_LAPORAN = 1
+
+UKURAN_PERINGKAT = [(10, 4), (100, 5), (1_000, 10), (10_000, 20), (100_000, 20), (1_000_000, 50)]
+UKURAN_AHP = [3, 4, 5, 7, 10, 15, 20, 30, 50, 75, 100]
+
+# Implementasi manual O(alternatif x kriteria) di Python murni; di atas batas ini dilewati
+BATAS_MANUAL = 200_000
+# Jumlah matriks per panggilan hitung_ahp_batch: sekitar 200 ribu elemen per tumpukan
+ELEMEN_BATCH_AHP = 200_000
+# Ulangi pengukuran sampai total waktunya minimal sekian detik (atau maks_ulangan tercapai)
+WAKTU_MIN_UKUR = 0.2
+# Fungsi yang lebih cepat dari ini dipanggil berulang dalam satu ulangan
+WAKTU_MIN_LOOP = 0.01
+# Waktu di bawah ini terlalu bising untuk dinilai sebagai regresi
+BATAS_BISING = 1e-4
+TOLERANSI_PARITY = 1e-9
+
+# (metode, implementasi) -> fungsi(data, bobot, tipe) yang mengembalikan skor akhir
+PERINGKAT = {
+    ("SAW", "manual"): lambda X, w, t: hitung_saw(X, w, t)[1],
+    ("SAW", "engine"): lambda X, w, t: hitung_saw_np(X, w, t)[1],
+    ("WP", "manual"): lambda X, w, t: hitung_wp(X, w, t)[2],
+    ("WP", "engine"): lambda X, w, t: hitung_wp_np(X, w, t)[2],
+    ("TOPSIS", "manual"): lambda X, w, t: hitung_topsis(X, w, t)[6],
+    ("TOPSIS", "engine"): lambda X, w, t: hitung_topsis_np(X, w, t)[6],
+    ("TOPSIS", "paralel"): lambda X, w, t: hitung_topsis_paralel(X, w, t)[4],
+}
+METODE_PERINGKAT = ("SAW", "WP", "TOPSIS")
+
+
+def commit_git():
+    """Hash commit HEAD (dengan akhiran '-dirty' jika ada perubahan belum di-commit), atau None"""
+    folder = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=folder, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        status = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=folder,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return commit + ("-dirty" if status else "")
+
+
+def data_keputusan(n_alt, n_krit, seed=0):
+    """Matriks keputusan, bobot dan tipe acak yang sama untuk seed dan ukuran yang sama"""
+    rng = np.random.default_rng([seed, n_alt, n_krit])
+    X = rng.uniform(1.0, 100.0, size=(n_alt, n_krit))
+    bobot = rng.dirichlet(np.ones(n_krit))
+    tipe = list(rng.choice(["Benefit", "Cost"], size=n_krit))
+    return X, bobot, tipe
+
+
+def data_ahp(n, jumlah, seed=0):
+    """Tumpukan (jumlah, n, n) matriks perbandingan resiprokal acak skala Saaty"""
+    return matriks_acak(np.random.default_rng([seed, n, jumlah]), jumlah, n)
+
+
+def ukur(fungsi, *args, maks_ulangan=5):
+    """Waktu per panggilan (list detik per ulangan), puncak memori (byte) dan hasil ``fungsi(*args)``
+
+    Puncak memori diukur pada satu pemanggilan terpisah dengan tracemalloc
+    (mencakup alokasi NumPy). Seperti timeit, fungsi yang cepat dipanggil
+    berkali-kali per ulangan agar setiap ulangan minimal ``WAKTU_MIN_LOOP``
+    detik; ulangan berhenti setelah ``maks_ulangan`` atau total
+    ``WAKTU_MIN_UKUR`` detik (minimal satu ulangan).
+    """
+    tracemalloc.start()
+    try:
+        hasil = fungsi(*args)
+        _, puncak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del hasil
+
+    t0 = time.perf_counter()
+    hasil = fungsi(*args)
+    sekali = time.perf_counter() - t0
+    loop = max(1, int(WAKTU_MIN_LOOP / max(sekali, 1e-9)))
+    waktu = []
+    while len(waktu) < maks_ulangan and (not waktu or sum(waktu) * loop < WAKTU_MIN_UKUR):
+        t0 = time.perf_counter()
+        for _ in range(loop):
+            hasil = fungsi(*args)
+        waktu.append((time.perf_counter() - t0) / loop)
+    return waktu, puncak, hasil
+
+
+def _catatan(kelompok, metode, implementasi, ukuran, jumlah, waktu, puncak):
+    terbaik = min(waktu)
+    return {
+        "kelompok": kelompok,
+        "metode": metode,
+        "implementasi": implementasi,
+        "ukuran": list(ukuran),
+        "waktu_min": terbaik,
+        "waktu_median": statistics.median(waktu),
+        "ulangan": len(waktu),
+        "memori_puncak_byte": puncak,
+        # Alternatif per detik (peringkat) atau matriks per detik (AHP)
+        "throughput": jumlah / terbaik if terbaik > 0 else None,
+    }
+
+
+def _parity(acuan, hasil):
+    selisih = float(np.max(np.abs(np.asarray(acuan, dtype=float) - np.asarray(hasil, dtype=float))))
+    return {"pembanding": "engine", "selisih_maks": selisih, "cocok": selisih <= TOLERANSI_PARITY}
+
+
+def bench_peringkat(ukuran, metode=METODE_PERINGKAT, batas_manual=BATAS_MANUAL, seed=0, maks_ulangan=5, log=print):
+    """Catatan benchmark SAW/WP/TOPSIS (manual, engine, paralel) untuk setiap (alternatif, kriteria)"""
+    catatan = []
+    for n_alt, n_krit in ukuran:
+        X, bobot, tipe = data_keputusan(n_alt, n_krit, seed)
+        # Konversi ke list tidak ikut diukur; manual memang menerima list of lists
+        data_list = X.tolist() if n_alt * n_krit <= batas_manual else None
+        bobot_list = bobot.tolist()
+        for m in metode:
+            waktu, puncak, skor_engine = ukur(PERINGKAT[(m, "engine")], X, bobot, tipe, maks_ulangan=maks_ulangan)
+            catatan.append(_catatan("peringkat", m, "engine", (n_alt, n_krit), n_alt, waktu, puncak))
+            log(_baris(catatan[-1]))
+            if (m, "paralel") in PERINGKAT:
+                waktu, puncak, skor_paralel = ukur(PERINGKAT[(m, "paralel")], X, bobot, tipe, maks_ulangan=maks_ulangan)
+                catatan.append(_catatan("peringkat", m, "paralel", (n_alt, n_krit), n_alt, waktu, puncak))
+                catatan[-1]["parity"] = _parity(skor_engine, skor_paralel)
+                log(_baris(catatan[-1]))
+            if data_list is None:
+                continue
+            waktu, puncak, skor_manual = ukur(PERINGKAT[(m, "manual")], data_list, bobot_list, tipe,
+                                              maks_ulangan=maks_ulangan)
+            catatan.append(_catatan("peringkat", m, "manual", (n_alt, n_krit), n_alt, waktu, puncak))
+            catatan[-1]["parity"] = _parity(skor_engine, skor_manual)
+            log(_baris(catatan[-1]))
+        del X, data_list
+    return catatan
+
+
+def bench_ahp(ukuran, seed=0, maks_ulangan=5, log=print):
+    """Catatan benchmark AHP: manual (rata-rata baris), engine per matriks dan engine batch
+
+    Manual dan engine memakai metode berbeda (aproksimasi rata-rata baris vs
+    eigenvektor) sehingga pada matriks acak hasilnya tidak sama. Parity
+    diperiksa pada matriks konsisten w_i / w_j, di mana keduanya harus
+    memberi bobot yang sama persis.
+    """
+    catatan = []
+    for n in ukuran:
+        A = data_ahp(n, 1, seed)[0]
+        w = np.random.default_rng([seed, n]).uniform(1.0, 9.0, n)
+        konsisten = w[:, None] / w[None, :]
+
+        waktu, puncak, _ = ukur(hitung_ahp_np, A, maks_ulangan=maks_ulangan)
+        catatan.append(_catatan("ahp", "AHP", "engine", (n,), 1, waktu, puncak))
+        log(_baris(catatan[-1]))
+
+        A_list = A.tolist()
+        waktu, puncak, _ = ukur(hitung_ahp, A_list, maks_ulangan=maks_ulangan)
+        catatan.append(_catatan("ahp", "AHP", "manual", (n,), 1, waktu, puncak))
+        catatan[-1]["parity"] = _parity(hitung_ahp_np(konsisten)[1], hitung_ahp(konsisten.tolist())[1])
+        catatan[-1]["parity"]["matriks"] = "konsisten"
+        log(_baris(catatan[-1]))
+
+        jumlah = max(10, ELEMEN_BATCH_AHP // (n * n))
+        tumpukan = data_ahp(n, jumlah, seed)
+        waktu, puncak, bobot_batch = ukur(hitung_ahp_batch, tumpukan, maks_ulangan=maks_ulangan)
+        catatan.append(_catatan("ahp", "AHP", "batch", (n, jumlah), jumlah, waktu, puncak))
+        catatan[-1]["parity"] = _parity(hitung_ahp_np(tumpukan[0])[1], bobot_batch[0][0])
+        catatan[-1]["parity"]["matriks"] = "acak"
+        log(_baris(catatan[-1]))
+    return catatan
+
+
+def _baris(c):
+    ukuran = " x ".join(f"{u:,}" for u in c["ukuran"])
+    teks = (f"{c['metode']:<7}{c['implementasi']:<8}{ukuran:>20}  {c['waktu_min'] * 1000:>11.3f} ms  "
+            f"{c['memori_puncak_byte'] / 2**20:>9.1f} MB  {c['throughput'] or 0:>14,.0f} /s")
+    if "parity" in c:
+        teks += f"  parity {'OK' if c['parity']['cocok'] else 'GAGAL'} ({c['parity']['selisih_maks']:.1e})"
+    return teks
+
+
+def kunci_catatan(c):
+    return (c["kelompok"], c["metode"], c["implementasi"], tuple(c["ukuran"]))
+
+
+def bandingkan(lama, baru, ambang=0.2):
+    """Bandingkan dua laporan per (metode, implementasi, ukuran)
+
+    Mengembalikan list dict berisi ``kunci``, ``waktu_lama``, ``waktu_baru``,
+    ``rasio`` (baru / lama) dan ``regresi`` (rasio > 1 + ambang dan waktu
+    baru di atas ``BATAS_BISING``).
+    """
+    acuan = {kunci_catatan(c): c for c in lama["hasil"]}
+    perbandingan = []
+    for c in baru["hasil"]:
+        lama_c = acuan.get(kunci_catatan(c))
+        if lama_c is None or not lama_c["waktu_min"]:
+            continue
+        rasio = c["waktu_min"] / lama_c["waktu_min"]
+        perbandingan.append({
+            "kunci": kunci_catatan(c),
+            "waktu_lama": lama_c["waktu_min"],
+            "waktu_baru": c["waktu_min"],
+            "rasio": rasio,
+            "regresi": rasio > 1 + ambang and c["waktu_min"] >= BATAS_BISING,
+        })
+    return perbandingan
+
+
+def jalankan(ukuran_peringkat=UKURAN_PERINGKAT, ukuran_ahp=UKURAN_AHP, metode=METODE_PERINGKAT,
+             batas_manual=BATAS_MANUAL, seed=0, maks_ulangan=5, log=print):
+    """Jalankan seluruh benchmark dan kembalikan laporan (dict siap ditulis sebagai JSON)"""
+    laporan = {
+        "versi": VERSI_LAPORAN,
+        "commit": commit_git(),
+        "waktu": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "seed": seed,
+        "platform": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "mesin": platform.machine(),
+            "prosesor": platform.processor() or None,
+            "cpu": os.cpu_count(),
+        },
+        "hasil": [],
+    }
+    if ukuran_peringkat and metode:
+        laporan["hasil"] += bench_peringkat(ukuran_peringkat, metode, batas_manual, seed, maks_ulangan, log)
+    if ukuran_ahp:
+        laporan["hasil"] += bench_ahp(ukuran_ahp, seed, maks_ulangan, log)
+    return laporan
+
+
+def buat_parser():
+    parser = argparse.ArgumentParser(description="Benchmark SAW/WP/TOPSIS/AHP: waktu, memori puncak dan throughput")
+    parser.add_argument("--output", default="bench.json", help="File laporan JSON (default bench.json)")
+    parser.add_argument("--metode", default=",".join(METODE_PERINGKAT + ("AHP",)),
+                        type=lambda t: [m.strip().upper() for m in t.split(",") if m.strip()],
+                        help="Metode dipisah koma (default SAW,WP,TOPSIS,AHP)")
+    parser.add_argument("--maks-baris", type=int, help="Lewati ukuran dengan alternatif lebih dari ini")
+    parser.add_argument("--maks-n-ahp", type=int, help="Lewati matriks AHP yang lebih besar dari n ini")
+    parser.add_argument("--batas-manual", type=int, default=BATAS_MANUAL,
+                        help=f"Jumlah sel maksimum untuk implementasi manual (default {BATAS_MANUAL:,})")
+    parser.add_argument("--ulangan", type=int, default=5, help="Ulangan maksimum per pengukuran (default 5)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--bandingkan", help="Laporan lama untuk dibandingkan (deteksi regresi)")
+    parser.add_argument("--ambang", type=float, default=0.2,
+                        help="Regresi jika waktu naik lebih dari fraksi ini (default 0.2 = 20%%)")
+    return parser
+
+
+def main(argv=None):
+    args = buat_parser().parse_args(argv)
+    tidak_dikenal = set(args.metode) - set(METODE_PERINGKAT + ("AHP",))
+    if tidak_dikenal:
+        print(f"Metode tidak dikenal: {', '.join(sorted(tidak_dikenal))}", file=sys.stderr)
+        return 2
+
+    ukuran_peringkat = [u for u in UKURAN_PERINGKAT if args.maks_baris is None or u[0] <= args.maks_baris]
+    ukuran_ahp = [n for n in UKURAN_AHP if args.maks_n_ahp is None or n <= args.maks_n_ahp] if "AHP" in args.metode else []
+    laporan = jalankan(ukuran_peringkat, ukuran_ahp, [m for m in METODE_PERINGKAT if m in args.metode],
+                       args.batas_manual, args.seed, args.ulangan)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(laporan, f, indent=1)
+        f.write("\n")
+    print(f"Laporan ditulis ke {args.output} (commit {laporan['commit']})")
+
+    status = 0
+    gagal = [c for c in laporan["hasil"] if "parity" in c and not c["parity"]["cocok"]]
+    for c in gagal:
+        print(f"PARITY GAGAL: {c['metode']} {c['implementasi']} {c['ukuran']} "
+              f"(selisih {c['parity']['selisih_maks']:.3e})", file=sys.stderr)
+        status = 1
+
+    if args.bandingkan:
+        with open(args.bandingkan, encoding="utf-8") as f:
+            lama = json.load(f)
+        perbandingan = bandingkan(lama, laporan, args.ambang)
+        print(f"\nDibandingkan dengan {args.bandingkan} (commit {lama.get('commit')}):")
+        for p in perbandingan:
+            kelompok, m, implementasi, ukuran = p["kunci"]
+            tanda = "  REGRESI" if p["regresi"] else ""
+            print(f"  {m:<7}{implementasi:<8}{' x '.join(map(str, ukuran)):>20}  "
+                  f"{p['waktu_lama'] * 1000:>10.3f} -> {p['waktu_baru'] * 1000:>10.3f} ms  x{p['rasio']:.2f}{tanda}")
+        n_regresi = sum(p["regresi"] for p in perbandingan)
+        if n_regresi:
+            print(f"{n_regresi} pengukuran lebih lambat dari ambang {args.ambang:.0%}", file=sys.stderr)
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Penilaian SAW/WP/TOPSIS tanpa Streamlit untuk file matriks keputusan besar.
+
+Contoh:
+    python cli.py supplier.csv --metode topsis --bobot 0.3,0.2,0.5 --tipe B,C,B \
+        --kolom-id kode --output hasil.csv --chunk 500000
+
+Data dibaca per chunk (CSV, Parquet, .npy, atau biner mentah dengan
+--n-kriteria/--dtype), sehingga memori tidak bergantung pada jumlah baris.
+"""
+
+import argparse
+import sys
+
+from spk.engine import METRIK_JARAK
+from spk.streaming import METODE_STREAMING, skor_streaming
+
+
+def _parse_tipe(teks):
+    tipe = []
+    for t in teks.split(","):
+        t = t.strip().lower()
+        if t in ("b", "benefit"):
+            tipe.append("Benefit")
+        elif t in ("c", "cost"):
+            tipe.append("Cost")
+        else:
+            raise argparse.ArgumentTypeError(f"Tipe tidak dikenal: {t!r} (gunakan Benefit/Cost atau B/C)")
+    return tipe
+
+
+def _parse_bobot(teks):
+    try:
+        return [float(b) for b in teks.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Bobot harus berupa angka dipisah koma: {teks!r}") from None
+
+
+def buat_parser():
+    parser = argparse.ArgumentParser(description="Penilaian SAW/WP/TOPSIS dua lintasan untuk file besar")
+    parser.add_argument("input", help="File matriks keputusan (.csv, .parquet, .npy atau biner mentah)")
+    parser.add_argument("--metode", required=True, type=str.upper, choices=METODE_STREAMING)
+    parser.add_argument("--bobot", required=True, type=_parse_bobot, help="Bobot dipisah koma, mis. 0.3,0.2,0.5")
+    parser.add_argument("--tipe", required=True, type=_parse_tipe, help="Tipe dipisah koma, mis. B,C,B")
+    parser.add_argument("--metrik", type=str.lower, choices=METRIK_JARAK, default="euclidean",
+                        help="Jarak ke solusi ideal TOPSIS (default euclidean)")
+    parser.add_argument("--output", required=True, help="File hasil (.csv atau .parquet)")
+    parser.add_argument("--chunk", type=int, default=100_000, help="Jumlah baris per chunk (default 100000)")
+    parser.add_argument("--format", choices=["csv", "parquet", "npy", "bin"], help="Paksa format input")
+    parser.add_argument("--kolom", help="Kolom kriteria dipisah koma (CSV/Parquet); default semua selain --kolom-id")
+    parser.add_argument("--kolom-id", help="Kolom id alternatif yang ikut ditulis ke output")
+    parser.add_argument("--n-kriteria", type=int, help="Jumlah kriteria untuk file biner mentah")
+    parser.add_argument("--dtype", default="float64", help="Tipe data file biner mentah (default float64)")
+    parser.add_argument("--simpan-skor", help="Simpan skor mentah ke file .npy ini")
+    return parser
+
+
+def main(argv=None):
+    args = buat_parser().parse_args(argv)
+    if len(args.bobot) != len(args.tipe):
+        print("Jumlah bobot dan tipe harus sama", file=sys.stderr)
+        return 2
+
+    try:
+        ringkasan = skor_streaming(
+            args.input, args.metode, args.bobot, args.tipe, args.output,
+            ukuran_chunk=args.chunk, path_skor=args.simpan_skor, metrik=args.metrik, format=args.format,
+            kolom=args.kolom.split(",") if args.kolom else None, kolom_id=args.kolom_id,
+            n_kriteria=args.n_kriteria, dtype=args.dtype,
+        )
+    except (ValueError, ImportError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    waktu = ringkasan["waktu"]
+    print(f"{ringkasan['n_alt']:,} alternatif dinilai dengan {args.metode}"
+          + (f" (jarak {args.metrik})" if args.metode == "TOPSIS" else ""))
+    print(f"Lintasan 1: {waktu['lintasan_1']:.2f}s, lintasan 2: {waktu['lintasan_2']:.2f}s, "
+          f"peringkat + tulis: {waktu['peringkat']:.2f}s")
+    print("10 teratas (indeks baris, skor):")
+    for i, s in ringkasan["teratas"]:
+        print(f"  {i}\t{s:.6f}")
+    print(f"Hasil ditulis ke {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,462 @@
+"""Halaman AHP: perbandingan lengkap (termasuk mode kelompok), tidak lengkap, dan hierarki."""
+
+import json
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+from spk.ahp import hitung_ahp_np, hitung_ahp_batch
+from spk.grup import METODE_AGREGASI, agregasi_grup
+from spk.hierarki import Hierarki
+from spk.tak_lengkap import desain_perbandingan, prioritas_llsm, saran_perbandingan
+from spk.cache import cache_hasil, hitung_tercache, kunci_hash
+from spk.skenario import muat_skenario, simpan_skenario
+from halaman.umum import tabel_peringkat, tampilkan_penjelasan, tampilkan_pustaka_skenario, tampilkan_tabel
+
+# ==================== SKENARIO AHP ====================
+
+def simpan_skenario_ahp(kode, alternatif, kriteria, matrix_kriteria, matrices_alternatif):
+    state = st.session_state
+    matrices_alternatif = np.array(matrices_alternatif)
+    meta = simpan_skenario(state.get(f"nama_skenario_{kode}", ""), "ahp", kriteria, alternatif,
+                           ahp_kriteria=matrix_kriteria, ahp_alternatif=matrices_alternatif, metode="AHP",
+                           kunci_cache=[("AHP", kunci_hash("AHP", matrix_kriteria)),
+                                        ("AHP_BATCH", kunci_hash("AHP_BATCH", matrices_alternatif))],
+                           timpa=state.get(f"timpa_skenario_{kode}", False))
+    return f"✅ Skenario {meta['nama']} disimpan ({len(meta['hasil'])} hasil)"
+
+def muat_skenario_ahp(kode, nama):
+    """Jadikan penilaian skenario sebagai nilai awal widget AHP mode lengkap"""
+    sk = muat_skenario(nama)
+    state = st.session_state
+    state["skenario_ahp"] = {'kriteria': sk['kriteria'], 'alternatif': sk['data']['alternatif'].tolist(),
+                             'ahp_kriteria': np.array(sk['data']['ahp_kriteria']),
+                             'ahp_alternatif': np.array(sk['data']['ahp_alternatif'])}
+    state["versi_ahp"] = state.get("versi_ahp", 0) + 1
+    state["ahp_mode"] = "Lengkap"
+    state["ahp_kelompok"] = False
+    return f"✅ Skenario {sk['nama']} dimuat ({len(sk['hasil'])} hasil masuk cache)"
+
+# ==================== AHP KELOMPOK ====================
+
+def input_penilaian_kelompok(kode, judul, n, metode_agregasi, buang_tidak_konsisten):
+    """Unggah penilaian responden untuk satu matriks; kembalikan matriks agregat atau None"""
+    file = st.file_uploader(f"Penilaian responden: {judul}", type=["npy", "csv"], key=f"grup_{kode}")
+    if file is None:
+        return None
+    batas_cr = 0.1
+    try:
+        # Semua argumen agregasi_grup selain file ikut kunci, termasuk n agar validasi ukuran tidak terlewat
+        hasil = cache_hasil.hitung(kunci_hash("GRUP", file.file_id, metode_agregasi, n, batas_cr, buang_tidak_konsisten),
+                                   agregasi_grup, file, metode_agregasi, n, batas_cr, buang_tidak_konsisten)
+    except ValueError as e:
+        st.error(f"❌ {judul}: {e}")
+        st.stop()
+    
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Responden", f"{hasil['n_responden']:,}")
+    col2.metric("Dipakai", f"{hasil['n_dipakai']:,}")
+    col3.metric("CR > 0.1", f"{hasil['tidak_konsisten'].size:,}")
+    col4.metric(f"CR agregat ({hasil['metode']})", f"{hasil['cr']:.4f}")
+    if hasil['tidak_konsisten'].size:
+        with st.expander("Responden tidak konsisten"):
+            tampilkan_tabel(pd.DataFrame({
+                'Responden (baris ke-)': hasil['tidak_konsisten'] + 1,
+                'CR': hasil['cr_responden'][hasil['tidak_konsisten']],
+            }).round(4))
+    return hasil['matriks']
+
+# ==================== AHP: SKOR AKHIR ====================
+
+def tampilkan_skor_ahp(kriteria, alternatif, prioritas_alternatif, bobot_kriteria, top_k_tampil):
+    """Step 3 AHP: skor akhir = matriks prioritas alternatif (alternatif x kriteria) @ bobot kriteria"""
+    st.write("### 3. Skor Akhir (Prioritas Alternatif × Bobot Kriteria)")
+    n_krit = len(kriteria)
+    
+    # Matriks prioritas (alternatif x kriteria)
+    matriks_prioritas = prioritas_alternatif.T
+    
+    df_matriks_prioritas = pd.DataFrame(matriks_prioritas, columns=kriteria, index=alternatif)
+    st.write("**Matriks Prioritas Alternatif:**")
+    tampilkan_tabel(df_matriks_prioritas.round(4))
+    
+    skor_akhir = matriks_prioritas @ bobot_kriteria
+    
+    def baris_skor(i):
+        perhitungan = " + ".join([f"({matriks_prioritas[i][j]:.4f} × {bobot_kriteria[j]:.4f})" for j in range(n_krit)])
+        return f"Skor({alternatif[i]}) = {perhitungan} = **{skor_akhir[i]:.4f}**"
+    
+    tampilkan_penjelasan("ahp_skor", "Detail Perhitungan Skor", alternatif, baris_skor)
+    
+    # Hasil akhir dengan ranking
+    hasil = tabel_peringkat(alternatif, {'Skor Akhir': skor_akhir}, 'Skor Akhir', top_k_tampil)
+    
+    st.write("### Hasil Akhir AHP")
+    tampilkan_tabel(hasil)
+    st.success(f"Alternatif terbaik: **{hasil.iloc[0]['Alternatif']}** dengan skor {hasil.iloc[0]['Skor Akhir']:.4f}")
+
+# ==================== AHP PERBANDINGAN TIDAK LENGKAP ====================
+
+def input_nama(kode, judul, n):
+    """Daftar nama (unik) lewat satu tabel, untuk jumlah elemen yang besar"""
+    df = st.data_editor(pd.DataFrame({judul: [f"{judul} {i+1}" for i in range(n)]}),
+                        key=f"nama_{kode}_{n}", hide_index=True, use_container_width=True,
+                        column_config={judul: st.column_config.TextColumn(required=True)})
+    nama = df[judul].astype(str).tolist()
+    if len(set(nama)) != len(nama):
+        st.error(f"❌ Nama {judul.lower()} harus unik")
+        st.stop()
+    return nama
+
+def input_perbandingan_tak_lengkap(kode, nama, jenis, tambahan, seed):
+    """Tabel nilai untuk pasangan desain; baris bisa ditambah. Kembalikan (pasangan, nilai)"""
+    pasangan = desain_perbandingan(len(nama), jenis, tambahan, seed)
+    nama_arr = np.asarray(nama, dtype=object)
+    df = st.data_editor(
+        pd.DataFrame({'A': nama_arr[pasangan[:, 0]], 'B': nama_arr[pasangan[:, 1]], 'Nilai': 1.0}),
+        key=f"tl_{kode}_{jenis}_{tambahan}_{seed}", num_rows="dynamic", hide_index=True, use_container_width=True,
+        column_config={
+            'A': st.column_config.SelectboxColumn(options=nama, required=True),
+            'B': st.column_config.SelectboxColumn(options=nama, required=True),
+            'Nilai': st.column_config.NumberColumn("Nilai (A dibanding B)", min_value=0.0, step=0.1, required=True),
+        },
+    )
+    df = df.dropna()
+    indeks = {n: i for i, n in enumerate(nama)}
+    pasangan = np.array([[indeks[a], indeks[b]] for a, b in zip(df['A'], df['B'])], dtype=np.int64).reshape(-1, 2)
+    return pasangan, df['Nilai'].to_numpy(dtype=float)
+
+def tampilkan_prioritas_tak_lengkap(kode, nama, pasangan, hasil):
+    """Prioritas LLSM, galat, dan saran pasangan tambahan untuk satu matriks tidak lengkap"""
+    tampilkan_tabel(pd.DataFrame({'Nama': nama, 'Prioritas': hasil['bobot']}).round(4))
+    st.write(f"**Pasangan dinilai:** {len(pasangan):,} dari {len(nama) * (len(nama) - 1) // 2:,}, "
+             f"**galat RMS log:** {hasil['galat_rms']:.4f}")
+    if st.toggle("Saran perbandingan tambahan", key=f"saran_{kode}",
+                 help="Pasangan dengan resistansi efektif terbesar pada graf perbandingan paling tidak pasti"):
+        saran = hitung_tercache("SARAN_TL", saran_perbandingan, len(nama), pasangan, 10)
+        st.dataframe(pd.DataFrame({
+            'A': [nama[a] for a, _, _ in saran],
+            'B': [nama[b] for _, b, _ in saran],
+            'Resistansi Efektif': [r for _, _, r in saran],
+        }).round(4))
+
+def tampilkan_ahp_tak_lengkap(n_krit, n_alt):
+    """AHP dengan perbandingan tidak lengkap: hanya pasangan desain yang dinilai, prioritas LLSM"""
+    st.subheader("Nama Kriteria dan Alternatif")
+    col1, col2 = st.columns(2)
+    with col1:
+        kriteria = input_nama("kriteria_ahp", "Kriteria", n_krit)
+    with col2:
+        alternatif = input_nama("alternatif_ahp", "Alternatif", n_alt)
+    
+    st.subheader("Desain Perbandingan")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        jenis = st.selectbox("Kerangka", ["rantai", "acak"], format_func=str.capitalize, key="tl_jenis",
+                             help="Rantai: 1-2, 2-3, ...; Acak: pohon merentang acak")
+    with col2:
+        tambahan = st.number_input("Perbandingan tambahan per elemen", min_value=0.0, max_value=10.0,
+                                   value=1.0, step=0.5, key="tl_tambahan")
+    with col3:
+        seed = st.number_input("Seed", min_value=0, value=0, key="tl_seed")
+    st.caption("Setiap tabel cukup berisi pasangan yang menghubungkan semua elemen. Baris bisa ditambah atau dihapus. "
+               "**Skala Saaty:** 1=Sama penting, 3=Sedikit lebih penting, 5=Lebih penting, 7=Sangat penting, 9=Mutlak lebih penting")
+    
+    st.subheader("Step 1: Perbandingan Berpasangan Kriteria")
+    pasangan_krit, nilai_krit = input_perbandingan_tak_lengkap("krit", kriteria, jenis, tambahan, seed)
+    
+    st.subheader("Step 2: Perbandingan Berpasangan Alternatif (per Kriteria)")
+    perbandingan_alt = []
+    for k in range(n_krit):
+        with st.expander(f"🔍 Perbandingan Alternatif untuk {kriteria[k]}"):
+            perbandingan_alt.append(input_perbandingan_tak_lengkap(f"alt_{k}", alternatif, jenis, tambahan, seed + k + 1))
+    
+    top_k_tampil = st.number_input("Tampilkan Top-k (0 = semua)", min_value=0, value=0, key="topk_ahp_tl")
+    if st.button("Hitung AHP", type="primary", key="btn_ahp_tl"):
+        st.session_state["hitung_ahp_tl"] = True
+    if not st.session_state.get("hitung_ahp_tl"):
+        return
+    try:
+        hasil_krit = hitung_tercache("AHP_TL", prioritas_llsm, n_krit, pasangan_krit, nilai_krit)
+        hasil_alt = [hitung_tercache("AHP_TL", prioritas_llsm, n_alt, p, v) for p, v in perbandingan_alt]
+    except ValueError as e:
+        st.error(f"❌ {e}")
+        return
+    
+    st.subheader("Hasil Perhitungan AHP")
+    st.write("### 1. Bobot Kriteria")
+    tampilkan_prioritas_tak_lengkap("krit", kriteria, pasangan_krit, hasil_krit)
+    
+    st.write("### 2. Prioritas Alternatif per Kriteria")
+    st.dataframe(pd.DataFrame({
+        'Kriteria': kriteria,
+        'Pasangan Dinilai': [len(p) for p, _ in perbandingan_alt],
+        'Galat RMS Log': [h['galat_rms'] for h in hasil_alt],
+    }).round(4))
+    for k in range(n_krit):
+        with st.expander(f"Detail {kriteria[k]}"):
+            tampilkan_prioritas_tak_lengkap(f"alt_{k}", alternatif, perbandingan_alt[k][0], hasil_alt[k])
+    
+    prioritas_alternatif = np.array([h['bobot'] for h in hasil_alt])
+    tampilkan_skor_ahp(kriteria, alternatif, prioritas_alternatif, hasil_krit['bobot'], top_k_tampil)
+
+# ==================== AHP BERTINGKAT (HIERARKI) ====================
+
+CONTOH_HIERARKI = {
+    "alternatif": ["Alternatif 1", "Alternatif 2", "Alternatif 3"],
+    "nama": "Tujuan",
+    "matriks": [3],
+    "anak": [
+        {"nama": "Biaya", "matriks": [2, 4, 2]},
+        {"nama": "Kualitas", "matriks": [3], "anak": [
+            {"nama": "Daya tahan", "matriks": [1, 5, 3]},
+            {"nama": "Tampilan", "matriks": [0.5, 1, 2]},
+        ]},
+    ],
+}
+
+def tampilkan_ahp_hierarki():
+    """AHP bertingkat dari definisi JSON; hanya simpul yang berubah dan leluhurnya yang dihitung ulang"""
+    state = st.session_state
+    file = st.file_uploader("Unggah definisi hierarki (JSON)", type=["json"], key="hierarki_file")
+    if file is not None:
+        teks = file.getvalue().decode("utf-8")
+    else:
+        teks = st.text_area("Definisi hierarki (JSON)", value=json.dumps(CONTOH_HIERARKI, indent=2),
+                            height=300, key="hierarki_json",
+                            help="Setiap simpul: nama, matriks (penuh atau segitiga atas), anak. "
+                                 "Simpul tanpa anak membandingkan alternatif.")
+    kunci = kunci_hash(teks)
+    if state.get("hierarki_kunci") != kunci:
+        try:
+            state["hierarki"] = Hierarki.dari_json(teks)
+        except ValueError as e:
+            st.error(f"❌ {e}")
+            return
+        state["hierarki_kunci"] = kunci
+    hierarki = state["hierarki"]
+    hierarki.statistik.update(hitung_lokal=0, hitung_komposit=0)
+    
+    st.subheader("Matriks Perbandingan per Simpul")
+    st.markdown("**Skala Saaty:** 1=Sama penting, 3=Sedikit lebih penting, 5=Lebih penting, 7=Sangat penting, 9=Mutlak lebih penting")
+    jalur = st.selectbox("Simpul", hierarki.daftar_jalur, key="hierarki_simpul")
+    simpul = hierarki.simpul(jalur)
+    elemen = hierarki.elemen(simpul)
+    df_edit = st.data_editor(pd.DataFrame(simpul.matriks, columns=elemen, index=elemen),
+                             key=f"hierarki_editor_{kunci}_{jalur}", use_container_width=True)
+    st.caption("Isi segitiga atas; diagonal = 1 dan segitiga bawah diisi otomatis dengan kebalikannya.")
+    matriks = df_edit.to_numpy(dtype=float)
+    atas = np.triu_indices(len(elemen), 1)
+    if not np.all(matriks[atas] > 0):
+        st.error("❌ Semua nilai perbandingan harus > 0")
+        return
+    matriks = np.ones_like(matriks)
+    matriks[atas] = df_edit.to_numpy(dtype=float)[atas]
+    matriks[atas[1], atas[0]] = 1.0 / matriks[atas]
+    hierarki.atur_matriks(jalur, matriks)
+    
+    skor = hierarki.skor()
+    st.subheader("Bobot Lokal dan Global")
+    ringkasan = hierarki.ringkasan()
+    st.dataframe(pd.DataFrame({
+        'Simpul': ["    " * r['tingkat'] + r['jalur'].rsplit(" / ", 1)[-1] for r in ringkasan],
+        'Bobot Lokal': [r['bobot_lokal'] for r in ringkasan],
+        'Bobot Global': [r['bobot_global'] for r in ringkasan],
+        'CR': [r['cr'] for r in ringkasan],
+        'Konsisten': ["✅" if r['cr'] <= 0.1 else "❌" for r in ringkasan],
+    }).round(4), use_container_width=True)
+    stat = hierarki.statistik
+    st.caption(f"Dihitung ulang pada interaksi ini: {stat['hitung_lokal']} prioritas lokal, "
+               f"{stat['hitung_komposit']} komposit dari {len(ringkasan)} simpul")
+    
+    top_k_tampil = st.number_input("Tampilkan Top-k (0 = semua)", min_value=0, value=0, key="topk_ahp_hierarki")
+    hasil = tabel_peringkat(hierarki.alternatif, {'Skor Akhir': skor}, 'Skor Akhir', top_k_tampil)
+    st.write("### Hasil Akhir AHP")
+    tampilkan_tabel(hasil)
+    st.success(f"Alternatif terbaik: **{hasil.iloc[0]['Alternatif']}** dengan skor {hasil.iloc[0]['Skor Akhir']:.4f}")
+    st.download_button("Unduh hierarki (JSON)", json.dumps(hierarki.ke_dict(), indent=2),
+                       file_name="hierarki.json", mime="application/json")
+
+# ==================== HALAMAN AHP ====================
+
+def tampilkan():
+    """Halaman AHP; mode tidak lengkap dan hierarki diserahkan ke fungsinya masing-masing"""
+    st.header("Analytical Hierarchy Process (AHP)")
+    
+    mode_perbandingan = st.radio("Mode Perbandingan", ["Lengkap", "Tidak lengkap", "Hierarki (JSON)"], horizontal=True,
+                                 key="ahp_mode",
+                                 help="Tidak lengkap: hanya sebagian pasangan yang dinilai (rantai/acak), "
+                                      "prioritas dihitung dengan logarithmic least squares. "
+                                      "Hierarki: kriteria dan subkriteria bertingkat dari definisi JSON")
+    hierarki = mode_perbandingan == "Hierarki (JSON)"
+    tak_lengkap = mode_perbandingan == "Tidak lengkap"
+    # Skenario yang dimuat menjadi nilai awal widget; versi di key membuat widget baru dengan nilai itu
+    awal = st.session_state.get("skenario_ahp")
+    v = st.session_state.get("versi_ahp", 0)
+    if not hierarki:
+        col1, col2 = st.columns(2)
+        with col1:
+            n_krit = st.number_input("Jumlah Kriteria", min_value=2, max_value=100 if tak_lengkap else 7,
+                                     value=len(awal['kriteria']) if awal else 3, key=f"n_krit_ahp_{v}")
+        with col2:
+            n_alt = st.number_input("Jumlah Alternatif", min_value=2, max_value=1000 if tak_lengkap else 10,
+                                    value=len(awal['alternatif']) if awal else 3, key=f"n_alt_ahp_{v}")
+    
+    if hierarki:
+        tampilkan_ahp_hierarki()
+    elif tak_lengkap:
+        tampilkan_ahp_tak_lengkap(n_krit, n_alt)
+    else:
+        if awal and (n_krit, n_alt) != awal['ahp_alternatif'].shape[:2]:
+            awal = None
+        
+        # Mode kelompok: matriks yang punya file penilaian responden diganti hasil agregasinya
+        mode_kelompok = st.toggle("👥 Mode kelompok (agregasi penilaian banyak responden dari file)", key="ahp_kelompok")
+        if mode_kelompok:
+            col1, col2 = st.columns(2)
+            with col1:
+                metode_agregasi = st.radio("Metode agregasi", METODE_AGREGASI, horizontal=True, key="ahp_agregasi",
+                                           help="AIJ: rata-rata geometrik elemen matriks. AIP: rata-rata geometrik prioritas tiap responden.")
+            with col2:
+                buang_tidak_konsisten = st.checkbox("Buang responden dengan CR > 0.1", key="ahp_buang_cr")
+            st.caption("Unggah .npy berbentuk (responden, n, n) atau CSV dengan baris judul dan satu baris per responden "
+                       "berisi segitiga atas matriks (a12, a13, ..., a1n, a23, ...). Kolom bukan angka diabaikan.")
+        
+        # Nama dan perbandingan baru dikirim saat Terapkan diklik, bukan setiap kali satu input diubah
+        with st.form("form_ahp", border=False):
+            st.subheader("Nama Kriteria")
+            kriteria = []
+            cols = st.columns(n_krit)
+            for i in range(n_krit):
+                with cols[i]:
+                    kriteria.append(st.text_input(f"C{i+1}", value=awal['kriteria'][i] if awal else f"Kriteria {i+1}",
+                                                  key=f"krit_ahp_{i}_{v}"))
+            
+            st.subheader("Nama Alternatif")
+            alternatif = []
+            cols = st.columns(n_alt)
+            for i in range(n_alt):
+                with cols[i]:
+                    alternatif.append(st.text_input(f"A{i+1}", value=awal['alternatif'][i] if awal else f"Alternatif {i+1}",
+                                                    key=f"alt_ahp_{i}_{v}"))
+            
+            # STEP 1: Perbandingan Berpasangan Kriteria
+            st.subheader("Step 1: Matriks Perbandingan Berpasangan Kriteria")
+            st.markdown("**Skala Saaty:** 1=Sama penting, 3=Sedikit lebih penting, 5=Lebih penting, 7=Sangat penting, 9=Mutlak lebih penting")
+            
+            matrix_kriteria = [[1.0 for _ in range(n_krit)] for _ in range(n_krit)]
+            matrix_grup = None
+            if mode_kelompok:
+                matrix_grup = input_penilaian_kelompok("kriteria", "Kriteria", n_krit, metode_agregasi, buang_tidak_konsisten)
+            
+            if matrix_grup is not None:
+                matrix_kriteria = matrix_grup.tolist()
+            else:
+                for i in range(n_krit):
+                    for j in range(i + 1, n_krit):
+                        val = st.number_input(
+                            f"{kriteria[i]} vs {kriteria[j]}", 
+                            min_value=0.0,
+                            value=float(awal['ahp_kriteria'][i, j]) if awal else 1.0, 
+                            step=0.1,
+                            key=f"ahp_krit_{i}_{j}_{v}",
+                            help=f"Seberapa penting {kriteria[i]} dibanding {kriteria[j]}?"
+                        )
+                        matrix_kriteria[i][j] = float(val) if val > 0 else 1.0
+                        matrix_kriteria[j][i] = 1.0 / val if val > 0 else 1.0
+            
+            df_matrix_kriteria = pd.DataFrame(matrix_kriteria, columns=kriteria, index=kriteria)
+            st.write("**Matriks Perbandingan Kriteria:**")
+            st.dataframe(df_matrix_kriteria.round(4))
+            
+            # STEP 2: Perbandingan Berpasangan Alternatif untuk Setiap Kriteria
+            st.subheader("Step 2: Matriks Perbandingan Berpasangan Alternatif (per Kriteria)")
+            
+            matrices_alternatif = []
+            for k in range(n_krit):
+                with st.expander(f"🔍 Perbandingan Alternatif untuk {kriteria[k]}"):
+                    matrix_alt = [[1.0 for _ in range(n_alt)] for _ in range(n_alt)]
+                    matrix_grup = None
+                    if mode_kelompok:
+                        matrix_grup = input_penilaian_kelompok(f"alt_{k}", kriteria[k], n_alt, metode_agregasi, buang_tidak_konsisten)
+                    
+                    if matrix_grup is not None:
+                        matrix_alt = matrix_grup.tolist()
+                    else:
+                        for i in range(n_alt):
+                            for j in range(i + 1, n_alt):
+                                val = st.number_input(
+                                    f"{alternatif[i]} vs {alternatif[j]}", 
+                                    min_value=0.0,
+                                    value=float(awal['ahp_alternatif'][k, i, j]) if awal else 1.0, 
+                                    step=0.1,
+                                    key=f"ahp_alt_{k}_{i}_{j}_{v}",
+                                    help=f"Untuk {kriteria[k]}, seberapa baik {alternatif[i]} dibanding {alternatif[j]}?"
+                                )
+                                matrix_alt[i][j] = float(val) if val > 0 else 1.0
+                                matrix_alt[j][i] = 1.0 / val if val > 0 else 1.0
+                    
+                    df_matrix_alt = pd.DataFrame(matrix_alt, columns=alternatif, index=alternatif)
+                    st.write(f"**Matriks Perbandingan Alternatif untuk {kriteria[k]}:**")
+                    st.dataframe(df_matrix_alt.round(4))
+                    
+                    matrices_alternatif.append(matrix_alt)
+            
+            st.form_submit_button("Terapkan Perubahan")
+        
+        tampilkan_pustaka_skenario("ahp", "ahp", simpan_skenario_ahp, muat_skenario_ahp,
+                                   ("ahp", alternatif, kriteria, matrix_kriteria, matrices_alternatif))
+        
+        top_k_tampil = st.number_input("Tampilkan Top-k (0 = semua)", min_value=0, value=0, key="topk_ahp")
+        if st.button("Hitung AHP", type="primary"):
+            st.session_state["hitung_ahp"] = True
+        if st.session_state.get("hitung_ahp"):
+            st.subheader("Hasil Perhitungan AHP")
+            
+            # Hitung bobot kriteria
+            st.write("### 1. Bobot Kriteria")
+            matrix_krit_norm, bobot_kriteria, lambda_max_krit, ci_krit, cr_krit = hitung_tercache("AHP", hitung_ahp_np, matrix_kriteria)
+            
+            st.write("**Matriks Ternormalisasi Kriteria:**")
+            st.dataframe(pd.DataFrame(matrix_krit_norm, columns=kriteria, index=kriteria).round(4))
+            
+            df_bobot_krit = pd.DataFrame({
+                'Kriteria': kriteria,
+                'Bobot': bobot_kriteria,
+                'Bobot (%)': bobot_kriteria * 100
+            })
+            st.dataframe(df_bobot_krit.round(4))
+            
+            st.write(f"**λ max:** {lambda_max_krit:.4f}, **CI:** {ci_krit:.4f}, **CR:** {cr_krit:.4f}")
+            if cr_krit <= 0.1:
+                st.success("✅ Matriks kriteria konsisten (CR ≤ 0.1)")
+            else:
+                st.error("❌ Matriks kriteria tidak konsisten (CR > 0.1)")
+            
+            # Prioritas alternatif untuk semua kriteria sekaligus (tumpukan k x n x n)
+            st.write("### 2. Prioritas Alternatif per Kriteria")
+            prioritas_alternatif, lambda_max_alt, ci_alt, cr_alt = hitung_tercache(
+                "AHP_BATCH", hitung_ahp_batch, np.array(matrices_alternatif))
+            
+            st.dataframe(pd.DataFrame({
+                'Kriteria': kriteria,
+                'λ max': lambda_max_alt,
+                'CI': ci_alt,
+                'CR': cr_alt,
+                'Konsisten': np.where(cr_alt <= 0.1, "✅", "❌"),
+            }).round(4))
+            
+            for k in range(n_krit):
+                with st.expander(f"Detail {kriteria[k]}"):
+                    matrix_alt = np.asarray(matrices_alternatif[k])
+                    st.write("**Matriks Ternormalisasi:**")
+                    st.dataframe(pd.DataFrame(matrix_alt / matrix_alt.sum(axis=0), columns=alternatif, index=alternatif).round(4))
+                    
+                    df_prioritas = pd.DataFrame({
+                        'Alternatif': alternatif,
+                        'Prioritas': prioritas_alternatif[k]
+                    })
+                    st.dataframe(df_prioritas.round(4))
+            
+            tampilkan_skor_ahp(kriteria, alternatif, prioritas_alternatif, bobot_kriteria, top_k_tampil)
@@ -0,0 +1,78 @@
+"""Halaman konsensus semua metode."""
+
+import streamlit as st
+import pandas as pd
+
+from spk.konsensus import BATAS_COPELAND, jalankan_konsensus
+from spk.cache import hitung_tercache
+from halaman.umum import (
+    input_matriks_keputusan, muat_skenario_matriks, simpan_skenario_matriks, tabel_peringkat,
+    tampilkan_pustaka_skenario, tampilkan_tabel,
+)
+
+def tampilkan():
+    """Halaman konsensus: keempat metode pada satu matriks, peringkat gabungan dan korelasinya"""
+    st.header("Konsensus Semua Metode")
+    st.write("SAW, WP, TOPSIS dan AHP dijalankan bersamaan pada matriks keputusan yang sama. "
+             "AHP memakai perbandingan berpasangan dari rasio nilai tiap kriteria dan rasio bobot.")
+    
+    alternatif, kriteria, bobot, tipe, data = input_matriks_keputusan("konsensus", min_nilai=0.0)
+    tampilkan_pustaka_skenario("konsensus", "matriks", simpan_skenario_matriks, muat_skenario_matriks,
+                               ("konsensus", "KONSENSUS", alternatif, kriteria, bobot, tipe, data))
+    
+    if abs(sum(bobot) - 1.0) > 0.01:
+        st.warning(f"⚠️ Total bobot = {sum(bobot):.2f}. Sebaiknya total bobot = 1.0")
+    
+    top_k_tampil = st.number_input("Tampilkan Top-k (0 = semua)", min_value=0, value=0, key="topk_konsensus")
+    if st.button("Hitung Konsensus", type="primary"):
+        st.session_state["hitung_konsensus"] = True
+    if st.session_state.get("hitung_konsensus"):
+        # Cache hanya menyimpan peringkat dan skor; waktu berasal dari hitungan di rerun ini saja
+        terukur = {}
+        
+        def hitung_konsensus(data, bobot, tipe):
+            hasil = jalankan_konsensus(data, bobot, tipe)
+            terukur['waktu'], terukur['waktu_total'] = hasil.pop('waktu'), hasil.pop('waktu_total')
+            return hasil
+        
+        hasil_konsensus = hitung_tercache("KONSENSUS", hitung_konsensus, data, bobot, tipe)
+        berhasil = hasil_konsensus['metode']
+        
+        for nama_metode, pesan in hasil_konsensus['error'].items():
+            st.warning(f"⚠️ {nama_metode} tidak dapat dihitung: {pesan}")
+        if not berhasil:
+            st.error("❌ Tidak ada metode yang berhasil dihitung")
+            st.stop()
+        
+        # Waktu paralel dibandingkan dengan metode paling lambat dan jumlah semua metode
+        if terukur:
+            waktu = terukur['waktu']
+            col1, col2, col3 = st.columns(3)
+            col1.metric("Waktu total (paralel)", f"{terukur['waktu_total'] * 1000:.1f} ms")
+            col2.metric(f"Metode paling lambat ({max(waktu, key=waktu.get)})", f"{max(waktu.values()) * 1000:.1f} ms")
+            col3.metric("Jumlah waktu semua metode", f"{sum(waktu.values()) * 1000:.1f} ms")
+        else:
+            st.caption("⚡ Hasil diambil dari cache; waktu hanya ditampilkan saat perhitungan benar-benar dijalankan "
+                       "(kosongkan cache untuk mengukur ulang).")
+        
+        st.subheader("Peringkat per Metode")
+        kolom = {f'Peringkat {m}': hasil_konsensus['peringkat'][m] for m in berhasil}
+        kolom['Poin Borda'] = hasil_konsensus['borda']
+        if hasil_konsensus['copeland'] is not None:
+            kolom['Skor Copeland'] = hasil_konsensus['copeland']
+        hasil = tabel_peringkat(alternatif, kolom, 'Poin Borda', top_k_tampil)
+        tampilkan_tabel(hasil)
+        if hasil_konsensus['copeland'] is None:
+            st.info(f"Copeland tidak dihitung untuk lebih dari {BATAS_COPELAND:,} alternatif (perbandingan semua pasangan)")
+        st.success(f"Alternatif terbaik menurut Borda: **{hasil.iloc[0]['Alternatif']}** "
+                   f"dengan {hasil.iloc[0]['Poin Borda']:.1f} poin")
+        
+        if len(berhasil) > 1:
+            st.subheader("Korelasi Peringkat Antar Metode")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.write("**Spearman:**")
+                st.dataframe(pd.DataFrame(hasil_konsensus['spearman'], index=berhasil, columns=berhasil).round(4))
+            with col2:
+                st.write("**Kendall tau-b:**")
+                st.dataframe(pd.DataFrame(hasil_konsensus['kendall'], index=berhasil, columns=berhasil).round(4))
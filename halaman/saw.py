@@ -0,0 +1,85 @@
+"""Halaman SAW (Simple Additive Weighting)."""
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+from spk.engine import hitung_saw_np
+from spk.cache import hitung_tercache
+from halaman.umum import (
+    input_matriks_keputusan, muat_skenario_matriks, simpan_skenario_matriks, tabel_peringkat,
+    tampilkan_bandingkan_skenario, tampilkan_bobot_langsung, tampilkan_penjelasan, tampilkan_pustaka_skenario,
+    tampilkan_sensitivitas, tampilkan_tabel, tampilkan_top_k_cepat,
+)
+
+def tampilkan():
+    """Halaman SAW: input matriks, normalisasi X → R dan nilai preferensi V"""
+    st.header("📈 Simple Additive Weighting (SAW)")
+    
+    alternatif, kriteria, bobot, tipe, data = input_matriks_keputusan("saw", min_nilai=0.0)
+    tampilkan_pustaka_skenario("saw", "matriks", simpan_skenario_matriks, muat_skenario_matriks,
+                               ("saw", "SAW", alternatif, kriteria, bobot, tipe, data))
+    n_alt, n_krit = data.shape
+    
+    # Validasi bobot
+    if abs(sum(bobot) - 1.0) > 0.01:
+        st.warning(f"⚠️Total bobot = {sum(bobot):.2f}. Sebaiknya total bobot = 1.0")
+    
+    df = pd.DataFrame(data, columns=kriteria, index=alternatif)
+    
+    tampilkan_bandingkan_skenario("SAW", data, alternatif, kriteria, bobot, tipe)
+    tampilkan_sensitivitas("SAW", data, alternatif, kriteria, bobot, tipe)
+    tampilkan_top_k_cepat("SAW", data, alternatif, bobot, tipe)
+    tampilkan_bobot_langsung("SAW", data, alternatif, kriteria, bobot, tipe)
+    
+    top_k_tampil = st.number_input("Tampilkan Top-k (0 = semua)", min_value=0, value=0, key="topk_saw")
+    # Hasil tetap tampil setelah tombol diklik agar penjelasan bisa dibuka per halaman
+    if st.button("Hitung SAW", type="primary"):
+        st.session_state["hitung_saw"] = True
+    if st.session_state.get("hitung_saw"):
+        # Tampilkan data asli dulu
+        st.write("**Matriks X (Data Awal):**")
+        tampilkan_tabel(df)
+        
+        # STEP 1: Normalisasi matriks X ke matriks R
+        st.subheader("Step 1: Normalisasi Matriks (X → R)")
+        st.latex(r"r_{ij} = \begin{cases} \frac{x_{ij}}{\max(x_{ij})} & \text{jika j adalah atribut benefit} \\ \frac{\min(x_{ij})}{x_{ij}} & \text{jika j adalah atribut cost} \end{cases}")
+        
+        # Ringkasan pembagi per kriteria; rincian r_ij hanya dibentuk saat diminta
+        benefit = np.array([t == "Benefit" for t in tipe])
+        pembagi = np.where(benefit, data.max(axis=0), data.min(axis=0))
+        st.write(pd.DataFrame({
+            'Kriteria': kriteria,
+            'Tipe': tipe,
+            'max / min': pembagi,
+        }))
+        
+        def baris_normalisasi(i, j):
+            if benefit[j]:
+                return f"r{i+1}{j+1} = {data[i][j]}/{pembagi[j]} = {data[i][j]/pembagi[j]:.4f}"
+            return f"r{i+1}{j+1} = {pembagi[j]}/{data[i][j]} = {pembagi[j]/data[i][j] if data[i][j] > 0 else 0:.4f}"
+        
+        tampilkan_penjelasan("saw_r", "Rincian normalisasi per sel", alternatif, baris_normalisasi, kriteria)
+        
+        matriks_r, nilai_v = hitung_tercache("SAW", hitung_saw_np, data, bobot, tipe)
+        
+        df_r = pd.DataFrame(matriks_r, columns=kriteria, index=alternatif)
+        st.write("**Matriks R (Hasil Normalisasi):**")
+        tampilkan_tabel(df_r.round(4))
+        
+        # STEP 2: Perhitungan nilai V
+        st.subheader("Step 2: Perhitungan Nilai Preferensi (V)")
+        st.latex(r"V_i = \sum_{j=1}^{n} w_j \times r_{ij}")
+        
+        def baris_v(i):
+            perhitungan = " + ".join([f"({bobot[j]:.2f} × {matriks_r[i][j]:.4f})" for j in range(n_krit)])
+            return f"V({alternatif[i]}) = {perhitungan} = **{nilai_v[i]:.4f}**"
+        
+        tampilkan_penjelasan("saw_v", "Detail Perhitungan V", alternatif, baris_v)
+        
+        # Hasil akhir
+        st.subheader("Hasil Akhir SAW")
+        hasil = tabel_peringkat(alternatif, {'Nilai V': nilai_v}, 'Nilai V', top_k_tampil)
+        
+        tampilkan_tabel(hasil)
+        st.success(f"Alternatif terbaik: **{hasil.iloc[0]['Alternatif']}** dengan nilai V = {hasil.iloc[0]['Nilai V']:.4f}")
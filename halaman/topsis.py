@@ -0,0 +1,59 @@
+"""Halaman TOPSIS."""
+
+import streamlit as st
+import pandas as pd
+
+from spk.engine import METRIK_JARAK, hitung_topsis_np
+from spk.cache import hitung_tercache
+from halaman.umum import (
+    input_matriks_keputusan, muat_skenario_matriks, simpan_skenario_matriks, tabel_peringkat,
+    tampilkan_bandingkan_skenario, tampilkan_bobot_langsung, tampilkan_pustaka_skenario, tampilkan_sensitivitas,
+    tampilkan_tabel, tampilkan_top_k_cepat,
+)
+
+def tampilkan():
+    """Halaman TOPSIS: matriks ternormalisasi, solusi ideal dan nilai preferensi"""
+    st.header("Technique for Order Preference by Similarity to Ideal Solution (TOPSIS)")
+    
+    alternatif, kriteria, bobot, tipe, data = input_matriks_keputusan("topsis", min_nilai=0.0)
+    metrik = st.selectbox("Metrik jarak ke solusi ideal", METRIK_JARAK, key="metrik_topsis",
+                          format_func=str.capitalize)
+    tampilkan_pustaka_skenario("topsis", "matriks", simpan_skenario_matriks, muat_skenario_matriks,
+                               ("topsis", "TOPSIS", alternatif, kriteria, bobot, tipe, data, metrik))
+    n_alt, n_krit = data.shape
+    
+    if abs(sum(bobot) - 1.0) > 0.01:
+        st.warning(f"⚠️ Total bobot = {sum(bobot):.2f}. Sebaiknya total bobot = 1.0")
+    
+    df = pd.DataFrame(data, columns=kriteria, index=alternatif)
+    
+    tampilkan_bandingkan_skenario("TOPSIS", data, alternatif, kriteria, bobot, tipe, metrik)
+    tampilkan_sensitivitas("TOPSIS", data, alternatif, kriteria, bobot, tipe, metrik)
+    tampilkan_top_k_cepat("TOPSIS", data, alternatif, bobot, tipe, metrik)
+    tampilkan_bobot_langsung("TOPSIS", data, alternatif, kriteria, bobot, tipe, metrik)
+    
+    top_k_tampil = st.number_input("Tampilkan Top-k (0 = semua)", min_value=0, value=0, key="topk_topsis")
+    if st.button("Hitung TOPSIS", type="primary"):
+        st.session_state["hitung_topsis"] = True
+    if st.session_state.get("hitung_topsis"):
+        # Hitung manual
+        data_norm, data_weighted, ideal_pos, ideal_neg, d_pos, d_neg, preferensi = hitung_tercache("TOPSIS", hitung_topsis_np, data, bobot, tipe, metrik)
+        
+        st.write("**Matriks Ternormalisasi:**")
+        tampilkan_tabel(pd.DataFrame(data_norm, columns=kriteria, index=alternatif).round(4))
+        
+        st.write("**Matriks Ternormalisasi Terbobot:**")
+        tampilkan_tabel(pd.DataFrame(data_weighted, columns=kriteria, index=alternatif).round(4))
+        
+        st.write("**Solusi Ideal:**")
+        st.write(pd.DataFrame({
+            'Kriteria': kriteria,
+            'Ideal Positif (A+)': ideal_pos,
+            'Ideal Negatif (A-)': ideal_neg
+        }))
+        
+        hasil = tabel_peringkat(alternatif, {'D+': d_pos, 'D-': d_neg, 'Preferensi': preferensi}, 'Preferensi', top_k_tampil)
+        
+        st.write("**Hasil Perhitungan TOPSIS:**")
+        tampilkan_tabel(hasil)
+        st.success(f"Alternatif terbaik: **{hasil.iloc[0]['Alternatif']}** dengan nilai preferensi {hasil.iloc[0]['Preferensi']:.4f}")
@@ -0,0 +1,480 @@
+"""Komponen tampilan bersama halaman SAW, WP, TOPSIS dan Konsensus.
+
+Input matriks keputusan, pustaka skenario, perbandingan skenario bobot,
+analisis sensitivitas, top-k cepat, slider bobot langsung dan penjelasan
+langkah per sel.
+"""
+
+import os
+import time
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+from spk.engine import (
+    hitung_skor_batch, peringkat, prakomputasi_saw, prakomputasi_topsis, skor_saw_bobot, skor_topsis_bobot,
+)
+from spk.topk import top_k, peringkat_top_k
+from spk.cache import hitung_tercache, kunci_hash
+from spk.skenario import DIREKTORI as DIREKTORI_SKENARIO, daftar_skenario, hapus_skenario, muat_skenario, simpan_skenario
+from spk import profil
+
+# ==================== INPUT MATRIKS KEPUTUSAN ====================
+
+# Di atas batas ini matriks hanya ditampilkan sebagian (tidak lewat data editor)
+BATAS_EDITOR = 2000
+BATAS_TAMPIL = 1000
+
+@profil.diukur("render tabel")
+def tampilkan_tabel(df):
+    """st.dataframe yang hanya mengirim BATAS_TAMPIL baris pertama untuk tabel besar"""
+    if len(df) > BATAS_TAMPIL:
+        st.caption(f"Menampilkan {BATAS_TAMPIL:,} dari {len(df):,} baris")
+        df = df.head(BATAS_TAMPIL)
+    st.dataframe(df)
+
+def baca_file_matriks(file):
+    """Baca matriks keputusan dari CSV/Excel/Parquet
+
+    Kolom pertama dipakai sebagai nama alternatif jika bukan angka, kolom
+    lainnya adalah kriteria.
+    """
+    nama = file.name.lower()
+    if nama.endswith(".csv"):
+        df = pd.read_csv(file)
+    elif nama.endswith((".xlsx", ".xls")):
+        df = pd.read_excel(file)
+    else:
+        df = pd.read_parquet(file)
+    if df.shape[1] > 1 and not pd.api.types.is_numeric_dtype(df.iloc[:, 0]):
+        alternatif = df.iloc[:, 0].astype(str).tolist()
+        df = df.iloc[:, 1:]
+    else:
+        alternatif = [f"Alternatif {i+1}" for i in range(len(df))]
+    return alternatif, [str(c) for c in df.columns], df.to_numpy(dtype=float)
+
+@profil.diukur("input matriks")
+def input_matriks_keputusan(kode, min_nilai=0.0):
+    """Input kriteria (nama, bobot, tipe) dan matriks keputusan lewat tabel atau unggah file
+
+    Matriks disimpan sebagai satu ndarray di st.session_state[f"matriks_{kode}"].
+    Mengembalikan (alternatif, kriteria, bobot, tipe, data).
+    """
+    state = st.session_state
+    file = st.file_uploader("Unggah matriks keputusan (CSV, Excel, Parquet)", type=["csv", "xlsx", "xls", "parquet"],
+                            key=f"file_{kode}", help="Kolom pertama berisi nama alternatif (opsional), kolom lain = kriteria")
+    skenario = state.get(f"skenario_{kode}")
+    if skenario is not None and (file is None or state.get(f"file_id_{kode}") == file.file_id):
+        # Matriks dari skenario tersimpan (memmap); dilepas lewat tombol atau dengan mengunggah file baru
+        n_alt, n_krit = state[f"matriks_{kode}"].shape
+        col1, col2 = st.columns([3, 1])
+        col1.caption(f"{n_alt:,} alternatif × {n_krit} kriteria dari skenario {skenario['nama']}")
+        col2.button("Lepas skenario", key=f"lepas_skenario_{kode}", on_click=lepas_skenario_matriks, args=(kode,))
+    elif file is not None:
+        if state.get(f"file_id_{kode}") != file.file_id:
+            try:
+                alternatif_file, kriteria_file, data_file = baca_file_matriks(file)
+            except ImportError:
+                st.error("❌ Membaca file Excel membutuhkan paket openpyxl (pip install openpyxl)")
+                st.stop()
+            except ValueError as e:
+                st.error(f"❌ File tidak valid: semua kolom kriteria harus berupa angka ({e})")
+                st.stop()
+            state[f"file_id_{kode}"] = file.file_id
+            state[f"alternatif_{kode}"] = alternatif_file
+            state[f"kriteria_{kode}"] = kriteria_file
+            state[f"matriks_{kode}"] = data_file
+            for k in ("skenario", "bobot", "tipe"):
+                state.pop(f"{k}_{kode}", None)
+            skenario = None
+            state[f"versi_{kode}"] = state.get(f"versi_{kode}", 0) + 1
+        n_alt, n_krit = state[f"matriks_{kode}"].shape
+        st.caption(f"{n_alt:,} alternatif × {n_krit} kriteria dari {file.name}")
+    else:
+        if state.get(f"file_id_{kode}") is not None:
+            # File dilepas: kembali ke input manual
+            state[f"file_id_{kode}"] = None
+            state.pop(f"matriks_{kode}", None)
+        col1, col2 = st.columns(2)
+        with col1:
+            n_alt = st.number_input("Jumlah Alternatif", min_value=2, value=3, key=f"n_alt_{kode}")
+        with col2:
+            n_krit = st.number_input("Jumlah Kriteria", min_value=2, value=4, key=f"n_krit_{kode}")
+        lama = state.get(f"matriks_{kode}")
+        if lama is None or lama.shape != (n_alt, n_krit):
+            # Ukuran berubah: pertahankan nilai lama, sel baru diisi 1.0
+            data_baru = np.ones((n_alt, n_krit))
+            alternatif_baru = [f"Alternatif {i+1}" for i in range(n_alt)]
+            if lama is not None:
+                a, b = min(n_alt, lama.shape[0]), min(n_krit, lama.shape[1])
+                data_baru[:a, :b] = lama[:a, :b]
+                alternatif_baru[:a] = state[f"alternatif_{kode}"][:a]
+            state[f"matriks_{kode}"] = data_baru
+            state[f"alternatif_{kode}"] = alternatif_baru
+            state[f"kriteria_{kode}"] = [f"Kriteria {j+1}" for j in range(n_krit)]
+            state[f"versi_{kode}"] = state.get(f"versi_{kode}", 0) + 1
+    versi = state[f"versi_{kode}"]
+
+    # Perubahan tabel baru dikirim saat Terapkan diklik, bukan setiap kali satu sel diedit
+    with st.form(f"form_matriks_{kode}", border=False):
+        # Kriteria, bobot dan tipe dalam satu tabel
+        st.subheader("Kriteria dan Bobot")
+        df_kriteria = st.data_editor(
+            pd.DataFrame({
+                'Kriteria': state[f"kriteria_{kode}"],
+                'Bobot': state.get(f"bobot_{kode}") or [round(1.0 / n_krit, 4)] * n_krit,
+                'Tipe': state.get(f"tipe_{kode}") or ["Benefit"] * n_krit,
+            }),
+            key=f"editor_kriteria_{kode}_{versi}", hide_index=True, use_container_width=True,
+            column_config={
+                'Kriteria': st.column_config.TextColumn(required=True),
+                'Bobot': st.column_config.NumberColumn(min_value=0.0, max_value=1.0, step=0.05, format="%.4f", required=True),
+                'Tipe': st.column_config.SelectboxColumn(options=["Benefit", "Cost"], required=True),
+            },
+        )
+        kriteria = df_kriteria['Kriteria'].astype(str).tolist()
+        bobot = df_kriteria['Bobot'].fillna(0.0).astype(float).tolist()
+        tipe = df_kriteria['Tipe'].fillna("Benefit").tolist()
+
+        st.subheader("Matriks Keputusan")
+        data = state[f"matriks_{kode}"]
+        alternatif = state[f"alternatif_{kode}"]
+        if n_alt <= BATAS_EDITOR:
+            kolom = [f"C{j+1}" for j in range(n_krit)]
+            # Id widget data_editor dihitung dari isi data dan column_config, jadi data awal dan
+            # label kolom dibekukan per versi; hasil edit tidak dikirim balik sebagai data editor
+            awal = state.get(f"awal_matriks_{kode}")
+            if awal is None or awal[0] != versi:
+                df_awal = pd.DataFrame(data, columns=kolom)
+                df_awal.insert(0, 'Alternatif', alternatif)
+                awal = state[f"awal_matriks_{kode}"] = (versi, df_awal, list(state[f"kriteria_{kode}"]))
+            _, df_awal, label_kolom = awal
+            df_edit = st.data_editor(
+                df_awal, key=f"editor_matriks_{kode}_{versi}", hide_index=True, use_container_width=True,
+                column_config={
+                    'Alternatif': st.column_config.TextColumn(required=True),
+                    **{c: st.column_config.NumberColumn(label_kolom[j], min_value=min_nilai, required=True)
+                       for j, c in enumerate(kolom)},
+                },
+            )
+            data = df_edit[kolom].to_numpy(dtype=float)
+            alternatif = df_edit['Alternatif'].astype(str).tolist()
+            state[f"matriks_{kode}"] = data
+            state[f"alternatif_{kode}"] = alternatif
+        else:
+            st.caption("Matriks terlalu besar untuk diedit di tabel; ubah file lalu unggah ulang.")
+            tampilkan_tabel(pd.DataFrame(data, columns=kriteria, index=alternatif))
+        st.form_submit_button("Terapkan Perubahan")
+
+    if skenario is not None and n_alt > BATAS_EDITOR:
+        # Ringkasan dari meta skenario agar validasi tidak membaca seluruh file memmap
+        ada_nan, nilai_min = skenario['ada_nan'], skenario['min']
+    else:
+        ada_nan, nilai_min = np.isnan(data).any(), data.min()
+    if ada_nan:
+        st.error("❌ Matriks keputusan tidak boleh memiliki sel kosong")
+        st.stop()
+    if nilai_min < min_nilai:
+        st.error(f"❌ Semua nilai matriks keputusan harus ≥ {min_nilai}")
+        st.stop()
+    return alternatif, kriteria, bobot, tipe, data
+
+# ==================== SKENARIO TERSIMPAN ====================
+
+def _aksi_skenario(kode, aksi, *args):
+    """Callback tombol skenario; pesannya ditampilkan di expander pada rerun berikutnya"""
+    try:
+        pesan = ("success", aksi(*args))
+    except (OSError, ValueError, KeyError) as e:
+        pesan = ("error", f"❌ {e}")
+    st.session_state[f"pesan_skenario_{kode}"] = pesan
+
+def simpan_skenario_matriks(kode, metode_cache, alternatif, kriteria, bobot, tipe, data, *tambahan):
+    state = st.session_state
+    meta = simpan_skenario(state.get(f"nama_skenario_{kode}", ""), "matriks", kriteria, alternatif,
+                           matriks=data, bobot=bobot, tipe=tipe, metode=metode_cache,
+                           kunci_cache=[(metode_cache, kunci_hash(metode_cache, data, bobot, tipe, *tambahan))],
+                           timpa=state.get(f"timpa_skenario_{kode}", False))
+    return f"✅ Skenario {meta['nama']} disimpan ({meta['ukuran_byte'] / 2**20:.1f} MB, {len(meta['hasil'])} hasil)"
+
+def muat_skenario_matriks(kode, nama):
+    """Isi input matriks dari skenario; matriks tetap memmap sampai diedit"""
+    sk = muat_skenario(nama)
+    state = st.session_state
+    state[f"skenario_{kode}"] = {k: sk[k] for k in ("nama", "min", "ada_nan")}
+    state[f"matriks_{kode}"] = sk['data']['matriks']
+    state[f"alternatif_{kode}"] = sk['data']['alternatif'].tolist()
+    state[f"kriteria_{kode}"] = sk['kriteria']
+    state[f"bobot_{kode}"] = sk['bobot']
+    state[f"tipe_{kode}"] = sk['tipe']
+    state[f"versi_{kode}"] = state.get(f"versi_{kode}", 0) + 1
+    n_alt, n_krit = sk['data']['matriks'].shape
+    return f"✅ Skenario {sk['nama']} dimuat ({n_alt:,} × {n_krit}, {len(sk['hasil'])} hasil masuk cache)"
+
+def lepas_skenario_matriks(kode):
+    """Kembali ke input manual (atau file yang masih terunggah)"""
+    for k in ("skenario", "bobot", "tipe", "matriks", "file_id"):
+        st.session_state.pop(f"{k}_{kode}", None)
+
+@profil.diukur("pustaka skenario")
+def tampilkan_pustaka_skenario(kode, jenis, simpan, muat, args_simpan):
+    """Expander sidebar untuk menyimpan input saat ini dan memuat/menghapus skenario tersimpan
+
+    Daftar hanya membaca meta.json tiap skenario; array baru dibuka (memmap) saat dimuat.
+    """
+    state = st.session_state
+    with st.sidebar.expander("💾 Pustaka Skenario"):
+        pesan = state.pop(f"pesan_skenario_{kode}", None)
+        if pesan is not None:
+            getattr(st, pesan[0])(pesan[1])
+        st.text_input("Nama skenario", key=f"nama_skenario_{kode}")
+        st.checkbox("Timpa jika sudah ada", key=f"timpa_skenario_{kode}")
+        st.button("Simpan", key=f"simpan_skenario_{kode}", on_click=_aksi_skenario, args=(kode, simpan, *args_simpan),
+                  help="Menyimpan input saat ini beserta hasil yang sudah dihitung (jika ada di cache)")
+        daftar = daftar_skenario(jenis=jenis)
+        if not daftar:
+            st.caption(f"Belum ada skenario tersimpan di {DIREKTORI_SKENARIO}/")
+            return
+        st.dataframe(pd.DataFrame({
+            'Nama': [m['nama'] for m in daftar],
+            'Ukuran': [f"{m['n_alternatif']:,} × {len(m['kriteria'])}" for m in daftar],
+            'Hasil': [", ".join(h['metode'] for h in m['hasil']) or "-" for m in daftar],
+            'MB': [round(m['ukuran_byte'] / 2**20, 1) for m in daftar],
+            'Disimpan': pd.to_datetime([m['dibuat'] for m in daftar], unit='s').strftime("%Y-%m-%d %H:%M"),
+        }), hide_index=True)
+        nama = st.selectbox("Skenario", [m['nama'] for m in daftar], key=f"pilih_skenario_{kode}")
+        col1, col2 = st.columns(2)
+        col1.button("Muat", key=f"muat_skenario_{kode}", on_click=_aksi_skenario, args=(kode, muat, kode, nama))
+        col2.button("Hapus", key=f"hapus_skenario_{kode}", on_click=_aksi_skenario,
+                    args=(kode, lambda n: hapus_skenario(n) or f"🗑️ Skenario {n} dihapus", nama))
+
+# ==================== BANDINGKAN SKENARIO BOBOT ====================
+
+@profil.diukur("bandingkan skenario")
+def tampilkan_bandingkan_skenario(kode, data, alternatif, kriteria, bobot, tipe, metrik="euclidean"):
+    """Bandingkan hasil beberapa skenario bobot (mis. satu per stakeholder) sekaligus"""
+    with st.expander("🔀 Bandingkan Skenario Bobot"):
+        st.write("Setiap baris adalah satu skenario bobot. Normalisasi dihitung sekali untuk semua skenario.")
+        file_bobot = st.file_uploader("Unggah skenario bobot (CSV, kolom = kriteria)", type=["csv"], key=f"file_skenario_{kode}")
+        if file_bobot is not None:
+            df_skenario = pd.read_csv(file_bobot)
+            if df_skenario.shape[1] != len(kriteria):
+                st.error(f"File harus memiliki {len(kriteria)} kolom bobot, ditemukan {df_skenario.shape[1]}")
+                return
+            df_skenario.columns = kriteria
+        else:
+            n_skenario = st.number_input("Jumlah Skenario", min_value=2, max_value=50, value=3, key=f"n_skenario_{kode}")
+            df_awal = pd.DataFrame([bobot] * n_skenario, columns=kriteria,
+                                   index=[f"Skenario {s+1}" for s in range(n_skenario)])
+            df_skenario = st.data_editor(df_awal, key=f"editor_skenario_{kode}_{n_skenario}")
+
+        if st.button("Bandingkan Skenario", key=f"btn_skenario_{kode}"):
+            try:
+                skor = hitung_skor_batch(kode, data, df_skenario.to_numpy(dtype=float), tipe, metrik)
+            except ValueError as e:
+                st.error(f"❌ {e}")
+                return
+            nama_skenario = [str(s) for s in df_skenario.index]
+
+            st.write("**Skor per Skenario:**")
+            st.dataframe(pd.DataFrame(skor, columns=alternatif, index=nama_skenario).round(4))
+
+            st.write("**Ranking per Skenario:**")
+            st.dataframe(pd.DataFrame(peringkat(skor), columns=alternatif, index=nama_skenario))
+
+            terbaik = np.bincount(skor.argmax(axis=1), minlength=len(alternatif))
+            st.write("**Jumlah Skenario di Mana Alternatif Menjadi Terbaik:**")
+            st.dataframe(pd.DataFrame({'Alternatif': alternatif, 'Jumlah Terbaik': terbaik})
+                         .sort_values('Jumlah Terbaik', ascending=False).reset_index(drop=True))
+
+# ==================== ANALISIS SENSITIVITAS BOBOT ====================
+
+@profil.diukur("sensitivitas")
+def tampilkan_sensitivitas(kode, data, alternatif, kriteria, bobot, tipe, metrik="euclidean"):
+    """Analisis sensitivitas Monte Carlo dan ambang pembalikan peringkat"""
+    with st.expander("🎲 Analisis Sensitivitas Bobot"):
+        st.write("Bobot diganggu secara acak (distribusi Dirichlet di sekitar bobot yang dimasukkan) "
+                 "untuk melihat seberapa stabil ranking.")
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            n_sampel = st.number_input("Jumlah Sampel", min_value=1000, max_value=10_000_000, value=10_000, step=1000, key=f"sens_n_{kode}")
+        with col2:
+            konsentrasi = st.number_input("Konsentrasi", min_value=1.0, value=100.0, step=10.0, key=f"sens_k_{kode}",
+                                          help="Semakin besar, sampel bobot semakin dekat dengan bobot asli")
+        with col3:
+            n_worker = st.number_input("Jumlah Proses", min_value=1, max_value=os.cpu_count() or 1,
+                                       value=os.cpu_count() or 1, key=f"sens_w_{kode}")
+
+        if st.button("Jalankan Analisis Sensitivitas", key=f"btn_sens_{kode}"):
+            # Diimpor saat dipakai: modul ini menyiapkan process pool dan jarang dibuka
+            from spk.sensitivitas import ambang_pembalikan, monte_carlo
+            if sum(bobot) <= 0:
+                st.error("❌ Total bobot harus > 0")
+                return
+            progres = st.progress(0.0)
+            tempat_hasil = st.empty()
+            ukuran_chunk = max(1000, min(50_000, n_sampel // (4 * n_worker)))
+            try:
+                for hasil in monte_carlo(kode, data, bobot, tipe, n_sampel=n_sampel, konsentrasi=konsentrasi,
+                                         ukuran_chunk=ukuran_chunk, n_worker=n_worker, maks_posisi=20, metrik=metrik):
+                    progres.progress(hasil['chunk_selesai'] / hasil['chunk_total'],
+                                     text=f"{hasil['n_sampel']:,} dari {n_sampel:,} sampel")
+                    tempat_hasil.dataframe(pd.DataFrame({
+                        'Alternatif': alternatif,
+                        'P(Peringkat 1)': hasil['prob_terbaik'],
+                        'Rata-rata Peringkat': hasil['rata_peringkat'],
+                    }).sort_values('P(Peringkat 1)', ascending=False).head(BATAS_TAMPIL).reset_index(drop=True).round(4))
+            except ValueError as e:
+                st.error(f"❌ {e}")
+                return
+
+            st.write("**Distribusi Peringkat (peluang alternatif berada di peringkat ke-r):**")
+            distribusi = hasil['distribusi_peringkat']
+            tampilkan_tabel(pd.DataFrame(distribusi, index=alternatif,
+                                         columns=[f"#{r+1}" for r in range(distribusi.shape[1])]).round(4))
+
+            st.write("**Ambang Bobot Pembalikan Peringkat Teratas:**")
+            st.caption("Bobot satu kriteria digeser (kriteria lain diskalakan proporsional) sampai alternatif terbaik berganti.")
+            ambang = ambang_pembalikan(kode, data, bobot, tipe, metrik=metrik)
+            if ambang:
+                st.dataframe(pd.DataFrame({
+                    'Kriteria': [kriteria[a['kriteria']] for a in ambang],
+                    'Bobot Awal': [a['bobot_awal'] for a in ambang],
+                    'Bobot Ambang': [a['bobot_ambang'] for a in ambang],
+                    'Pertukaran': [f"{alternatif[a['pasangan'][0]]} ↔ {alternatif[a['pasangan'][1]]}" for a in ambang],
+                }).round(4))
+            else:
+                st.success("✅ Alternatif terbaik tidak berubah untuk pergeseran bobot satu kriteria mana pun")
+
+# ==================== TOP-K DAN PREFILTER PARETO ====================
+
+@profil.diukur("peringkat")
+def tabel_peringkat(alternatif, kolom, kolom_skor, k=0):
+    """Tabel ranking; dengan k > 0 hanya k teratas yang dipilih (argpartition) dan dibentuk"""
+    idx = top_k(np.asarray(kolom[kolom_skor], dtype=float), k)
+    hasil = pd.DataFrame({'Alternatif': np.asarray(alternatif, dtype=object)[idx],
+                          **{nama: np.asarray(nilai)[idx] for nama, nilai in kolom.items()}})
+    hasil['Ranking'] = range(1, len(hasil) + 1)
+    return hasil
+
+@profil.diukur("top-k cepat")
+def tampilkan_top_k_cepat(kode, data, alternatif, bobot, tipe, metrik="euclidean"):
+    """Top-k tanpa langkah perhitungan, opsional dengan prefilter dominasi Pareto"""
+    with st.expander("⚡ Top-k Cepat & Prefilter Pareto"):
+        st.write("Hanya skor akhir yang dihitung. Prefilter Pareto membuang alternatif yang didominasi "
+                 "(lebih buruk di semua kriteria) oleh k alternatif lain, karena tidak mungkin masuk k teratas.")
+        col1, col2 = st.columns(2)
+        with col1:
+            k = st.number_input("k", min_value=1, value=min(50, len(alternatif)), key=f"topk_cepat_{kode}")
+        with col2:
+            prefilter = st.checkbox("Prefilter Pareto (skyline)", value=True, key=f"skyline_{kode}")
+
+        if st.button("Hitung Top-k", key=f"btn_topk_{kode}"):
+            try:
+                hasil = peringkat_top_k(kode, data, bobot, tipe, k=k, prefilter=prefilter, bandingkan=True, metrik=metrik)
+            except ValueError as e:
+                st.error(f"❌ {e}")
+                return
+            st.dataframe(pd.DataFrame({
+                'Ranking': range(1, len(hasil['indeks']) + 1),
+                'Alternatif': np.asarray(alternatif, dtype=object)[hasil['indeks']],
+                'Skor': hasil['skor'],
+            }).round(4))
+            if prefilter:
+                st.write(f"**Dipangkas oleh prefilter:** {hasil['n_dipangkas']:,} dari {hasil['n_alt']:,} alternatif")
+            waktu = hasil['waktu']
+            st.write(" · ".join(f"{tahap}: {detik * 1000:.1f} ms" for tahap, detik in waktu.items()))
+            st.write(f"**Waktu hemat dibanding skor semua + sort penuh:** {hasil['waktu_hemat'] * 1000:.1f} ms "
+                     f"(penuh {hasil['waktu_penuh'] * 1000:.1f} ms)")
+
+# ==================== SLIDER BOBOT LANGSUNG ====================
+
+def _reset_slider_bobot(kode, n_krit):
+    for j in range(n_krit):
+        st.session_state.pop(f"slider_{kode}_{j}", None)
+
+@profil.diukur("slider bobot")
+def tampilkan_bobot_langsung(kode, data, alternatif, kriteria, bobot, tipe, metrik="euclidean"):
+    """What-if bobot: ranking diperbarui langsung saat slider digeser"""
+    with st.expander("🎚️ What-if Bobot (Slider Langsung)"):
+        st.write("Normalisasi dihitung sekali dan disimpan di cache; menggeser slider hanya menghitung ulang "
+                 "pembobotan (satu perkalian matriks-vektor) dan k teratas.")
+        if not st.toggle("Aktifkan slider bobot", key=f"live_{kode}"):
+            return
+        if kode == "SAW":
+            prakomputasi = (hitung_tercache("SAW_R", prakomputasi_saw, data, tipe),)
+            skor_awal = skor_saw_bobot(*prakomputasi, bobot)
+        else:
+            prakomputasi = hitung_tercache("TOPSIS_SELISIH", prakomputasi_topsis, data, tipe, metrik)
+            skor_awal = skor_topsis_bobot(*prakomputasi, bobot, metrik)[2]
+        # Diurutkan sekali per rerun penuh; fragment cukup searchsorted untuk k baris
+        negatif_awal_terurut = np.sort(-skor_awal)
+        _peringkat_langsung(kode, prakomputasi, skor_awal, negatif_awal_terurut, alternatif, kriteria, bobot, metrik)
+
+@st.fragment
+@profil.diukur("slider bobot (fragment)")
+def _peringkat_langsung(kode, prakomputasi, skor_awal, negatif_awal_terurut, alternatif, kriteria, bobot, metrik):
+    """Slider dan tabel k teratas; sebagai fragment hanya bagian ini yang dijalankan ulang saat slider digeser"""
+    n_krit = len(kriteria)
+    kolom = st.columns(min(n_krit, 4))
+    w = np.array([kolom[j % len(kolom)].slider(kriteria[j], 0.0, 1.0, float(bobot[j]), 0.01, key=f"slider_{kode}_{j}")
+                  for j in range(n_krit)])
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        k = st.number_input("k teratas", min_value=1, max_value=min(1000, len(alternatif)),
+                            value=min(10, len(alternatif)), key=f"topk_live_{kode}")
+    with col2:
+        st.button("Reset ke bobot tabel", key=f"reset_slider_{kode}", on_click=_reset_slider_bobot, args=(kode, n_krit))
+
+    t0 = time.perf_counter()
+    if kode == "SAW":
+        skor = skor_saw_bobot(*prakomputasi, w)
+    else:
+        skor = skor_topsis_bobot(*prakomputasi, w, metrik)[2]
+    idx = top_k(skor, k)
+    # Ranking dengan bobot tabel: jumlah skor awal yang lebih besar, dicari di array terurut
+    ranking_awal = 1 + np.searchsorted(negatif_awal_terurut, -skor_awal[idx], side="left")
+    waktu = time.perf_counter() - t0
+
+    st.dataframe(pd.DataFrame({
+        'Ranking': range(1, len(idx) + 1),
+        'Alternatif': [alternatif[i] for i in idx],
+        'Skor': skor[idx],
+        'Ranking Bobot Tabel': ranking_awal,
+    }).round(4), hide_index=True)
+    st.caption(f"Total bobot slider = {w.sum():.2f} · peringkat ulang {len(skor):,} alternatif: {waktu * 1000:.1f} ms")
+
+# ==================== PENJELASAN LANGKAH PER SEL ====================
+
+UKURAN_HALAMAN = 20
+
+def pilih_indeks_alternatif(kode, alternatif):
+    """Indeks alternatif yang dijelaskan: satu halaman atau satu alternatif terpilih"""
+    n_alt = len(alternatif)
+    mode = st.radio("Tampilkan", ["Per halaman", "Pilih alternatif"], horizontal=True, key=f"mode_{kode}")
+    if mode == "Pilih alternatif":
+        if n_alt <= BATAS_TAMPIL:
+            return [st.selectbox("Alternatif", range(n_alt), format_func=lambda i: alternatif[i], key=f"alt_{kode}")]
+        return [st.number_input(f"Nomor alternatif (1–{n_alt:,})", min_value=1, max_value=n_alt, value=1, key=f"no_{kode}") - 1]
+    n_halaman = -(-n_alt // UKURAN_HALAMAN)
+    halaman = st.number_input(f"Halaman (1–{n_halaman:,}, {UKURAN_HALAMAN} alternatif per halaman)",
+                              min_value=1, max_value=n_halaman, value=1, key=f"halaman_{kode}")
+    awal = (halaman - 1) * UKURAN_HALAMAN
+    return range(awal, min(awal + UKURAN_HALAMAN, n_alt))
+
+@profil.diukur("render penjelasan")
+def tampilkan_penjelasan(kode, label, alternatif, baris, kriteria=None):
+    """Rincian perhitungan per alternatif yang baru dibentuk saat diminta
+
+    ``baris(i)`` (atau ``baris(i, j)`` jika ``kriteria`` diberikan) mengembalikan
+    teks satu baris penjelasan. Hanya baris pada halaman/alternatif terpilih
+    yang dibentuk dan semuanya dikirim sebagai satu elemen, sehingga waktu
+    render tidak bergantung pada ukuran matriks.
+    """
+    if not st.toggle(label, key=f"detail_{kode}"):
+        return
+    if kriteria is not None:
+        j = st.selectbox("Kriteria", range(len(kriteria)), format_func=lambda j: kriteria[j], key=f"krit_{kode}")
+    indeks = pilih_indeks_alternatif(kode, alternatif)
+    st.markdown("  \n".join(baris(i) if kriteria is None else baris(i, j) for i in indeks))
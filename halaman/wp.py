@@ -0,0 +1,46 @@
+"""Halaman WP (Weighted Product)."""
+
+import streamlit as st
+import pandas as pd
+
+from spk.engine import hitung_wp_np
+from spk.cache import hitung_tercache
+from halaman.umum import (
+    input_matriks_keputusan, muat_skenario_matriks, simpan_skenario_matriks, tabel_peringkat,
+    tampilkan_bandingkan_skenario, tampilkan_pustaka_skenario, tampilkan_sensitivitas, tampilkan_tabel,
+    tampilkan_top_k_cepat,
+)
+
+def tampilkan():
+    """Halaman WP: bobot perbaikan, vektor S dan vektor V"""
+    st.header("Weighted Product (WP)")
+    
+    alternatif, kriteria, bobot, tipe, data = input_matriks_keputusan("wp", min_nilai=0.1)
+    tampilkan_pustaka_skenario("wp", "matriks", simpan_skenario_matriks, muat_skenario_matriks,
+                               ("wp", "WP", alternatif, kriteria, bobot, tipe, data))
+    n_alt, n_krit = data.shape
+    
+    if abs(sum(bobot) - 1.0) > 0.01:
+        st.warning(f"⚠️ Total bobot = {sum(bobot):.2f}. Sebaiknya total bobot = 1.0")
+    
+    df = pd.DataFrame(data, columns=kriteria, index=alternatif)
+    
+    tampilkan_bandingkan_skenario("WP", data, alternatif, kriteria, bobot, tipe)
+    tampilkan_sensitivitas("WP", data, alternatif, kriteria, bobot, tipe)
+    tampilkan_top_k_cepat("WP", data, alternatif, bobot, tipe)
+    
+    top_k_tampil = st.number_input("Tampilkan Top-k (0 = semua)", min_value=0, value=0, key="topk_wp")
+    if st.button("Hitung WP", type="primary"):
+        st.session_state["hitung_wp"] = True
+    if st.session_state.get("hitung_wp"):
+        # Hitung manual
+        w_perbaikan, vektor_s, vektor_v = hitung_tercache("WP", hitung_wp_np, data, bobot, tipe)
+        
+        st.write("**Bobot Perbaikan (Cost = negatif):**")
+        st.write(pd.DataFrame({'Kriteria': kriteria, 'Bobot Asli': bobot, 'Bobot Perbaikan': w_perbaikan}))
+        
+        hasil = tabel_peringkat(alternatif, {'Vektor S': vektor_s, 'Vektor V': vektor_v}, 'Vektor V', top_k_tampil)
+        
+        st.write("**Hasil Perhitungan WP:**")
+        tampilkan_tabel(hasil)
+        st.success(f"Alternatif terbaik: **{hasil.iloc[0]['Alternatif']}** dengan nilai V = {hasil.iloc[0]['Vektor V']:.4f}")
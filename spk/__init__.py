@@ -0,0 +1,43 @@
+"""Paket perhitungan Sistem Pendukung Keputusan (SPK).
+
+Berisi logika perhitungan yang tidak bergantung pada Streamlit sehingga
+bisa dipakai dari app.py maupun dari skrip lain.
+
+Nama di bawah diimpor saat pertama diakses (``spk.hitung_saw_np``), bukan
+saat paket diimpor, sehingga ``from spk.engine import ...`` tidak ikut
+memuat modul lain seperti konsensus atau sensitivitas.
+"""
+
+import importlib
+
+_MODUL = {
+    "spk.manual": ("hitung_saw", "hitung_wp", "hitung_ahp", "hitung_topsis"),
+    "spk.engine": ("mask_benefit", "hitung_saw_np", "hitung_wp_np", "hitung_topsis_np",
+                   "hitung_skor_batch", "peringkat"),
+    "spk.topsis_paralel": ("hitung_topsis_paralel",),
+    "spk.ahp": ("hitung_ahp_np", "hitung_ahp_batch", "prioritas_eigen", "indeks_acak"),
+    "spk.grup": ("agregasi_grup", "AkumulatorGrup"),
+    "spk.tak_lengkap": ("desain_perbandingan", "prioritas_llsm", "saran_perbandingan"),
+    "spk.hierarki": ("Hierarki", "Simpul"),
+    "spk.konsensus": ("jalankan_konsensus", "kendall", "spearman", "borda", "copeland"),
+    "spk.sensitivitas": ("monte_carlo", "ambang_pembalikan"),
+    "spk.streaming": ("skor_streaming",),
+    "spk.inkremental": ("PeringkatInkremental",),
+    "spk.topk": ("top_k", "skyband", "peringkat_top_k"),
+}
+_ASAL = {nama: modul for modul, daftar in _MODUL.items() for nama in daftar}
+
+__all__ = list(_ASAL)
+
+
+def __getattr__(nama):
+    modul = _ASAL.get(nama)
+    if modul is None:
+        raise AttributeError(f"module 'spk' has no attribute {nama!r}")
+    nilai = getattr(importlib.import_module(modul), nama)
+    globals()[nama] = nilai
+    return nilai
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,139 @@
+"""Mesin AHP berbasis NumPy: prioritas eigenvektor utama dan konsistensi.
+
+Semua matriks perbandingan berpasangan ditumpuk menjadi array (k, n, n)
+lalu diproses sekaligus dengan power iteration. Indeks acak (RI) untuk n
+di atas 10 dibaca dari ``indeks_acak.json`` (dibuat oleh
+``python -m spk.indeks_acak``) saat pertama kali dibutuhkan.
+"""
+
+import json
+import os
+import warnings
+from functools import lru_cache
+
+import numpy as np
+
+from spk.profil import tahap
+
+# Nilai RI Saaty yang dipakai sejak awal; dipertahankan agar CR untuk
+# matriks kecil tidak berubah
+RI_SAATY = {1: 0.0, 2: 0.0, 3: 0.58, 4: 0.9, 5: 1.12, 6: 1.24, 7: 1.32, 8: 1.41, 9: 1.45, 10: 1.49}
+
+PATH_INDEKS_ACAK = os.path.join(os.path.dirname(__file__), "indeks_acak.json")
+
+
+@lru_cache(maxsize=None)
+def _tabel_indeks_acak():
+    with open(PATH_INDEKS_ACAK, encoding="utf-8") as f:
+        return {int(n): ri for n, ri in json.load(f)["ri"].items()}
+
+
+def indeks_acak(n):
+    """Random index (RI) untuk matriks n x n
+
+    n <= 10 memakai tabel Saaty, n lebih besar memakai tabel Monte Carlo.
+    """
+    if n in RI_SAATY:
+        return RI_SAATY[n]
+    tabel = _tabel_indeks_acak()
+    if n not in tabel:
+        raise ValueError(f"RI untuk n = {n} belum ada di tabel (maksimum {max(tabel)}); "
+                         "buat ulang dengan python -m spk.indeks_acak --n-maks N")
+    return tabel[n]
+
+
+def tumpuk_matriks(matriks):
+    """Ubah satu matriks (n, n) atau daftar matriks menjadi array (k, n, n) yang valid"""
+    A = np.asarray(matriks, dtype=float)
+    if A.ndim == 2:
+        A = A[None]
+    if A.ndim != 3 or A.shape[1] != A.shape[2]:
+        raise ValueError("Matriks perbandingan harus persegi (n x n) atau tumpukan (k, n, n)")
+    if np.any(~(A > 0)):
+        raise ValueError("Semua elemen matriks perbandingan harus > 0")
+    return A
+
+
+def _peringatan_konvergen(konvergen, maks_iterasi):
+    """RuntimeWarning (menunjuk ke pemanggil fungsi publik) jika ada matriks yang belum konvergen"""
+    gagal = np.flatnonzero(~konvergen)
+    if gagal.size:
+        warnings.warn(f"Power iteration belum konvergen setelah {maks_iterasi} iterasi untuk {gagal.size} dari "
+                      f"{konvergen.size} matriks (indeks {gagal[:10].tolist()}{', ...' if gagal.size > 10 else ''})",
+                      RuntimeWarning, stacklevel=3)
+
+
+def prioritas_eigen(matriks, toleransi=1e-10, maks_iterasi=1000):
+    """Eigenvektor utama (jumlah = 1) dan lambda max untuk tumpukan matriks (k, n, n)
+
+    Power iteration dijalankan bersamaan untuk semua matriks; matriks yang
+    sudah konvergen (perubahan maksimum < ``toleransi``) dikeluarkan dari
+    iterasi berikutnya. Mengembalikan (bobot (k, n), lambda_max (k,),
+    konvergen (k,) bool). Jika ``maks_iterasi`` tercapai sebelum semua
+    matriks konvergen, RuntimeWarning dikeluarkan.
+    """
+    bobot, lambda_max, konvergen = _power_iteration(tumpuk_matriks(matriks), toleransi, maks_iterasi)
+    _peringatan_konvergen(konvergen, maks_iterasi)
+    return bobot, lambda_max, konvergen
+
+
+def _power_iteration(A, toleransi, maks_iterasi):
+    k = A.shape[0]
+    # Rata-rata geometrik baris sebagai tebakan awal, sudah tepat untuk matriks konsisten
+    bobot = np.exp(np.log(A).mean(axis=2))
+    bobot /= bobot.sum(axis=1, keepdims=True)
+    aktif = np.arange(k)
+    iterasi = 0
+    while aktif.size and iterasi < maks_iterasi:
+        iterasi += 1
+        x = bobot[aktif]
+        y = np.einsum("kij,kj->ki", A[aktif], x)
+        y /= y.sum(axis=1, keepdims=True)
+        bobot[aktif] = y
+        aktif = aktif[np.abs(y - x).max(axis=1) >= toleransi]
+    konvergen = np.ones(k, dtype=bool)
+    konvergen[aktif] = False
+    # Aw = lambda w dan sum(w) = 1 sehingga lambda = sum(Aw)
+    lambda_max = np.einsum("kij,kj->k", A, bobot)
+    return bobot, lambda_max, konvergen
+
+
+def konsistensi(lambda_max, n):
+    """CI = (lambda_max - n) / (n - 1) dan CR = CI / RI"""
+    lambda_max = np.asarray(lambda_max, dtype=float)
+    if n <= 1:
+        return np.zeros_like(lambda_max), np.zeros_like(lambda_max)
+    ci = (lambda_max - n) / (n - 1)
+    ri = indeks_acak(n)
+    cr = ci / ri if ri > 0 else np.zeros_like(ci)
+    return ci, cr
+
+
+def hitung_ahp_batch(matriks, toleransi=1e-10, maks_iterasi=1000):
+    """Prioritas dan konsistensi untuk tumpukan matriks (k, n, n)
+
+    Mengembalikan (bobot (k, n), lambda_max, ci, cr) masing-masing (k,).
+    Matriks yang belum konvergen dalam ``maks_iterasi`` memicu RuntimeWarning
+    seperti pada ``prioritas_eigen``.
+    """
+    A = tumpuk_matriks(matriks)
+    with tahap("eigenvektor"):
+        bobot, lambda_max, konvergen = _power_iteration(A, toleransi, maks_iterasi)
+        _peringatan_konvergen(konvergen, maks_iterasi)
+    with tahap("konsistensi"):
+        ci, cr = konsistensi(lambda_max, A.shape[1])
+    return bobot, lambda_max, ci, cr
+
+
+def hitung_ahp_np(matrix):
+    """Metode AHP versi vektor untuk satu matriks
+
+    Mengembalikan (matrix_norm, bobot, lambda_max, ci, cr) seperti
+    ``spk.manual.hitung_ahp``, tetapi bobot adalah eigenvektor utama
+    (bukan rata-rata baris matriks ternormalisasi).
+    """
+    A = tumpuk_matriks(matrix)[0]
+    with tahap("normalisasi"):
+        matrix_norm = A / A.sum(axis=0)
+    bobot, lambda_max, ci, cr = hitung_ahp_batch(A)
+    return matrix_norm, bobot[0], float(lambda_max[0]), float(ci[0]), float(cr[0])
@@ -0,0 +1,149 @@
+"""Cache hasil perhitungan dengan kunci hash isi dan eviksi LRU berbatas memori.
+
+Streamlit menjalankan ulang app.py pada setiap interaksi, tetapi modul ini
+hanya diimpor sekali per proses server. Karena itu ``cache_hasil`` di
+bawah dipakai bersama oleh semua sesi. Batas memori default 256 MB dan
+bisa diubah lewat variabel lingkungan ``SPK_CACHE_MB``.
+"""
+
+import hashlib
+import mmap
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from spk.profil import tahap
+
+
+def _perbarui_hash(h, obj):
+    if isinstance(obj, np.ndarray) or (isinstance(obj, (list, tuple)) and obj and not isinstance(obj[0], str)):
+        try:
+            arr = np.ascontiguousarray(obj)
+        except ValueError:
+            arr = None
+        if arr is not None and arr.dtype != object:
+            h.update(f"nd{arr.dtype.str}{arr.shape}".encode())
+            h.update(arr.data)
+            return
+    if isinstance(obj, (list, tuple)):
+        h.update(f"seq{len(obj)}(".encode())
+        for item in obj:
+            _perbarui_hash(h, item)
+        h.update(b")")
+        return
+    h.update(repr(obj).encode())
+
+
+def kunci_hash(*bagian):
+    """Hash isi (blake2b) dari metode, matriks, bobot, tipe, dan seterusnya"""
+    h = hashlib.blake2b(digest_size=16)
+    for b in bagian:
+        _perbarui_hash(h, b)
+        h.update(b"|")
+    return h.hexdigest()
+
+
+# Array yang datanya di file memmap (mis. dari Pustaka Skenario) tidak
+# menempati RAM proses, jadi dihitung dengan ukuran nominal ini
+BYTE_MEMMAP = 4096
+
+
+def _di_memmap(arr):
+    """True jika data array berasal dari np.memmap / mmap (langsung atau lewat ``base``)"""
+    while arr is not None:
+        if isinstance(arr, (np.memmap, mmap.mmap)):
+            return True
+        arr = getattr(arr, "base", None)
+    return False
+
+
+def _ukuran(obj):
+    """Perkiraan ukuran hasil dalam byte (ndarray dari nbytes, array memmap nominal)"""
+    if isinstance(obj, np.ndarray):
+        return (BYTE_MEMMAP if _di_memmap(obj) else obj.nbytes) + 112
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(_ukuran(o) for o in obj)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(_ukuran(k) + _ukuran(v) for k, v in obj.items())
+    return sys.getsizeof(obj)
+
+
+def _bekukan(obj):
+    """Jadikan ndarray read-only agar hasil bersama tidak bisa diubah pemanggil"""
+    if isinstance(obj, np.ndarray):
+        obj.flags.writeable = False
+    elif isinstance(obj, (list, tuple)):
+        for o in obj:
+            _bekukan(o)
+    elif isinstance(obj, dict):
+        for o in obj.values():
+            _bekukan(o)
+    return obj
+
+
+class CacheHasil:
+    """Cache LRU thread-safe dengan batas total ukuran hasil (byte)"""
+
+    def __init__(self, batas_byte):
+        self.batas_byte = batas_byte
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.ukuran_byte = 0
+        self.hit = 0
+        self.miss = 0
+        self.eviksi = 0
+
+    def ambil(self, kunci):
+        with self._lock:
+            entri = self._data.get(kunci)
+            if entri is None:
+                self.miss += 1
+                return None
+            self._data.move_to_end(kunci)
+            self.hit += 1
+            return entri[0]
+
+    def simpan(self, kunci, hasil):
+        ukuran = _ukuran(hasil)
+        if ukuran > self.batas_byte:
+            return hasil
+        _bekukan(hasil)
+        with self._lock:
+            if kunci in self._data:
+                self.ukuran_byte -= self._data.pop(kunci)[1]
+            self._data[kunci] = (hasil, ukuran)
+            self.ukuran_byte += ukuran
+            while self.ukuran_byte > self.batas_byte:
+                _, (_, u) = self._data.popitem(last=False)
+                self.ukuran_byte -= u
+                self.eviksi += 1
+        return hasil
+
+    def hitung(self, kunci, fungsi, *args, **kwargs):
+        """Ambil dari cache, atau jalankan ``fungsi`` dan simpan hasilnya"""
+        hasil = self.ambil(kunci)
+        if hasil is None:
+            hasil = self.simpan(kunci, fungsi(*args, **kwargs))
+        return hasil
+
+    def kosongkan(self):
+        with self._lock:
+            self._data.clear()
+            self.ukuran_byte = 0
+
+    def statistik(self):
+        with self._lock:
+            return {"hit": self.hit, "miss": self.miss, "eviksi": self.eviksi,
+                    "entri": len(self._data), "ukuran_byte": self.ukuran_byte, "batas_byte": self.batas_byte}
+
+
+cache_hasil = CacheHasil(int(float(os.environ.get("SPK_CACHE_MB", "256")) * 1024 * 1024))
+
+
+def hitung_tercache(metode, fungsi, *args):
+    """Jalankan ``fungsi(*args)`` lewat ``cache_hasil`` dengan kunci hash (metode, args)"""
+    with tahap(f"hitung {metode}"):
+        return cache_hasil.hitung(kunci_hash(metode, *args), fungsi, *args)
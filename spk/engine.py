@@ -0,0 +1,461 @@
+"""Mesin perhitungan berbasis NumPy untuk metode SAW, WP dan TOPSIS.
+
+Setiap fungsi menerima matriks keputusan 2-D (alternatif x kriteria),
+vektor bobot dan tipe kriteria (daftar "Benefit"/"Cost" atau mask boolean
+dengan True = Benefit), lalu mengembalikan besaran antara yang sama dengan
+fungsi manual di ``spk.manual`` dalam bentuk ndarray.
+"""
+
+import numpy as np
+
+from spk.profil import tahap
+
+
+def mask_benefit(tipe, n_krit=None):
+    """Ubah tipe kriteria menjadi mask boolean (True = Benefit)"""
+    tipe = np.asarray(tipe)
+    if tipe.dtype == bool:
+        mask = tipe
+    else:
+        mask = tipe == "Benefit"
+    if n_krit is not None and mask.shape != (n_krit,):
+        raise ValueError(f"Jumlah tipe ({mask.size}) tidak sama dengan jumlah kriteria ({n_krit})")
+    return mask
+
+
+def _siapkan(data, bobot, tipe):
+    X = np.asarray(data, dtype=float)
+    if X.ndim != 2:
+        raise ValueError("Matriks keputusan harus 2 dimensi (alternatif x kriteria)")
+    w = np.asarray(bobot, dtype=float)
+    if w.shape != (X.shape[1],):
+        raise ValueError(f"Jumlah bobot ({w.size}) tidak sama dengan jumlah kriteria ({X.shape[1]})")
+    return X, w, mask_benefit(tipe, X.shape[1])
+
+
+def normalisasi_saw(X, benefit, col_max=None, col_min=None):
+    """Normalisasi SAW: benefit x/max, cost min/x (0 jika pembagi <= 0)
+
+    ``col_max``/``col_min`` bisa diberikan dari luar (mis. statistik seluruh
+    data saat X hanya sebagian baris).
+    """
+    if col_max is None:
+        col_max = X.max(axis=0)
+    if col_min is None:
+        col_min = X.min(axis=0)
+    R = np.zeros_like(X)
+    np.divide(X, col_max, out=R, where=benefit & (col_max > 0))
+    np.divide(col_min, X, out=R, where=~benefit & (X > 0))
+    return R
+
+
+def hitung_saw_np(data, bobot, tipe):
+    """Metode SAW versi vektor
+
+    Mengembalikan (matriks_r, nilai_v) seperti ``spk.manual.hitung_saw``.
+    """
+    X, w, benefit = _siapkan(data, bobot, tipe)
+    with tahap("normalisasi"):
+        matriks_r = normalisasi_saw(X, benefit)
+    with tahap("pembobotan"):
+        nilai_v = matriks_r @ w
+    return matriks_r, nilai_v
+
+
+def hitung_log_s(X, w_perbaikan, ukuran_blok=65_536):
+    """log S_i = sum_j w_j * log(x_ij), dihitung per blok baris
+
+    Bekerja di ruang log sehingga tidak underflow/overflow seperti perkalian
+    berjalan x_ij ** w_j. Kolom dengan bobot 0 dilewati (x ** 0 = 1), nilai 0
+    hanya boleh ada pada kriteria dengan bobot positif (S = 0).
+    """
+    aktif = w_perbaikan != 0
+    semua_aktif = aktif.all()
+    w_aktif = w_perbaikan[aktif]
+    cost = w_aktif < 0
+
+    log_s = np.empty(X.shape[0])
+    with np.errstate(divide="ignore"):
+        for awal in range(0, X.shape[0], ukuran_blok):
+            blok = X[awal:awal + ukuran_blok]
+            if not semua_aktif:
+                blok = blok[:, aktif]
+            if blok.min(initial=0.0) < 0:
+                raise ValueError("Metode WP membutuhkan nilai matriks keputusan >= 0")
+            if np.any(blok[:, cost] == 0):
+                raise ValueError("Nilai 0 tidak boleh ada pada kriteria Cost (pembagian dengan nol)")
+            np.dot(np.log(blok), w_aktif, out=log_s[awal:awal + ukuran_blok])
+    return log_s
+
+
+def normalisasi_log(log_s):
+    """V_i = S_i / sum(S) dihitung dari log S dengan log-sum-exp"""
+    maks = log_s.max()
+    if not np.isfinite(maks):
+        # Semua S = 0 (total_s = 0), sama seperti versi manual
+        return np.zeros_like(log_s)
+    vektor_v = np.exp(log_s - maks)
+    vektor_v /= vektor_v.sum()
+    return vektor_v
+
+
+def hitung_wp_np(data, bobot, tipe):
+    """Metode WP versi vektor (ruang log)
+
+    Mengembalikan (w_perbaikan, vektor_s, vektor_v) seperti ``spk.manual.hitung_wp``.
+    Vektor V dihitung dari log S sehingga tetap valid walaupun S sendiri
+    overflow (inf) atau underflow (0) pada banyak kriteria.
+    """
+    X, w, benefit = _siapkan(data, bobot, tipe)
+    w_perbaikan = np.where(benefit, w, -w)
+    with tahap("pembobotan (log S)"):
+        log_s = hitung_log_s(X, w_perbaikan)
+    with tahap("normalisasi"), np.errstate(over="ignore"):
+        vektor_s = np.exp(log_s)
+        vektor_v = normalisasi_log(log_s)
+    return w_perbaikan, vektor_s, vektor_v
+
+
+def normalisasi_topsis(X, pembagi=None):
+    """Normalisasi TOPSIS: x / sqrt(sum x^2) per kolom (0 jika pembagi = 0)
+
+    ``pembagi`` bisa diberikan dari luar (mis. dari jumlah kuadrat seluruh data).
+    """
+    if pembagi is None:
+        pembagi = np.sqrt(np.einsum("ij,ij->j", X, X))
+    data_norm = np.zeros_like(X)
+    np.divide(X, pembagi, out=data_norm, where=pembagi > 0)
+    return data_norm
+
+
+def solusi_ideal(col_max, col_min, benefit):
+    """Solusi ideal positif dan negatif dari max/min kolom matriks terbobot"""
+    ideal_pos = np.where(benefit, col_max, col_min)
+    ideal_neg = np.where(benefit, col_min, col_max)
+    return ideal_pos, ideal_neg
+
+
+METRIK_JARAK = ("euclidean", "manhattan", "chebyshev")
+
+
+def cek_metrik(metrik):
+    if metrik not in METRIK_JARAK:
+        raise ValueError(f"Metrik jarak tidak dikenal: {metrik!r} (pilih {', '.join(METRIK_JARAK)})")
+
+
+def jarak_baris(selisih, metrik="euclidean", out=None):
+    """Jarak per baris dari matriks selisih; ``selisih`` ikut ditimpa (dipakai sebagai buffer)"""
+    cek_metrik(metrik)
+    if metrik == "euclidean":
+        out = np.einsum("ij,ij->i", selisih, selisih, out=out)
+        return np.sqrt(out, out=out)
+    np.abs(selisih, out=selisih)
+    if metrik == "manhattan":
+        # einsum jauh lebih cepat daripada sum(axis=1) untuk baris pendek
+        return np.einsum("ij->i", selisih, out=out)
+    # max per kolom lebih cepat daripada max(axis=1) yang mereduksi baris pendek satu per satu
+    if out is None:
+        out = selisih[:, 0].copy()
+    else:
+        np.copyto(out, selisih[:, 0])
+    for j in range(1, selisih.shape[1]):
+        np.maximum(out, selisih[:, j], out=out)
+    return out
+
+
+def preferensi_topsis(d_pos, d_neg, out=None):
+    """D- / (D+ + D-), 0 jika keduanya 0"""
+    total = d_pos + d_neg
+    if out is None:
+        out = np.zeros_like(total)
+    else:
+        out[...] = 0
+    np.divide(d_neg, total, out=out, where=total > 0)
+    return out
+
+
+def jarak_topsis(data_weighted, ideal_pos, ideal_neg, metrik="euclidean"):
+    """Jarak ke A+ dan A- (Euclidean, Manhattan atau Chebyshev) serta nilai preferensi"""
+    selisih = data_weighted - ideal_pos
+    d_pos = jarak_baris(selisih, metrik)
+    np.subtract(data_weighted, ideal_neg, out=selisih)
+    d_neg = jarak_baris(selisih, metrik)
+    return d_pos, d_neg, preferensi_topsis(d_pos, d_neg)
+
+
+def hitung_topsis_np(data, bobot, tipe, metrik="euclidean"):
+    """Metode TOPSIS versi vektor
+
+    Mengembalikan (data_norm, data_weighted, ideal_pos, ideal_neg, d_pos,
+    d_neg, preferensi) seperti ``spk.manual.hitung_topsis``. ``metrik``
+    menentukan jarak ke solusi ideal: euclidean (default), manhattan atau
+    chebyshev.
+    """
+    cek_metrik(metrik)
+    X, w, benefit = _siapkan(data, bobot, tipe)
+    with tahap("normalisasi"):
+        data_norm = normalisasi_topsis(X)
+    with tahap("pembobotan"):
+        data_weighted = data_norm * w
+    with tahap("solusi ideal"):
+        ideal_pos, ideal_neg = solusi_ideal(data_weighted.max(axis=0), data_weighted.min(axis=0), benefit)
+    with tahap("jarak & preferensi"):
+        d_pos, d_neg, preferensi = jarak_topsis(data_weighted, ideal_pos, ideal_neg, metrik)
+    return data_norm, data_weighted, ideal_pos, ideal_neg, d_pos, d_neg, preferensi
+
+
+# ==================== EVALUASI BANYAK SKENARIO BOBOT ====================
+# Normalisasi tidak bergantung pada bobot, jadi cukup dihitung sekali untuk
+# semua skenario. Setiap fungsi menerima matriks bobot (skenario x kriteria)
+# dan mengembalikan matriks skor (skenario x alternatif).
+
+def _siapkan_batch(data, daftar_bobot, tipe):
+    X = np.asarray(data, dtype=float)
+    if X.ndim != 2:
+        raise ValueError("Matriks keputusan harus 2 dimensi (alternatif x kriteria)")
+    W = np.atleast_2d(np.asarray(daftar_bobot, dtype=float))
+    if W.ndim != 2 or W.shape[1] != X.shape[1]:
+        raise ValueError(f"Matriks bobot harus berukuran (skenario x {X.shape[1]}), didapat {W.shape}")
+    return X, W, mask_benefit(tipe, X.shape[1])
+
+
+def hitung_saw_batch(data, daftar_bobot, tipe):
+    """SAW untuk banyak skenario bobot: V = W @ R^T"""
+    X, W, benefit = _siapkan_batch(data, daftar_bobot, tipe)
+    matriks_r = normalisasi_saw(X, benefit)
+    return W @ matriks_r.T
+
+
+def hitung_wp_batch(data, daftar_bobot, tipe):
+    """WP untuk banyak skenario bobot
+
+    log S = W' @ log(X)^T dengan W' = bobot perbaikan (cost negatif), lalu
+    V = S / sum(S) per skenario dihitung di ruang log agar tidak overflow.
+    Aturan nilai 0 sama dengan ``hitung_log_s``: kolom berbobot 0
+    diabaikan, nilai 0 pada bobot perbaikan positif membuat S = 0 dan
+    nilai 0 pada bobot perbaikan negatif (Cost) ditolak.
+    """
+    X, W, benefit = _siapkan_batch(data, daftar_bobot, tipe)
+    if X.min(initial=0.0) < 0:
+        raise ValueError("Metode WP membutuhkan nilai matriks keputusan >= 0")
+    w_perbaikan = np.where(benefit, W, -W)
+    nol = X == 0
+    ada_nol = nol.any(axis=0)
+    if np.any(ada_nol & (w_perbaikan < 0).any(axis=0)):
+        raise ValueError("Nilai 0 tidak boleh ada pada kriteria Cost (pembagian dengan nol)")
+    with np.errstate(divide="ignore"):
+        log_x = np.log(X)
+    # log 0 = -inf diganti 0 agar tidak menjadi nan saat dikali bobot 0; S = 0 ditandai terpisah
+    log_x[nol] = 0.0
+    log_s = w_perbaikan @ log_x.T
+    if ada_nol.any():
+        s_nol = (w_perbaikan[:, ada_nol] > 0).astype(float) @ nol[:, ada_nol].T.astype(float) > 0
+        log_s[s_nol] = -np.inf
+    maks = log_s.max(axis=1, keepdims=True)
+    # Skenario dengan semua S = 0 menghasilkan V = 0, sama seperti normalisasi_log
+    valid = np.isfinite(maks)
+    vektor_v = np.exp(log_s - np.where(valid, maks, 0.0))
+    vektor_v /= np.where(valid, vektor_v.sum(axis=1, keepdims=True), 1.0)
+    vektor_v[~valid[:, 0]] = 0.0
+    return vektor_v
+
+
+def hitung_topsis_batch(data, daftar_bobot, tipe, metrik="euclidean"):
+    """TOPSIS untuk banyak skenario bobot
+
+    Untuk bobot w >= 0, solusi ideal terbobot adalah w_j * ideal kolom
+    matriks ternormalisasi, sehingga
+    D+^2 = (W^2) @ ((N - A+)^2)^T dan D-^2 = (W^2) @ ((N - A-)^2)^T
+    (manhattan: W @ |N - A|^T, chebyshev: max_j w_j |n_ij - a_j|).
+    Selisih dihitung sekali, setiap skenario hanya butuh satu perkalian
+    matriks.
+    """
+    cek_metrik(metrik)
+    X, W, benefit = _siapkan_batch(data, daftar_bobot, tipe)
+    if np.any(W < 0):
+        raise ValueError("Bobot TOPSIS tidak boleh negatif")
+    selisih_pos, selisih_neg = prakomputasi_topsis(X, benefit, metrik)
+    d_pos = _jarak_terbobot(selisih_pos, W, metrik)
+    d_neg = _jarak_terbobot(selisih_neg, W, metrik)
+    return preferensi_topsis(d_pos, d_neg)
+
+
+# ==================== PERINGKAT ULANG SAAT BOBOT BERUBAH ====================
+# Untuk slider bobot: bagian yang tidak bergantung bobot dihitung sekali
+# (prakomputasi_*), setiap perubahan bobot cukup satu perkalian
+# matriks-vektor (skor_*_bobot) tanpa normalisasi ulang.
+
+def prakomputasi_saw(data, tipe):
+    """Matriks R SAW; skor untuk bobot w adalah R @ w"""
+    X = np.asarray(data, dtype=float)
+    if X.ndim != 2:
+        raise ValueError("Matriks keputusan harus 2 dimensi (alternatif x kriteria)")
+    return normalisasi_saw(X, mask_benefit(tipe, X.shape[1]))
+
+
+def skor_saw_bobot(matriks_r, bobot):
+    """Nilai V SAW dari matriks R hasil ``prakomputasi_saw``"""
+    return matriks_r @ np.asarray(bobot, dtype=float)
+
+
+def prakomputasi_topsis(data, tipe, metrik="euclidean"):
+    """Selisih matriks ternormalisasi N terhadap solusi idealnya, (P, Q)
+
+    Untuk bobot w >= 0, solusi ideal terbobot adalah w_j * ideal kolom N,
+    sehingga |v_ij - A_j| = w_j * |n_ij - a_j|. P = |N - A+| dan
+    Q = |N - A-| (dikuadratkan untuk euclidean) tidak bergantung bobot.
+    Disimpan berurutan kolom (Fortran) agar reduksi per kolom chebyshev
+    membaca memori berurutan.
+    """
+    cek_metrik(metrik)
+    X = np.asarray(data, dtype=float)
+    if X.ndim != 2:
+        raise ValueError("Matriks keputusan harus 2 dimensi (alternatif x kriteria)")
+    benefit = mask_benefit(tipe, X.shape[1])
+    data_norm = np.asfortranarray(normalisasi_topsis(X))
+    ideal_pos, ideal_neg = solusi_ideal(data_norm.max(axis=0), data_norm.min(axis=0), benefit)
+    selisih_pos = data_norm - ideal_pos
+    np.subtract(data_norm, ideal_neg, out=data_norm)
+    selisih_neg = data_norm
+    for s in (selisih_pos, selisih_neg):
+        if metrik == "euclidean":
+            np.square(s, out=s)
+        else:
+            np.abs(s, out=s)
+    return selisih_pos, selisih_neg
+
+
+def _jarak_terbobot(selisih, W, metrik):
+    """Jarak (skenario x alternatif) dari selisih ``prakomputasi_topsis`` dan bobot W (skenario x kriteria)"""
+    if metrik == "euclidean":
+        return np.sqrt((W * W) @ selisih.T)
+    if metrik == "manhattan":
+        return W @ selisih.T
+    out = np.multiply.outer(W[:, 0], selisih[:, 0])
+    buffer = np.empty_like(out)
+    for j in range(1, selisih.shape[1]):
+        np.multiply.outer(W[:, j], selisih[:, j], out=buffer)
+        np.maximum(out, buffer, out=out)
+    return out
+
+
+def skor_topsis_bobot(selisih_pos, selisih_neg, bobot, metrik="euclidean"):
+    """(d_pos, d_neg, preferensi) TOPSIS dari hasil ``prakomputasi_topsis`` dengan metrik yang sama"""
+    cek_metrik(metrik)
+    w = np.asarray(bobot, dtype=float)
+    if w.shape != (selisih_pos.shape[1],):
+        raise ValueError(f"Jumlah bobot ({w.size}) tidak sama dengan jumlah kriteria ({selisih_pos.shape[1]})")
+    if np.any(w < 0):
+        raise ValueError("Bobot TOPSIS tidak boleh negatif")
+    d_pos = _jarak_terbobot(selisih_pos, w[None, :], metrik)[0]
+    d_neg = _jarak_terbobot(selisih_neg, w[None, :], metrik)[0]
+    return d_pos, d_neg, preferensi_topsis(d_pos, d_neg)
+
+
+_BATCH = {
+    "SAW": hitung_saw_batch,
+    "WP": hitung_wp_batch,
+    "TOPSIS": hitung_topsis_batch,
+}
+
+
+def hitung_skor_batch(metode, data, daftar_bobot, tipe, metrik="euclidean"):
+    """Hitung matriks skor (skenario x alternatif) untuk metode SAW/WP/TOPSIS
+
+    ``metrik`` (jarak ke solusi ideal) hanya dipakai TOPSIS.
+    """
+    try:
+        fungsi = _BATCH[metode]
+    except KeyError:
+        raise ValueError(f"Metode batch tidak dikenal: {metode!r}") from None
+    if metode == "TOPSIS":
+        return fungsi(data, daftar_bobot, tipe, metrik)
+    return fungsi(data, daftar_bobot, tipe)
+
+
+# ==================== TUMPUKAN MATRIKS BERUKURAN SAMA ====================
+# Untuk k matriks keputusan (k, alternatif, kriteria) yang masing-masing
+# punya bobot dan tipe sendiri, misalnya permintaan yang digabung oleh
+# spk.layanan. Hasil per matriks sama dengan fungsi *_np di atas.
+
+def _siapkan_tumpukan(data, daftar_bobot, daftar_tipe):
+    X = np.asarray(data, dtype=float)
+    if X.ndim != 3:
+        raise ValueError("Tumpukan matriks keputusan harus 3 dimensi (matriks x alternatif x kriteria)")
+    W = np.asarray(daftar_bobot, dtype=float)
+    if W.shape != (X.shape[0], X.shape[2]):
+        raise ValueError(f"Bobot harus berukuran ({X.shape[0]} x {X.shape[2]}), didapat {W.shape}")
+    tipe = np.asarray(daftar_tipe)
+    benefit = tipe if tipe.dtype == bool else tipe == "Benefit"
+    if benefit.shape != W.shape:
+        raise ValueError(f"Tipe harus berukuran ({X.shape[0]} x {X.shape[2]}), didapat {benefit.shape}")
+    return X, W, benefit
+
+
+def hitung_saw_tumpukan(data, daftar_bobot, daftar_tipe):
+    """Nilai V SAW (k, alternatif) untuk k matriks sekaligus"""
+    X, W, benefit = _siapkan_tumpukan(data, daftar_bobot, daftar_tipe)
+    matriks_r = normalisasi_saw(X, benefit[:, None, :], X.max(axis=1, keepdims=True), X.min(axis=1, keepdims=True))
+    return np.einsum("knm,km->kn", matriks_r, W)
+
+
+def hitung_wp_tumpukan(data, daftar_bobot, daftar_tipe):
+    """Vektor V WP (k, alternatif) untuk k matriks sekaligus (ruang log)
+
+    Validasi nilai negatif atau 0 pada kriteria Cost dilakukan pemanggil;
+    kolom dengan bobot 0 diabaikan seperti ``hitung_log_s``.
+    """
+    X, W, benefit = _siapkan_tumpukan(data, daftar_bobot, daftar_tipe)
+    w_perbaikan = np.where(benefit, W, -W)
+    with np.errstate(divide="ignore"):
+        log_x = np.log(X)
+    log_x = np.where(w_perbaikan[:, None, :] != 0, log_x, 0.0)
+    log_s = np.einsum("knm,km->kn", log_x, w_perbaikan)
+    maks = log_s.max(axis=1, keepdims=True)
+    # Baris dengan semua S = 0 menghasilkan V = 0, sama seperti normalisasi_log
+    valid = np.isfinite(maks)
+    vektor_v = np.exp(log_s - np.where(valid, maks, 0.0))
+    vektor_v /= np.where(valid, vektor_v.sum(axis=1, keepdims=True), 1.0)
+    vektor_v[~valid[:, 0]] = 0.0
+    return vektor_v
+
+
+def hitung_topsis_tumpukan(data, daftar_bobot, daftar_tipe):
+    """Nilai preferensi TOPSIS (k, alternatif) untuk k matriks sekaligus"""
+    X, W, benefit = _siapkan_tumpukan(data, daftar_bobot, daftar_tipe)
+    data_norm = normalisasi_topsis(X, np.sqrt(np.einsum("knm,knm->km", X, X))[:, None, :])
+    data_weighted = data_norm * W[:, None, :]
+    ideal_pos, ideal_neg = solusi_ideal(data_weighted.max(axis=1), data_weighted.min(axis=1), benefit)
+    selisih = data_weighted - ideal_pos[:, None, :]
+    d_pos = np.sqrt(np.einsum("knm,knm->kn", selisih, selisih))
+    np.subtract(data_weighted, ideal_neg[:, None, :], out=selisih)
+    d_neg = np.sqrt(np.einsum("knm,knm->kn", selisih, selisih))
+    total = d_pos + d_neg
+    preferensi = np.zeros_like(total)
+    np.divide(d_neg, total, out=preferensi, where=total > 0)
+    return preferensi
+
+
+_TUMPUKAN = {
+    "SAW": hitung_saw_tumpukan,
+    "WP": hitung_wp_tumpukan,
+    "TOPSIS": hitung_topsis_tumpukan,
+}
+
+
+def hitung_skor_tumpukan(metode, data, daftar_bobot, daftar_tipe):
+    """Skor akhir (k, alternatif) SAW/WP/TOPSIS untuk tumpukan k matriks berukuran sama"""
+    try:
+        fungsi = _TUMPUKAN[metode]
+    except KeyError:
+        raise ValueError(f"Metode tumpukan tidak dikenal: {metode!r}") from None
+    return fungsi(data, daftar_bobot, daftar_tipe)
+
+
+def peringkat(skor):
+    """Peringkat (1 = terbaik) untuk setiap baris skor, skor lebih besar lebih baik"""
+    skor = np.asarray(skor)
+    urutan = np.argsort(-skor, axis=-1, kind="stable")
+    hasil = np.empty_like(urutan)
+    np.put_along_axis(hasil, urutan, np.arange(1, skor.shape[-1] + 1), axis=-1)
+    return hasil
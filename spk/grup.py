@@ -0,0 +1,179 @@
+"""AHP kelompok: agregasi matriks perbandingan dari banyak responden.
+
+Penilaian responden dibaca per chunk sebagai array (r, n, n) sehingga
+memori hanya sebesar satu chunk ditambah akumulator (n, n), bukan semua
+matriks sekaligus. Dua cara agregasi:
+
+- AIJ (aggregation of individual judgements): rata-rata geometrik per
+  elemen matriks, lalu prioritas dihitung dari matriks agregat.
+- AIP (aggregation of individual priorities): prioritas tiap responden
+  dihitung dulu, lalu dirata-rata geometrik dan dinormalisasi.
+
+CR setiap responden dihitung sekaligus per chunk; responden dengan
+CR > ``batas_cr`` ditandai dan bisa dikeluarkan dari agregasi.
+"""
+
+import os
+
+import numpy as np
+
+from spk.ahp import hitung_ahp_batch, tumpuk_matriks
+
+METODE_AGREGASI = ("AIJ", "AIP")
+
+
+def n_dari_segitiga(m):
+    """Ukuran matriks n dari jumlah elemen segitiga atas m = n(n-1)/2"""
+    n = int(round((1 + np.sqrt(1 + 8 * m)) / 2))
+    if n * (n - 1) // 2 != m:
+        raise ValueError(f"{m} kolom bukan jumlah elemen segitiga atas matriks n x n")
+    return n
+
+
+def dari_segitiga_atas(nilai, n=None):
+    """Bangun matriks resiprokal (r, n, n) dari baris segitiga atas (a12, a13, ..., a23, ...)"""
+    nilai = np.asarray(nilai, dtype=float)
+    if nilai.ndim == 1:
+        nilai = nilai[None]
+    n = n or n_dari_segitiga(nilai.shape[1])
+    atas = np.triu_indices(n, 1)
+    if nilai.shape[1] != atas[0].size:
+        raise ValueError(f"Matriks {n} x {n} membutuhkan {atas[0].size} nilai per responden, bukan {nilai.shape[1]}")
+    A = np.ones((nilai.shape[0], n, n))
+    A[:, atas[0], atas[1]] = nilai
+    with np.errstate(divide="ignore"):
+        A[:, atas[1], atas[0]] = 1.0 / nilai
+    return A
+
+
+def _iter_npy(f, ukuran_chunk):
+    """Baca file .npy (r, n, n) per chunk responden tanpa memuat seluruh isinya"""
+    versi = np.lib.format.read_magic(f)
+    if versi == (1, 0):
+        shape, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+    else:
+        shape, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+    if len(shape) != 3 or shape[1] != shape[2]:
+        raise ValueError(f"File .npy harus berbentuk (responden, n, n), bukan {shape}")
+    if fortran:
+        raise ValueError("File .npy berurutan Fortran tidak didukung")
+    per_responden = shape[1] * shape[2]
+    for awal in range(0, shape[0], ukuran_chunk):
+        r = min(ukuran_chunk, shape[0] - awal)
+        buffer = f.read(r * per_responden * dtype.itemsize)
+        yield np.frombuffer(buffer, dtype=dtype).reshape(r, shape[1], shape[2]).astype(float)
+
+
+def iter_responden(sumber, ukuran_chunk=1000, format=None):
+    """Yield tumpukan matriks (r, n, n) per chunk responden
+
+    ``sumber`` berupa path atau file-like (mis. hasil st.file_uploader).
+    Format .npy berisi array (responden, n, n); format CSV punya baris judul
+    dan satu baris per responden berisi segitiga atas (a12, a13, ..., a1n,
+    a23, ...). Kolom CSV yang bukan angka (mis. id responden) diabaikan.
+    """
+    nama = sumber if isinstance(sumber, (str, os.PathLike)) else getattr(sumber, "name", "")
+    if hasattr(sumber, "seek"):
+        sumber.seek(0)
+    format = format or os.path.splitext(str(nama))[1].lstrip(".").lower()
+    if format == "npy":
+        if isinstance(sumber, (str, os.PathLike)):
+            with open(sumber, "rb") as f:
+                yield from _iter_npy(f, ukuran_chunk)
+        else:
+            yield from _iter_npy(sumber, ukuran_chunk)
+    elif format == "csv":
+        import pandas as pd
+        n = None
+        for df in pd.read_csv(sumber, chunksize=ukuran_chunk):
+            nilai = df.select_dtypes("number").to_numpy(dtype=float)
+            n = n or n_dari_segitiga(nilai.shape[1])
+            yield dari_segitiga_atas(nilai, n)
+    else:
+        raise ValueError(f"Format penilaian responden tidak dikenal: {format!r} (gunakan .npy atau .csv)")
+
+
+class AkumulatorGrup:
+    """Akumulator agregasi AIJ/AIP yang diisi per chunk responden"""
+
+    def __init__(self, n, metode="AIJ", batas_cr=0.1, buang_tidak_konsisten=False):
+        if metode not in METODE_AGREGASI:
+            raise ValueError(f"Metode agregasi harus salah satu dari {METODE_AGREGASI}")
+        self.n = n
+        self.metode = metode
+        self.batas_cr = batas_cr
+        self.buang_tidak_konsisten = buang_tidak_konsisten
+        # Jumlah log matriks (AIJ) atau jumlah log prioritas (AIP)
+        self.jumlah_log = np.zeros((n, n) if metode == "AIJ" else n)
+        self.n_dipakai = 0
+        self._cr = []
+
+    def tambah(self, matriks):
+        """Tambahkan tumpukan (r, n, n) penilaian responden"""
+        A = tumpuk_matriks(matriks)
+        if A.shape[1] != self.n:
+            raise ValueError(f"Matriks responden berukuran {A.shape[1]} x {A.shape[1]}, seharusnya {self.n} x {self.n}")
+        bobot, _, _, cr = hitung_ahp_batch(A)
+        self._cr.append(cr)
+        if self.buang_tidak_konsisten:
+            konsisten = cr <= self.batas_cr
+            A, bobot = A[konsisten], bobot[konsisten]
+        self.n_dipakai += A.shape[0]
+        if self.metode == "AIJ":
+            self.jumlah_log += np.log(A).sum(axis=0)
+        else:
+            self.jumlah_log += np.log(bobot).sum(axis=0)
+
+    def hasil(self):
+        """Matriks agregat, prioritas kelompok dan ringkasan konsistensi responden
+
+        Untuk AIP, ``matriks`` adalah matriks konsisten w_i / w_j dari
+        prioritas agregat sehingga bisa dipakai di tempat matriks biasa.
+        """
+        if self.n_dipakai == 0:
+            raise ValueError("Tidak ada responden yang bisa diagregasi")
+        rata_log = self.jumlah_log / self.n_dipakai
+        if self.metode == "AIJ":
+            matriks = np.exp(rata_log)
+            bobot, lambda_max, ci, cr = hitung_ahp_batch(matriks)
+            bobot, lambda_max, ci, cr = bobot[0], float(lambda_max[0]), float(ci[0]), float(cr[0])
+        else:
+            bobot = np.exp(rata_log - rata_log.max())
+            bobot /= bobot.sum()
+            matriks = bobot[:, None] / bobot[None, :]
+            lambda_max, ci, cr = float(self.n), 0.0, 0.0
+        cr_responden = np.concatenate(self._cr) if self._cr else np.empty(0)
+        return {
+            "metode": self.metode,
+            "n_responden": cr_responden.size,
+            "n_dipakai": self.n_dipakai,
+            "matriks": matriks,
+            "bobot": bobot,
+            "lambda_max": lambda_max,
+            "ci": ci,
+            "cr": cr,
+            "cr_responden": cr_responden,
+            "tidak_konsisten": np.flatnonzero(cr_responden > self.batas_cr),
+        }
+
+
+def agregasi_grup(sumber, metode="AIJ", n=None, batas_cr=0.1, buang_tidak_konsisten=False,
+                  ukuran_chunk=1000, format=None):
+    """Agregasi penilaian kelompok dari file (lihat ``iter_responden``) atau array (r, n, n)
+
+    Mengembalikan dict dari ``AkumulatorGrup.hasil``.
+    """
+    if isinstance(sumber, np.ndarray):
+        chunks = (sumber[awal:awal + ukuran_chunk] for awal in range(0, sumber.shape[0], ukuran_chunk))
+    else:
+        chunks = iter_responden(sumber, ukuran_chunk, format)
+    akumulator = None
+    for A in chunks:
+        if akumulator is None:
+            if n is not None and A.shape[-1] != n:
+                raise ValueError(f"Matriks responden berukuran {A.shape[-1]} x {A.shape[-1]}, seharusnya {n} x {n}")
+            akumulator = AkumulatorGrup(A.shape[-1], metode, batas_cr, buang_tidak_konsisten)
+        akumulator.tambah(A)
+    if akumulator is None:
+        raise ValueError("File penilaian tidak berisi responden")
+    return akumulator.hasil()
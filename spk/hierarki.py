@@ -0,0 +1,208 @@
+"""AHP bertingkat: tujuan -> kriteria -> subkriteria -> ... -> alternatif.
+
+Setiap simpul menyimpan matriks perbandingan untuk anak-anaknya (simpul
+daun: untuk alternatif). Prioritas lokal dihitung dengan ``hitung_ahp_np``
+dan di-memo per simpul berdasarkan hash isi matriks. Prioritas komposit
+simpul (vektor skor alternatif) = [komposit anak_1 ... anak_k] @ bobot
+lokal, juga disimpan per simpul. Jika satu matriks berubah, hanya simpul
+itu dan leluhurnya sampai akar yang dihitung ulang.
+
+Definisi JSON::
+
+    {"alternatif": ["A", "B", "C"],
+     "nama": "Tujuan",
+     "matriks": [[1, 3], [0.3333, 1]],
+     "anak": [
+        {"nama": "Biaya", "matriks": [2, 4, 2]},
+        {"nama": "Kualitas", "matriks": [3], "anak": [
+            {"nama": "Daya tahan", "matriks": [[1, 2, 5], [0.5, 1, 3], [0.2, 0.3333, 1]]},
+            {"nama": "Tampilan"}]}]}
+
+``matriks`` boleh matriks penuh, daftar segitiga atas (a12, a13, ...,
+a23, ...), atau tidak diisi (semua sama penting).
+"""
+
+import json
+
+import numpy as np
+
+from spk.ahp import hitung_ahp_np
+from spk.cache import kunci_hash
+from spk.grup import dari_segitiga_atas
+
+
+def _matriks_dari(nilai, n):
+    if nilai is None:
+        return np.ones((n, n))
+    A = np.asarray(nilai, dtype=float)
+    if A.ndim == 1:
+        A = dari_segitiga_atas(A, n)[0]
+    if A.shape != (n, n):
+        raise ValueError(f"Matriks harus berukuran {n} x {n}, bukan {A.shape}")
+    return A
+
+
+class Simpul:
+    """Satu simpul hierarki dengan memo prioritas lokal dan komposit"""
+
+    def __init__(self, nama, anak=None, induk=None):
+        self.nama = nama
+        self.anak = list(anak or [])
+        self.induk = induk
+        self.matriks = None
+        self._kunci = None
+        self._lokal = None
+        self._komposit = None
+        self._statistik = None
+
+    @property
+    def daun(self):
+        return not self.anak
+
+    @property
+    def jalur(self):
+        """Nama dari akar sampai simpul ini, dipisah ' / '"""
+        bagian = []
+        simpul = self
+        while simpul is not None:
+            bagian.append(simpul.nama)
+            simpul = simpul.induk
+        return " / ".join(reversed(bagian))
+
+    def atur_matriks(self, matriks):
+        """Ganti matriks perbandingan; jika isinya berubah, batalkan memo sampai akar"""
+        A = np.array(matriks, dtype=float)
+        if A.ndim != 2 or A.shape[0] != A.shape[1]:
+            raise ValueError(f"Matriks {self.jalur} harus persegi")
+        if self.matriks is not None and A.shape != self.matriks.shape:
+            raise ValueError(f"Matriks {self.jalur} harus berukuran {self.matriks.shape[0]} x {self.matriks.shape[1]}")
+        kunci = kunci_hash(A)
+        if kunci == self._kunci:
+            return False
+        A.flags.writeable = False
+        self.matriks = A
+        self._kunci = kunci
+        simpul = self
+        while simpul is not None and simpul._komposit is not None:
+            simpul._komposit = None
+            simpul = simpul.induk
+        return True
+
+    def prioritas_lokal(self):
+        """dict ``bobot``, ``lambda_max``, ``ci``, ``cr`` dari matriks simpul (di-memo per hash)"""
+        if self._lokal is None or self._lokal[0] != self._kunci:
+            _, bobot, lambda_max, ci, cr = hitung_ahp_np(self.matriks)
+            self._lokal = (self._kunci, {"bobot": bobot, "lambda_max": lambda_max, "ci": ci, "cr": cr})
+            if self._statistik is not None:
+                self._statistik["hitung_lokal"] += 1
+        return self._lokal[1]
+
+    def komposit(self):
+        """Skor alternatif menurut simpul ini: prioritas lokal (daun) atau hasil kali matriks anak"""
+        if self._komposit is None:
+            bobot = self.prioritas_lokal()["bobot"]
+            if self.daun:
+                self._komposit = bobot
+            else:
+                self._komposit = np.column_stack([a.komposit() for a in self.anak]) @ bobot
+            if self._statistik is not None:
+                self._statistik["hitung_komposit"] += 1
+        return self._komposit
+
+    def semua(self):
+        """Simpul ini dan semua keturunannya (pre-order)"""
+        yield self
+        for a in self.anak:
+            yield from a.semua()
+
+
+class Hierarki:
+    """Hierarki AHP lengkap dengan daftar alternatif"""
+
+    def __init__(self, akar, alternatif):
+        self.akar = akar
+        self.alternatif = list(alternatif)
+        self.statistik = {"hitung_lokal": 0, "hitung_komposit": 0}
+        self._simpul = {}
+        for simpul in akar.semua():
+            if simpul.jalur in self._simpul:
+                raise ValueError(f"Nama simpul ganda: {simpul.jalur}")
+            self._simpul[simpul.jalur] = simpul
+            simpul._statistik = self.statistik
+            if simpul.matriks is None:
+                simpul.atur_matriks(np.ones((self.ukuran(simpul),) * 2))
+            elif simpul.matriks.shape[0] != self.ukuran(simpul):
+                raise ValueError(f"Matriks {simpul.jalur} harus berukuran {self.ukuran(simpul)} x {self.ukuran(simpul)}")
+
+    def ukuran(self, simpul):
+        """Jumlah elemen yang dibandingkan di simpul: anak, atau alternatif untuk daun"""
+        return len(self.alternatif) if simpul.daun else len(simpul.anak)
+
+    def elemen(self, simpul):
+        """Nama elemen yang dibandingkan di simpul"""
+        return self.alternatif if simpul.daun else [a.nama for a in simpul.anak]
+
+    @property
+    def daftar_jalur(self):
+        return list(self._simpul)
+
+    def simpul(self, jalur):
+        return self._simpul[jalur]
+
+    def atur_matriks(self, jalur, matriks):
+        return self._simpul[jalur].atur_matriks(matriks)
+
+    def skor(self):
+        """Prioritas global alternatif"""
+        return self.akar.komposit()
+
+    def ringkasan(self):
+        """Per simpul: jalur, tingkat, bobot lokal, bobot global (hasil kali bobot lokal di jalurnya) dan CR"""
+        baris = []
+
+        def kunjungi(simpul, tingkat, bobot_lokal, bobot_global):
+            lokal = simpul.prioritas_lokal()
+            baris.append({"jalur": simpul.jalur, "tingkat": tingkat, "bobot_lokal": bobot_lokal,
+                          "bobot_global": bobot_global, "cr": lokal["cr"], "daun": simpul.daun})
+            for a, w in zip(simpul.anak, lokal["bobot"]):
+                kunjungi(a, tingkat + 1, float(w), bobot_global * float(w))
+
+        kunjungi(self.akar, 0, 1.0, 1.0)
+        return baris
+
+    @classmethod
+    def dari_dict(cls, definisi):
+        alternatif = definisi.get("alternatif")
+        if not alternatif or len(alternatif) < 2:
+            raise ValueError("Definisi hierarki membutuhkan minimal 2 'alternatif'")
+
+        def bangun(d, induk):
+            if "nama" not in d:
+                raise ValueError("Setiap simpul membutuhkan 'nama'")
+            simpul = Simpul(str(d["nama"]), induk=induk)
+            simpul.anak = [bangun(a, simpul) for a in d.get("anak", [])]
+            if len(simpul.anak) == 1:
+                raise ValueError(f"Simpul {simpul.jalur} hanya punya satu anak")
+            n = len(simpul.anak) or len(alternatif)
+            if d.get("matriks") is not None:
+                simpul.atur_matriks(_matriks_dari(d["matriks"], n))
+            return simpul
+
+        return cls(bangun(definisi, None), alternatif)
+
+    @classmethod
+    def dari_json(cls, teks):
+        try:
+            definisi = json.loads(teks)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"JSON tidak valid: {e}") from None
+        return cls.dari_dict(definisi)
+
+    def ke_dict(self):
+        def simpan(simpul):
+            d = {"nama": simpul.nama, "matriks": simpul.matriks.tolist()}
+            if simpul.anak:
+                d["anak"] = [simpan(a) for a in simpul.anak]
+            return d
+
+        return {"alternatif": self.alternatif, **simpan(self.akar)}
@@ -0,0 +1,68 @@
+"""Pembuat tabel indeks acak (RI) AHP dengan simulasi Monte Carlo.
+
+RI(n) adalah rata-rata CI dari matriks perbandingan resiprokal acak
+berukuran n x n yang elemennya diambil seragam dari skala Saaty
+{1/9, ..., 1/2, 1, 2, ..., 9}. Hasil disimpan ke ``spk/indeks_acak.json``
+dan dibaca oleh ``spk.ahp.indeks_acak``. Dengan seed yang sama tabel
+yang dihasilkan selalu sama:
+
+    python -m spk.indeks_acak --n-maks 100 --sampel 2000 --seed 0
+"""
+
+import argparse
+import json
+import sys
+
+import numpy as np
+
+from spk.ahp import PATH_INDEKS_ACAK, prioritas_eigen
+
+SKALA_SAATY = np.array([1 / 9, 1 / 8, 1 / 7, 1 / 6, 1 / 5, 1 / 4, 1 / 3, 1 / 2, 1, 2, 3, 4, 5, 6, 7, 8, 9])
+
+
+def matriks_acak(rng, ukuran, n):
+    """Tumpukan (ukuran, n, n) matriks resiprokal acak dengan skala Saaty"""
+    A = np.ones((ukuran, n, n))
+    atas = np.triu_indices(n, 1)
+    nilai = rng.choice(SKALA_SAATY, size=(ukuran, atas[0].size))
+    A[:, atas[0], atas[1]] = nilai
+    A[:, atas[1], atas[0]] = 1.0 / nilai
+    return A
+
+
+def simulasi_ri(n, n_sampel, rng, ukuran_chunk=500):
+    """Rata-rata CI dari ``n_sampel`` matriks acak n x n"""
+    if n <= 2:
+        return 0.0
+    total = 0.0
+    for awal in range(0, n_sampel, ukuran_chunk):
+        ukuran = min(ukuran_chunk, n_sampel - awal)
+        _, lambda_max, _ = prioritas_eigen(matriks_acak(rng, ukuran, n))
+        total += ((lambda_max - n) / (n - 1)).sum()
+    return total / n_sampel
+
+
+def buat_tabel(n_maks=100, n_sampel=2000, seed=0):
+    """Dict {n: RI} untuk n = 1..n_maks; setiap n punya aliran acak sendiri"""
+    rngs = [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(n_maks)]
+    return {n: round(simulasi_ri(n, n_sampel, rngs[n - 1]), 4) for n in range(1, n_maks + 1)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Buat tabel indeks acak (RI) AHP dengan Monte Carlo")
+    parser.add_argument("--n-maks", type=int, default=100, help="Ukuran matriks terbesar (default 100)")
+    parser.add_argument("--sampel", type=int, default=2000, help="Jumlah matriks acak per n (default 2000)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default=PATH_INDEKS_ACAK)
+    args = parser.parse_args(argv)
+
+    tabel = buat_tabel(args.n_maks, args.sampel, args.seed)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump({"n_sampel": args.sampel, "seed": args.seed, "ri": tabel}, f, indent=1)
+        f.write("\n")
+    print(f"RI untuk n = 1..{args.n_maks} ditulis ke {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,315 @@
+"""Peringkat inkremental untuk alternatif yang terus bertambah atau berubah.
+
+``PeringkatInkremental`` menyimpan statistik berjalan per metode sehingga
+menambah satu alternatif cukup O(kriteria):
+
+- SAW: max/min kolom. Skor baris baru dihitung langsung; jika max/min
+  kolom j berubah, hanya kontribusi kolom j yang dihitung ulang.
+- WP: log S per alternatif dan log(total S) berjalan. Peringkat WP sama
+  dengan urutan log S sehingga tidak perlu menghitung ulang yang lain.
+- TOPSIS: jumlah kuadrat dan max/min kolom. Karena pembagi normalisasi
+  berubah setiap ada data baru, skor ditandai kedaluwarsa dan dihitung
+  ulang secara vektor hanya saat diminta.
+
+Top-k disimpan dalam min-heap. Heap dibangun ulang (argpartition) hanya
+jika skor banyak alternatif berubah sekaligus. Perhitungan ulang satu
+kolom penuh hanya terjadi jika nilai ekstrem kolom tersebut hilang karena
+perubahan sel (SAW dan TOPSIS; skor WP tidak bergantung max/min kolom).
+"""
+
+import heapq
+
+import numpy as np
+
+from spk.engine import hitung_log_s, jarak_topsis, mask_benefit, normalisasi_topsis, solusi_ideal
+
+
+class PeringkatInkremental:
+    """Peringkat SAW/WP/TOPSIS yang diperbarui per baris atau per sel"""
+
+    def __init__(self, metode, bobot, tipe, k=10, data=None):
+        metode = metode.upper()
+        if metode not in ("SAW", "WP", "TOPSIS"):
+            raise ValueError(f"Metode inkremental tidak dikenal: {metode!r}")
+        self.metode = metode
+        self.bobot = np.asarray(bobot, dtype=float)
+        self.benefit = mask_benefit(tipe, self.bobot.size)
+        self.w_perbaikan = np.where(self.benefit, self.bobot, -self.bobot)
+        self.k = k
+
+        m = self.bobot.size
+        self.n = 0
+        self._X = np.empty((16, m))
+        # SAW: nilai V, WP: log S, TOPSIS: preferensi (valid jika tidak kedaluwarsa)
+        self._skor = np.empty(16)
+        self.col_max = np.full(m, -np.inf)
+        self.col_min = np.full(m, np.inf)
+        self.sum_kuadrat = np.zeros(m)
+        self.log_total_s = -np.inf
+
+        self._skor_basi = False
+        self._log_total_basi = False
+        self._heap = []
+        self._heap_basi = False
+        self.statistik = {"tambah": 0, "ubah": 0, "hitung_ulang_kolom": 0,
+                          "ekstrem_hilang": 0, "bangun_heap": 0, "hitung_ulang_topsis": 0}
+
+        if data is not None:
+            self.tambah_banyak(data)
+
+    # ---------- penyimpanan ----------
+
+    def _pastikan_kapasitas(self, n_baru):
+        if n_baru <= self._X.shape[0]:
+            return
+        kapasitas = max(n_baru, 2 * self._X.shape[0])
+        X = np.empty((kapasitas, self._X.shape[1]))
+        X[:self.n] = self._X[:self.n]
+        skor = np.empty(kapasitas)
+        skor[:self.n] = self._skor[:self.n]
+        self._X, self._skor = X, skor
+
+    @property
+    def data(self):
+        """View matriks keputusan saat ini (alternatif x kriteria)"""
+        return self._X[:self.n]
+
+    # ---------- kontribusi per metode ----------
+
+    def _kontribusi_saw(self, j, nilai, col_max, col_min):
+        """w_j * r_ij untuk nilai (skalar atau vektor) di kolom j"""
+        nilai = np.asarray(nilai, dtype=float)
+        r = np.zeros_like(nilai)
+        if self.benefit[j]:
+            if col_max > 0:
+                r = nilai / col_max
+        else:
+            np.divide(col_min, nilai, out=r, where=nilai > 0)
+        return self.bobot[j] * r
+
+    def _skor_baris(self, x):
+        if self.metode == "SAW":
+            r = np.zeros_like(x)
+            np.divide(x, self.col_max, out=r, where=self.benefit & (self.col_max > 0))
+            np.divide(self.col_min, x, out=r, where=~self.benefit & (x > 0))
+            return float(r @ self.bobot)
+        if self.metode == "WP":
+            aktif = self.w_perbaikan != 0
+            if np.any(x[aktif] < 0) or np.any((x == 0) & (self.w_perbaikan < 0)):
+                raise ValueError("Nilai WP harus >= 0 dan tidak boleh 0 pada kriteria Cost")
+            with np.errstate(divide="ignore"):
+                return float(np.log(x[aktif]) @ self.w_perbaikan[aktif])
+        return np.nan
+
+    def _geser_ekstrem(self, j, max_lama, min_lama):
+        """Terapkan perubahan max/min kolom j ke skor SAW semua alternatif"""
+        if self.metode != "SAW" or (max_lama == self.col_max[j] and min_lama == self.col_min[j]):
+            return
+        kolom = self._X[:self.n, j]
+        self._skor[:self.n] += (self._kontribusi_saw(j, kolom, self.col_max[j], self.col_min[j])
+                                - self._kontribusi_saw(j, kolom, max_lama, min_lama))
+        self.statistik["hitung_ulang_kolom"] += 1
+        self._heap_basi = True
+
+    # ---------- pembaruan ----------
+
+    def tambah(self, baris):
+        """Tambah satu alternatif, kembalikan indeksnya"""
+        x = np.asarray(baris, dtype=float)
+        if x.shape != self.bobot.shape:
+            raise ValueError(f"Baris harus memiliki {self.bobot.size} kriteria")
+        # Validasi WP dilakukan sebelum statistik diubah
+        skor_x = self._skor_baris(x) if self.metode == "WP" else None
+        self._pastikan_kapasitas(self.n + 1)
+
+        max_lama, min_lama = self.col_max.copy(), self.col_min.copy()
+        np.maximum(self.col_max, x, out=self.col_max)
+        np.minimum(self.col_min, x, out=self.col_min)
+        self.sum_kuadrat += x * x
+        for j in np.flatnonzero((self.col_max != max_lama) | (self.col_min != min_lama)):
+            if self.n > 0:
+                self._geser_ekstrem(j, max_lama[j], min_lama[j])
+
+        i = self.n
+        self._X[i] = x
+        self.n += 1
+        self.statistik["tambah"] += 1
+
+        if self.metode == "SAW":
+            self._skor[i] = self._skor_baris(x)
+        elif self.metode == "WP":
+            self._skor[i] = skor_x
+            self.log_total_s = np.logaddexp(self.log_total_s, skor_x)
+        else:
+            self._skor_basi = True
+            self._heap_basi = True
+        self._dorong_heap(i)
+        return i
+
+    def tambah_banyak(self, data):
+        """Tambah banyak alternatif sekaligus (statistik diperbarui secara vektor)"""
+        X = np.asarray(data, dtype=float)
+        if X.ndim != 2 or X.shape[1] != self.bobot.size:
+            raise ValueError(f"Data harus berukuran (alternatif x {self.bobot.size})")
+        if X.shape[0] == 0:
+            return
+        awal = self.n
+        self._pastikan_kapasitas(self.n + X.shape[0])
+        max_lama, min_lama = self.col_max.copy(), self.col_min.copy()
+        np.maximum(self.col_max, X.max(axis=0), out=self.col_max)
+        np.minimum(self.col_min, X.min(axis=0), out=self.col_min)
+        self.sum_kuadrat += np.einsum("ij,ij->j", X, X)
+        if self.n > 0:
+            for j in np.flatnonzero((self.col_max != max_lama) | (self.col_min != min_lama)):
+                self._geser_ekstrem(j, max_lama[j], min_lama[j])
+
+        self._X[awal:awal + X.shape[0]] = X
+        self.n += X.shape[0]
+        self.statistik["tambah"] += X.shape[0]
+        if self.metode == "SAW":
+            for j in range(X.shape[1]):
+                kontribusi = self._kontribusi_saw(j, X[:, j], self.col_max[j], self.col_min[j])
+                if j == 0:
+                    self._skor[awal:self.n] = kontribusi
+                else:
+                    self._skor[awal:self.n] += kontribusi
+        elif self.metode == "WP":
+            self._skor[awal:self.n] = hitung_log_s(X, self.w_perbaikan)
+            self._log_total_basi = True
+        else:
+            self._skor_basi = True
+        self._heap_basi = True
+
+    def ubah(self, i, j, nilai):
+        """Ubah satu sel matriks keputusan"""
+        if not 0 <= i < self.n:
+            raise IndexError(f"Alternatif {i} tidak ada")
+        if not 0 <= j < self.bobot.size:
+            raise IndexError(f"Kriteria {j} tidak ada")
+        lama = self._X[i, j]
+        nilai = float(nilai)
+        if nilai == lama:
+            return
+        if self.metode == "WP":
+            # Validasi WP dilakukan sebelum statistik diubah
+            x = self._X[i].copy()
+            x[j] = nilai
+            skor_x = self._skor_baris(x)
+        self.statistik["ubah"] += 1
+        max_lama, min_lama = self.col_max[j], self.col_min[j]
+        kolom = self._X[:self.n, j]
+        if self.metode == "SAW":
+            kontribusi_lama = self._kontribusi_saw(j, kolom, max_lama, min_lama)
+
+        kolom[i] = nilai
+        self.sum_kuadrat[j] += nilai * nilai - lama * lama
+        # Skor WP tidak memakai max/min kolom, jadi untuk WP keduanya hanya
+        # batas longgar dan kolom tidak pernah dipindai ulang
+        pindai = self.metode != "WP"
+        if nilai >= max_lama:
+            self.col_max[j] = nilai
+        elif lama == max_lama and pindai:
+            # Nilai ekstrem hilang: satu-satunya kasus yang butuh memindai kolom
+            self.col_max[j] = kolom.max()
+            self.statistik["ekstrem_hilang"] += 1
+        if nilai <= min_lama:
+            self.col_min[j] = nilai
+        elif lama == min_lama and pindai:
+            self.col_min[j] = kolom.min()
+            self.statistik["ekstrem_hilang"] += 1
+
+        if self.metode == "SAW":
+            if self.col_max[j] != max_lama or self.col_min[j] != min_lama:
+                self._skor[:self.n] += self._kontribusi_saw(j, kolom, self.col_max[j], self.col_min[j]) - kontribusi_lama
+                self.statistik["hitung_ulang_kolom"] += 1
+                self._heap_basi = True
+            else:
+                self._skor[i] = self._skor_baris(self._X[i])
+                self._perbarui_heap(i)
+        elif self.metode == "WP":
+            self._skor[i] = skor_x
+            self._log_total_basi = True
+            self._perbarui_heap(i)
+        else:
+            self._skor_basi = True
+            self._heap_basi = True
+
+    def sinkron(self, data):
+        """Samakan dengan matriks baru: sel yang berubah di-``ubah``, baris baru di-``tambah``
+
+        Berguna di Streamlit, di mana setiap rerun menghasilkan matriks utuh.
+        Jika jumlah baris berkurang, semua statistik dibangun ulang.
+        """
+        X = np.asarray(data, dtype=float)
+        if X.shape[0] < self.n or X.shape[1] != self.bobot.size:
+            self.__init__(self.metode, self.bobot, self.benefit, self.k, X)
+            return
+        for i, j in zip(*np.nonzero(X[:self.n] != self.data)):
+            self.ubah(i, j, X[i, j])
+        if X.shape[0] > self.n:
+            self.tambah_banyak(X[self.n:])
+
+    # ---------- hasil ----------
+
+    def _hitung_ulang_topsis(self):
+        X = self.data
+        pembagi = np.sqrt(self.sum_kuadrat)
+        data_weighted = normalisasi_topsis(X, pembagi) * self.bobot
+        a = self.bobot * normalisasi_topsis(self.col_max[None, :], pembagi)[0]
+        b = self.bobot * normalisasi_topsis(self.col_min[None, :], pembagi)[0]
+        ideal_pos, ideal_neg = solusi_ideal(np.maximum(a, b), np.minimum(a, b), self.benefit)
+        self._skor[:self.n] = jarak_topsis(data_weighted, ideal_pos, ideal_neg)[2]
+        self._skor_basi = False
+        self.statistik["hitung_ulang_topsis"] += 1
+
+    def _skor_internal(self):
+        if self._skor_basi:
+            self._hitung_ulang_topsis()
+        return self._skor[:self.n]
+
+    def skor(self):
+        """Skor semua alternatif (SAW: V, WP: V, TOPSIS: preferensi)"""
+        skor = self._skor_internal()
+        if self.metode == "WP":
+            if self._log_total_basi:
+                maks = skor.max()
+                self.log_total_s = maks + np.log(np.exp(skor - maks).sum()) if np.isfinite(maks) else -np.inf
+                self._log_total_basi = False
+            if not np.isfinite(self.log_total_s):
+                return np.zeros(self.n)
+            return np.exp(skor - self.log_total_s)
+        return skor.copy()
+
+    def _dorong_heap(self, i):
+        if self._heap_basi:
+            return
+        entri = (self._skor[i], -i)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entri)
+        elif entri > self._heap[0]:
+            heapq.heapreplace(self._heap, entri)
+
+    def _perbarui_heap(self, i):
+        if any(-e[1] == i for e in self._heap):
+            # Skor anggota heap berubah, urutan heap tidak lagi valid
+            self._heap_basi = True
+        else:
+            self._dorong_heap(i)
+
+    def _bangun_heap(self):
+        skor = self._skor_internal()
+        k = min(self.k, self.n)
+        idx = np.argpartition(-skor, k - 1)[:k] if k < self.n else np.arange(self.n)
+        self._heap = [(skor[i], -int(i)) for i in idx]
+        heapq.heapify(self._heap)
+        self._heap_basi = False
+        self.statistik["bangun_heap"] += 1
+
+    def top_k(self):
+        """k alternatif teratas sebagai list (indeks, skor) dari yang terbaik"""
+        if self.n == 0:
+            return []
+        if self._heap_basi or self._skor_basi:
+            self._bangun_heap()
+        skor = self.skor()
+        return [(-e[1], float(skor[-e[1]])) for e in sorted(self._heap, reverse=True)]
@@ -0,0 +1,218 @@
+"""Mode konsensus: SAW, WP, TOPSIS dan AHP pada satu matriks keputusan.
+
+Keempat metode dijalankan bersamaan di worker pool, lalu peringkatnya
+dibandingkan dengan korelasi Spearman/Kendall dan digabung dengan Borda
+dan Copeland. Operasi NumPy di setiap metode melepas GIL, jadi
+ThreadPoolExecutor sudah paralel tanpa menyalin matriks ke proses lain;
+ProcessPoolExecutor tersedia lewat ``eksekutor="proses"``.
+
+AHP dijalankan dari matriks keputusan: perbandingan alternatif per
+kriteria adalah rasio nilai (x_i / x_j untuk Benefit, x_j / x_i untuk
+Cost) dan perbandingan kriteria adalah rasio bobot.
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from spk.ahp import hitung_ahp_batch
+from spk.engine import _siapkan, hitung_saw_np, hitung_topsis_np, hitung_wp_np
+
+METODE_KONSENSUS = ("SAW", "WP", "TOPSIS", "AHP")
+
+# Di atas batas ini matriks rasio (kriteria x n x n) terlalu besar; eigenvektor
+# matriks rasio yang konsisten sama dengan kolom dibagi jumlahnya, jadi
+# langsung dihitung tanpa membentuk matriks
+BATAS_MATRIKS_AHP = 100
+# Copeland membandingkan semua pasangan alternatif (O(n^2))
+BATAS_COPELAND = 5000
+
+
+def hitung_ahp_rasio(data, bobot, tipe):
+    """Skor AHP dengan perbandingan berpasangan dari rasio nilai dan rasio bobot
+
+    Mengembalikan (bobot_kriteria, prioritas_alternatif (kriteria x alternatif), skor).
+    """
+    X, w, benefit = _siapkan(data, bobot, tipe)
+    if np.any(X <= 0) or np.any(w <= 0):
+        raise ValueError("AHP dari rasio membutuhkan semua nilai matriks keputusan dan bobot > 0")
+    nilai = np.where(benefit, X, 1.0 / X).T
+    if X.shape[0] <= BATAS_MATRIKS_AHP:
+        prioritas, _, _, _ = hitung_ahp_batch(nilai[:, :, None] / nilai[:, None, :])
+        bobot_kriteria = hitung_ahp_batch(w[:, None] / w[None, :])[0][0]
+    else:
+        prioritas = nilai / nilai.sum(axis=1, keepdims=True)
+        bobot_kriteria = w / w.sum()
+    return bobot_kriteria, prioritas, bobot_kriteria @ prioritas
+
+
+_SKOR = {
+    "SAW": lambda data, bobot, tipe: hitung_saw_np(data, bobot, tipe)[1],
+    "WP": lambda data, bobot, tipe: hitung_wp_np(data, bobot, tipe)[2],
+    "TOPSIS": lambda data, bobot, tipe: hitung_topsis_np(data, bobot, tipe)[6],
+    "AHP": lambda data, bobot, tipe: hitung_ahp_rasio(data, bobot, tipe)[2],
+}
+
+
+def _jalankan(metode, data, bobot, tipe):
+    """Skor satu metode beserta lama hitungnya; error dikembalikan sebagai pesan"""
+    t0 = time.perf_counter()
+    try:
+        skor = _SKOR[metode](data, bobot, tipe)
+    except ValueError as e:
+        return None, str(e), time.perf_counter() - t0
+    return skor, None, time.perf_counter() - t0
+
+
+def peringkat_rata(skor):
+    """Peringkat (1 = terbaik) dengan peringkat rata-rata untuk skor yang sama"""
+    skor = np.asarray(skor, dtype=float)
+    urutan = np.argsort(-skor, kind="stable")
+    terurut = -skor[urutan]
+    awal_grup = np.flatnonzero(np.r_[True, terurut[1:] != terurut[:-1]])
+    ukuran = np.diff(np.r_[awal_grup, skor.size])
+    rata = awal_grup + (ukuran + 1) / 2.0
+    hasil = np.empty(skor.size)
+    hasil[urutan] = np.repeat(rata, ukuran)
+    return hasil
+
+
+def spearman(peringkat):
+    """Matriks korelasi Spearman antar metode dari peringkat (metode x alternatif)"""
+    P = np.asarray(peringkat, dtype=float)
+    if P.shape[1] < 2:
+        return np.ones((P.shape[0], P.shape[0]))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        hasil = np.atleast_2d(np.corrcoef(P))
+    # Metode yang semua skornya sama tidak punya korelasi dengan metode lain, tetapi tetap 1 dengan dirinya
+    np.fill_diagonal(hasil, 1.0)
+    return hasil
+
+
+def _jumlah_inversi(y):
+    """Jumlah pasangan i < j dengan y_i > y_j (merge sort bottom-up tervektorisasi)"""
+    # Nilai dipadatkan ke 0..n-1 agar kunci per pasangan blok tidak tumpang tindih
+    a = np.unique(np.asarray(y), return_inverse=True)[1].astype(np.int64).ravel()
+    n = a.size
+    posisi = np.arange(n)
+    total = 0
+    lebar = 1
+    while lebar < n:
+        pasangan = posisi // (2 * lebar)
+        kanan = (posisi // lebar) % 2 == 1
+        # Setiap blok sudah terurut, jadi argsort stabil (timsort) cukup menggabungkan run.
+        # Elemen kanan di posisi gabungan p dengan urutan r dalam bloknya didahului
+        # p - r elemen kiri yang <= dirinya; sisanya (lebar - (p - r)) membentuk inversi.
+        urutan = np.argsort(pasangan * n + a, kind="stable")
+        gabung = np.empty(n, dtype=np.int64)
+        gabung[urutan] = posisi
+        p = gabung[kanan] - pasangan[kanan] * 2 * lebar
+        r = posisi[kanan] - (2 * pasangan[kanan] + 1) * lebar
+        total += int((lebar - (p - r)).sum())
+        a = a[urutan]
+        lebar *= 2
+    return total
+
+
+def _jumlah_seri(nilai_terurut):
+    """Jumlah pasangan bernilai sama dari array terurut: sum t(t-1)/2"""
+    if nilai_terurut.size == 0:
+        return 0
+    batas = np.flatnonzero(np.r_[True, nilai_terurut[1:] != nilai_terurut[:-1], True])
+    t = np.diff(batas)
+    return int((t * (t - 1) // 2).sum())
+
+
+def kendall_tau(x, y):
+    """Kendall tau-b dalam O(n log n) (algoritma Knight)"""
+    x = np.unique(np.asarray(x), return_inverse=True)[1]
+    y = np.unique(np.asarray(y), return_inverse=True)[1]
+    n = x.size
+    total = n * (n - 1) // 2
+    urutan = np.lexsort((y, x))
+    x, y = x[urutan], y[urutan]
+    seri_x = _jumlah_seri(x)
+    # Seri bersama: pasangan (x, y) identik
+    seri_xy = _jumlah_seri(x * (y.max(initial=0) + 1) + y)
+    seri_y = _jumlah_seri(np.sort(y))
+    diskordan = _jumlah_inversi(y)
+    penyebut = np.sqrt(float(total - seri_x) * float(total - seri_y))
+    if penyebut == 0:
+        return float("nan")
+    return (total - seri_x - seri_y + seri_xy - 2 * diskordan) / penyebut
+
+
+def kendall(peringkat, n_worker=None):
+    """Matriks Kendall tau-b antar metode dari peringkat (metode x alternatif)
+
+    Setiap pasangan metode dihitung di thread terpisah (pengurutan NumPy melepas GIL).
+    """
+    P = np.asarray(peringkat)
+    m = P.shape[0]
+    hasil = np.eye(m)
+    pasangan = [(a, b) for a in range(m) for b in range(a + 1, m)]
+    if not pasangan:
+        return hasil
+    with ThreadPoolExecutor(max_workers=n_worker or len(pasangan)) as pool:
+        for (a, b), tau in zip(pasangan, pool.map(lambda ab: kendall_tau(P[ab[0]], P[ab[1]]), pasangan)):
+            hasil[a, b] = hasil[b, a] = tau
+    return hasil
+
+
+def borda(peringkat):
+    """Poin Borda: setiap metode memberi n - peringkat poin, lalu dijumlahkan"""
+    P = np.asarray(peringkat, dtype=float)
+    return (P.shape[1] - P).sum(axis=0)
+
+
+def copeland(peringkat, ukuran_blok=512):
+    """Skor Copeland: jumlah menang - kalah head-to-head (mayoritas metode) per alternatif"""
+    P = np.asarray(peringkat, dtype=float)
+    n = P.shape[1]
+    skor = np.zeros(n)
+    for awal in range(0, n, ukuran_blok):
+        blok = P[:, awal:awal + ukuran_blok]
+        # suara[i, j] > 0 jika lebih banyak metode menempatkan i di atas j
+        suara = np.sign(P[:, None, :] - blok[:, :, None]).sum(axis=0)
+        skor[awal:awal + ukuran_blok] = np.sign(suara).sum(axis=1)
+    return skor
+
+
+def jalankan_konsensus(data, bobot, tipe, metode=METODE_KONSENSUS, n_worker=None, eksekutor="thread"):
+    """Jalankan beberapa metode bersamaan lalu bandingkan dan gabungkan peringkatnya
+
+    Mengembalikan dict berisi ``skor`` dan ``peringkat`` (per metode yang
+    berhasil), ``error`` (pesan per metode yang gagal), ``waktu`` (lama
+    hitung per metode), ``waktu_total``, ``metode`` (urutan baris matriks
+    korelasi), ``spearman``, ``kendall``, ``borda`` dan ``copeland``
+    (None jika alternatif lebih dari ``BATAS_COPELAND``).
+    """
+    data = np.asarray(data, dtype=float)
+    metode = [m.upper() for m in metode]
+    for m in metode:
+        if m not in _SKOR:
+            raise ValueError(f"Metode tidak dikenal: {m!r}")
+    Pool = ThreadPoolExecutor if eksekutor == "thread" else ProcessPoolExecutor
+
+    t0 = time.perf_counter()
+    with Pool(max_workers=n_worker or len(metode)) as pool:
+        futures = {m: pool.submit(_jalankan, m, data, bobot, tipe) for m in metode}
+        hasil_metode = {m: f.result() for m, f in futures.items()}
+    waktu_total = time.perf_counter() - t0
+
+    skor = {m: s for m, (s, err, _) in hasil_metode.items() if err is None}
+    berhasil = list(skor)
+    P = np.array([peringkat_rata(skor[m]) for m in berhasil]).reshape(len(berhasil), data.shape[0])
+    return {
+        "metode": berhasil,
+        "skor": skor,
+        "peringkat": {m: P[i] for i, m in enumerate(berhasil)},
+        "error": {m: err for m, (_, err, _) in hasil_metode.items() if err is not None},
+        "waktu": {m: w for m, (_, _, w) in hasil_metode.items()},
+        "waktu_total": waktu_total,
+        "spearman": spearman(P) if berhasil else None,
+        "kendall": kendall(P, n_worker) if berhasil else None,
+        "borda": borda(P) if berhasil else None,
+        "copeland": copeland(P) if berhasil and data.shape[0] <= BATAS_COPELAND else None,
+    }
@@ -0,0 +1,411 @@
+"""Layanan HTTP/JSON (asyncio) untuk SAW, WP, TOPSIS dan AHP tanpa Streamlit.
+
+Menjalankan:
+    python -m spk.layanan --port 8765 --jendela-ms 5 --proses 2
+
+Endpoint:
+    POST /hitung   {"metode": "TOPSIS", "matriks": [[...], ...], "bobot": [...],
+                    "tipe": ["Benefit", "Cost", ...], "top_k": 10}
+                   AHP: {"metode": "AHP", "matriks": matriks perbandingan n x n}
+    GET  /metrik   latensi p50/p99, throughput dan statistik batch
+    GET  /sehat
+
+Permintaan kecil yang datang bersamaan digabung: permintaan dengan metode
+dan ukuran matriks yang sama dikumpulkan selama ``jendela`` detik (atau
+sampai ``maks_batch`` permintaan), ditumpuk menjadi array 3-D dan dihitung
+sekaligus dengan ``hitung_skor_tumpukan`` / ``hitung_ahp_batch``. Batch
+yang besar (lebih dari ``batas_inline`` sel) dihitung dan respons JSON-nya
+di-encode di ProcessPoolExecutor; body yang besar juga di-parse di sana,
+sehingga event loop tidak terblokir oleh perhitungan maupun JSON.
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+
+import numpy as np
+
+from spk.ahp import hitung_ahp_batch, indeks_acak
+from spk.engine import hitung_skor_tumpukan, peringkat
+from spk.topk import top_k
+
+METODE_LAYANAN = ("SAW", "WP", "TOPSIS", "AHP")
+
+JENDELA_DETIK = 0.005
+MAKS_BATCH = 256
+# Batch dengan sel (matriks x alternatif x kriteria) lebih dari ini dihitung di process pool
+BATAS_INLINE = 200_000
+# Body lebih besar dari ini di-parse dan divalidasi di process pool
+BATAS_JSON_INLINE = 1 << 20
+BATAS_BODY = 256 << 20
+# Jumlah latensi terakhir yang dipakai untuk p50/p99 dan jendela throughput
+UKURAN_RIWAYAT = 10_000
+JENDELA_THROUGHPUT = 60.0
+
+
+class GalatPermintaan(ValueError):
+    """Permintaan tidak valid (HTTP 400)"""
+
+
+def _parse_tipe(tipe, n_krit):
+    if not isinstance(tipe, list) or len(tipe) != n_krit:
+        raise GalatPermintaan(f"'tipe' harus berisi {n_krit} nilai Benefit/Cost")
+    benefit = []
+    for t in tipe:
+        t = str(t).strip().lower()
+        if t in ("b", "benefit"):
+            benefit.append(True)
+        elif t in ("c", "cost"):
+            benefit.append(False)
+        else:
+            raise GalatPermintaan(f"Tipe tidak dikenal: {t!r} (gunakan Benefit/Cost atau B/C)")
+    return np.array(benefit)
+
+
+def siapkan_permintaan(isi):
+    """Validasi body /hitung dan ubah menjadi dict berisi array NumPy
+
+    Validasi dilakukan per permintaan agar satu permintaan yang salah tidak
+    menggagalkan batch tempat ia digabung.
+    """
+    if not isinstance(isi, dict):
+        raise GalatPermintaan("Body harus berupa objek JSON")
+    metode = str(isi.get("metode", "")).upper()
+    if metode not in METODE_LAYANAN:
+        raise GalatPermintaan(f"'metode' harus salah satu dari {', '.join(METODE_LAYANAN)}")
+    try:
+        X = np.array(isi.get("matriks"), dtype=float)
+    except (TypeError, ValueError):
+        raise GalatPermintaan("'matriks' harus berupa array 2 dimensi berisi angka") from None
+    if X.ndim != 2 or X.shape[0] < 1 or X.shape[1] < 1 or not np.all(np.isfinite(X)):
+        raise GalatPermintaan("'matriks' harus berupa array 2 dimensi berisi angka hingga")
+
+    k = isi.get("top_k")
+    if k is not None and (isinstance(k, bool) or not isinstance(k, int) or k < 1):
+        raise GalatPermintaan("'top_k' harus bilangan bulat >= 1")
+    permintaan = {"metode": metode, "matriks": X, "top_k": k}
+
+    if metode == "AHP":
+        n = X.shape[0]
+        if X.shape != (n, n) or n < 2 or np.any(X <= 0):
+            raise GalatPermintaan("Matriks AHP harus persegi (n >= 2) dengan semua elemen > 0")
+        try:
+            indeks_acak(n)
+        except ValueError as e:
+            raise GalatPermintaan(str(e)) from None
+        return permintaan
+
+    n_krit = X.shape[1]
+    try:
+        bobot = np.array(isi.get("bobot"), dtype=float)
+    except (TypeError, ValueError):
+        raise GalatPermintaan("'bobot' harus berupa daftar angka") from None
+    if bobot.shape != (n_krit,) or not np.all(np.isfinite(bobot)):
+        raise GalatPermintaan(f"'bobot' harus berisi {n_krit} angka")
+    benefit = _parse_tipe(isi.get("tipe"), n_krit)
+    if metode == "WP":
+        if np.any(X < 0):
+            raise GalatPermintaan("Metode WP membutuhkan nilai matriks keputusan >= 0")
+        if np.any((X == 0) & ~benefit & (bobot != 0)):
+            raise GalatPermintaan("Nilai 0 tidak boleh ada pada kriteria Cost (pembagian dengan nol)")
+    permintaan.update(bobot=bobot, benefit=benefit)
+    return permintaan
+
+
+def baca_permintaan(body):
+    """json.loads + ``siapkan_permintaan``; untuk body besar dijalankan di process pool"""
+    return siapkan_permintaan(json.loads(body))
+
+
+def jawaban_skor(skor, k):
+    """Body respons untuk satu skor: semua skor dan peringkat, atau hanya k teratas"""
+    if k is None:
+        return {"n_alt": int(skor.size), "skor": skor.tolist(), "peringkat": peringkat(skor).tolist()}
+    idx = top_k(skor, k)
+    return {"n_alt": int(skor.size), "teratas": [{"indeks": i, "skor": s} for i, s in zip(idx.tolist(), skor[idx].tolist())]}
+
+
+def hitung_batch(metode, matriks, bobot=None, benefit=None, daftar_top_k=None):
+    """Hitung satu batch tumpukan (k, n, m); mengembalikan list body respons per permintaan"""
+    if metode == "AHP":
+        bobot_ahp, lambda_max, ci, cr = hitung_ahp_batch(matriks)
+        return [{"bobot": bobot_ahp[i].tolist(), "lambda_max": float(lambda_max[i]), "ci": float(ci[i]),
+                 "cr": float(cr[i])} for i in range(matriks.shape[0])]
+    skor = hitung_skor_tumpukan(metode, matriks, bobot, benefit)
+    return [jawaban_skor(skor[i], daftar_top_k[i] if daftar_top_k else None) for i in range(skor.shape[0])]
+
+
+def hitung_batch_json(*args):
+    """``hitung_batch`` yang langsung meng-encode JSON, agar encoding respons besar ikut di process pool"""
+    return [json.dumps(jawaban).encode() for jawaban in hitung_batch(*args)]
+
+
+class Metrik:
+    """Latensi, throughput dan statistik batch layanan"""
+
+    def __init__(self, ukuran_riwayat=UKURAN_RIWAYAT):
+        self.mulai = time.monotonic()
+        self.latensi = deque(maxlen=ukuran_riwayat)
+        self.selesai = deque(maxlen=ukuran_riwayat)
+        self.jumlah = {"permintaan": 0, "error": 0, "batch": 0, "batch_proses": 0}
+        self.ukuran_batch = {}
+        self.per_metode = {}
+
+    def catat_permintaan(self, latensi, metode=None, error=False):
+        self.latensi.append(latensi)
+        self.selesai.append(time.monotonic())
+        self.jumlah["permintaan"] += 1
+        self.jumlah["error"] += bool(error)
+        if metode:
+            self.per_metode[metode] = self.per_metode.get(metode, 0) + 1
+
+    def catat_batch(self, ukuran, di_proses):
+        self.jumlah["batch"] += 1
+        self.jumlah["batch_proses"] += bool(di_proses)
+        self.ukuran_batch[ukuran] = self.ukuran_batch.get(ukuran, 0) + 1
+
+    def ringkasan(self):
+        sekarang = time.monotonic()
+        latensi = np.fromiter(self.latensi, dtype=float)
+        jendela = min(JENDELA_THROUGHPUT, sekarang - self.mulai)
+        baru = sum(1 for t in self.selesai if sekarang - t <= jendela)
+        n_batch = self.jumlah["batch"]
+        return {
+            **self.jumlah,
+            "uptime_detik": sekarang - self.mulai,
+            "p50_ms": float(np.percentile(latensi, 50) * 1000) if latensi.size else None,
+            "p99_ms": float(np.percentile(latensi, 99) * 1000) if latensi.size else None,
+            "maks_ms": float(latensi.max() * 1000) if latensi.size else None,
+            "throughput_per_detik": baru / jendela if jendela > 0 else 0.0,
+            "rata_ukuran_batch": sum(u * n for u, n in self.ukuran_batch.items()) / n_batch if n_batch else None,
+            "ukuran_batch": {str(u): n for u, n in sorted(self.ukuran_batch.items())},
+            "per_metode": dict(self.per_metode),
+        }
+
+
+class PenggabungBatch:
+    """Kumpulkan permintaan bermetode dan berukuran sama selama jendela waktu, lalu hitung sekaligus"""
+
+    def __init__(self, metrik, jendela=JENDELA_DETIK, maks_batch=MAKS_BATCH, batas_inline=BATAS_INLINE, n_proses=None):
+        self.metrik = metrik
+        self.jendela = jendela
+        self.maks_batch = maks_batch
+        self.batas_inline = batas_inline
+        self.n_proses = n_proses
+        self._antrean = {}
+        self._timer = {}
+        self._pool = None
+        self._tugas = set()
+
+    def executor(self):
+        if self._pool is None:
+            # Worker hasil fork akan mewarisi socket server dan menahan port setelah
+            # server mati; forkserver/spawn memulai worker tanpa file descriptor itu
+            metode_start = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self._pool = ProcessPoolExecutor(max_workers=self.n_proses,
+                                             mp_context=multiprocessing.get_context(metode_start))
+        return self._pool
+
+    async def jalankan(self, fungsi, *args):
+        """Jalankan ``fungsi(*args)`` di process pool
+
+        Pool yang rusak (worker mati, mis. kehabisan memori) dibuang agar
+        batch berikutnya membuat pool baru, bukan gagal terus sampai restart.
+        """
+        pool = self.executor()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, fungsi, *args)
+        except BrokenProcessPool:
+            if self._pool is pool:
+                self._pool = None
+                pool.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    def ajukan(self, permintaan):
+        """Masukkan permintaan ke antrean; mengembalikan future berisi body respons"""
+        loop = asyncio.get_running_loop()
+        kunci = (permintaan["metode"],) + permintaan["matriks"].shape
+        future = loop.create_future()
+        antrean = self._antrean.setdefault(kunci, [])
+        antrean.append((permintaan, future))
+        if len(antrean) >= self.maks_batch:
+            self._kirim(kunci)
+        elif kunci not in self._timer:
+            self._timer[kunci] = loop.call_later(self.jendela, self._kirim, kunci)
+        return future
+
+    def _kirim(self, kunci):
+        timer = self._timer.pop(kunci, None)
+        if timer is not None:
+            timer.cancel()
+        isi = self._antrean.pop(kunci, None)
+        if isi:
+            tugas = asyncio.get_running_loop().create_task(self._proses(isi))
+            # Simpan referensi agar task tidak dibersihkan GC sebelum selesai
+            self._tugas.add(tugas)
+            tugas.add_done_callback(self._tugas.discard)
+
+    async def _proses(self, isi):
+        daftar = [p for p, _ in isi]
+        metode = daftar[0]["metode"]
+        matriks = np.stack([p["matriks"] for p in daftar])
+        args = (metode, matriks)
+        if metode != "AHP":
+            args += (np.stack([p["bobot"] for p in daftar]), np.stack([p["benefit"] for p in daftar]),
+                     [p["top_k"] for p in daftar])
+        di_proses = matriks.size > self.batas_inline
+        try:
+            if di_proses:
+                hasil = await self.jalankan(hitung_batch_json, *args)
+            else:
+                hasil = hitung_batch(*args)
+        except Exception as e:  # noqa: BLE001 - galat apa pun diteruskan ke setiap permintaan di batch
+            for _, future in isi:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        self.metrik.catat_batch(len(isi), di_proses)
+
+        for (_, future), jawaban in zip(isi, hasil):
+            if not future.done():
+                future.set_result(jawaban)
+
+    def tutup(self):
+        for timer in self._timer.values():
+            timer.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+
+
+class Layanan:
+    """Server HTTP/1.1 minimal (keep-alive, JSON) di atas asyncio.start_server"""
+
+    def __init__(self, jendela=JENDELA_DETIK, maks_batch=MAKS_BATCH, batas_inline=BATAS_INLINE, n_proses=None):
+        self.metrik = Metrik()
+        self.batch = PenggabungBatch(self.metrik, jendela, maks_batch, batas_inline, n_proses)
+
+    async def _rute(self, metode_http, path, body):
+        if path == "/hitung" and metode_http == "POST":
+            if len(body) > BATAS_JSON_INLINE:
+                permintaan = await self.batch.jalankan(baca_permintaan, body)
+            else:
+                permintaan = baca_permintaan(body)
+            return HTTPStatus.OK, await self.batch.ajukan(permintaan), permintaan["metode"]
+        if path == "/metrik" and metode_http == "GET":
+            return HTTPStatus.OK, self.metrik.ringkasan(), None
+        if path == "/sehat" and metode_http == "GET":
+            return HTTPStatus.OK, {"status": "ok"}, None
+        if path in ("/hitung", "/metrik", "/sehat"):
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": f"{metode_http} tidak didukung untuk {path}"}, None
+        return HTTPStatus.NOT_FOUND, {"error": f"Path tidak dikenal: {path}"}, None
+
+    async def tangani(self, reader, writer):
+        """Layani satu koneksi; beberapa permintaan berurutan per koneksi (keep-alive)"""
+        try:
+            while True:
+                baris = await reader.readline()
+                if not baris:
+                    break
+                t0 = time.perf_counter()
+                try:
+                    metode_http, target, versi = baris.decode("latin-1").split()
+                except ValueError:
+                    await self._tulis(writer, HTTPStatus.BAD_REQUEST, {"error": "Baris permintaan tidak valid"}, False)
+                    break
+                header = {}
+                while True:
+                    h = await reader.readline()
+                    if h in (b"\r\n", b"\n", b""):
+                        break
+                    nama, _, nilai = h.decode("latin-1").partition(":")
+                    header[nama.strip().lower()] = nilai.strip()
+                try:
+                    panjang = int(header.get("content-length") or 0)
+                except ValueError:
+                    panjang = -1
+                if panjang < 0:
+                    await self._tulis(writer, HTTPStatus.BAD_REQUEST, {"error": "Content-Length tidak valid"}, False)
+                    break
+                if panjang > BATAS_BODY:
+                    await self._tulis(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "Body terlalu besar"}, False)
+                    break
+                body = await reader.readexactly(panjang) if panjang else b""
+                tetap = header.get("connection", "").lower() != "close" and versi == "HTTP/1.1"
+
+                metode = None
+                try:
+                    status, isi, metode = await self._rute(metode_http, target.split("?", 1)[0], body)
+                except json.JSONDecodeError as e:
+                    status, isi = HTTPStatus.BAD_REQUEST, {"error": f"JSON tidak valid: {e}"}
+                except ValueError as e:
+                    status, isi = HTTPStatus.BAD_REQUEST, {"error": str(e)}
+                except Exception as e:  # noqa: BLE001 - server tetap hidup, galat dilaporkan ke klien
+                    status, isi = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"{type(e).__name__}: {e}"}
+                await self._tulis(writer, status, isi, tetap)
+                if target.startswith("/hitung"):
+                    self.metrik.catat_permintaan(time.perf_counter() - t0, metode, error=status != HTTPStatus.OK)
+                if not tetap:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _tulis(self, writer, status, isi, tetap):
+        # Respons dari process pool sudah berupa bytes JSON
+        body = isi if isinstance(isi, bytes) else json.dumps(isi).encode()
+        writer.write(
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if tetap else 'close'}\r\n\r\n".encode("latin-1") + body
+        )
+        await writer.drain()
+
+    async def mulai(self, host="127.0.0.1", port=8765):
+        """Buka server; mengembalikan objek asyncio.Server"""
+        return await asyncio.start_server(self.tangani, host, port)
+
+    def tutup(self):
+        self.batch.tutup()
+
+
+async def _jalankan(args):
+    layanan = Layanan(args.jendela_ms / 1000, args.maks_batch, args.batas_inline, args.proses)
+    server = await layanan.mulai(args.host, args.port)
+    alamat = ", ".join(str(s.getsockname()) for s in server.sockets)
+    print(f"Layanan SPK berjalan di {alamat} (jendela batch {args.jendela_ms} ms)")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        layanan.tutup()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Layanan HTTP/JSON SAW/WP/TOPSIS/AHP dengan penggabungan batch")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--jendela-ms", type=float, default=JENDELA_DETIK * 1000,
+                        help=f"Lama menunggu permintaan lain untuk digabung (default {JENDELA_DETIK * 1000:g} ms)")
+    parser.add_argument("--maks-batch", type=int, default=MAKS_BATCH, help=f"Permintaan per batch (default {MAKS_BATCH})")
+    parser.add_argument("--batas-inline", type=int, default=BATAS_INLINE,
+                        help=f"Sel per batch di atas ini dihitung di process pool (default {BATAS_INLINE:,})")
+    parser.add_argument("--proses", type=int, help="Jumlah proses worker (default jumlah CPU)")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_jalankan(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
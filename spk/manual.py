@@ -0,0 +1,139 @@
+"""Implementasi manual (list of lists) metode SAW, WP, AHP dan TOPSIS.
+
+Fungsi-fungsi ini adalah acuan perhitungan langkah demi langkah yang
+ditampilkan di app.py dan dipakai sebagai pembanding untuk mesin numerik
+di ``spk.engine``.
+"""
+
+from spk.ahp import indeks_acak
+
+def hitung_saw(data, bobot, tipe):
+    """Implementasi manual metode SAW
+    
+    Step 1: Normalisasi matriks X menjadi matriks R
+    Step 2: Hitung nilai preferensi V dengan mengalikan R dengan bobot
+    """
+    n_alt, n_krit = len(data), len(data[0])
+    
+    # STEP 1: Normalisasi matriks X ke matriks R
+    # Rumus normalisasi:
+    # - Benefit: r_ij = x_ij / max(x_ij)
+    # - Cost: r_ij = min(x_ij) / x_ij
+    
+    matriks_r = [[0 for _ in range(n_krit)] for _ in range(n_alt)]
+    
+    for j in range(n_krit):
+        col = [data[i][j] for i in range(n_alt)]
+        if tipe[j] == "Benefit":
+            max_val = max(col)
+            for i in range(n_alt):
+                matriks_r[i][j] = data[i][j] / max_val if max_val > 0 else 0
+        else:  # Cost
+            min_val = min(col)
+            for i in range(n_alt):
+                matriks_r[i][j] = min_val / data[i][j] if data[i][j] > 0 else 0
+    
+    # STEP 2: Hitung nilai preferensi V
+    # V_i = Σ (w_j * r_ij)
+
+    nilai_v = []
+    for i in range(n_alt):
+        v = 0
+        for j in range(n_krit):
+            v += bobot[j] * matriks_r[i][j]
+        nilai_v.append(v)
+    
+    return matriks_r, nilai_v
+
+def hitung_wp(data, bobot, tipe):
+    """Implementasi manual metode WP"""
+    n_alt, n_krit = len(data), len(data[0])
+    
+    # Perbaikan bobot (cost = negatif)
+    w_perbaikan = []
+    for j in range(n_krit):
+        if tipe[j] == "Cost":
+            w_perbaikan.append(-bobot[j])
+        else:
+            w_perbaikan.append(bobot[j])
+    
+    # Hitung vektor S
+    vektor_s = []
+    for i in range(n_alt):
+        s = 1
+        for j in range(n_krit):
+            s *= data[i][j] ** w_perbaikan[j]
+        vektor_s.append(s)
+    
+    # Hitung vektor V
+    total_s = sum(vektor_s)
+    vektor_v = [s / total_s if total_s > 0 else 0 for s in vektor_s]
+    
+    return w_perbaikan, vektor_s, vektor_v
+
+def hitung_ahp(matrix):
+    """Implementasi manual metode AHP"""
+    n = len(matrix)
+    
+    # Normalisasi matriks
+    col_sums = [sum(matrix[i][j] for i in range(n)) for j in range(n)]
+    matrix_norm = [[matrix[i][j] / col_sums[j] if col_sums[j] > 0 else 0 
+                    for j in range(n)] for i in range(n)]
+    
+    # Hitung bobot (rata-rata baris)
+    bobot = [sum(matrix_norm[i]) / n for i in range(n)]
+    
+    # Hitung lambda max
+    weighted_sum = [sum(matrix[i][j] * bobot[j] for j in range(n)) for i in range(n)]
+    lambda_vals = [weighted_sum[i] / bobot[i] if bobot[i] > 0 else 0 for i in range(n)]
+    lambda_max = sum(lambda_vals) / n
+    
+    # Hitung CI dan CR
+    ci = (lambda_max - n) / (n - 1) if n > 1 else 0
+    ri = indeks_acak(n)
+    cr = ci / ri if ri > 0 else 0
+    
+    return matrix_norm, bobot, lambda_max, ci, cr
+
+def hitung_topsis(data, bobot, tipe):
+    """Implementasi manual metode TOPSIS"""
+    n_alt, n_krit = len(data), len(data[0])
+    
+    # Normalisasi
+    data_norm = [[0 for _ in range(n_krit)] for _ in range(n_alt)]
+    for j in range(n_krit):
+        col = [data[i][j] for i in range(n_alt)]
+        sum_kuadrat = sum(x ** 2 for x in col)
+        pembagi = sum_kuadrat ** 0.5
+        for i in range(n_alt):
+            data_norm[i][j] = data[i][j] / pembagi if pembagi > 0 else 0
+    
+    # Terbobot
+    data_weighted = [[data_norm[i][j] * bobot[j] for j in range(n_krit)] for i in range(n_alt)]
+    
+    # Solusi ideal
+    ideal_pos = []
+    ideal_neg = []
+    for j in range(n_krit):
+        col = [data_weighted[i][j] for i in range(n_alt)]
+        if tipe[j] == "Benefit":
+            ideal_pos.append(max(col))
+            ideal_neg.append(min(col))
+        else:
+            ideal_pos.append(min(col))
+            ideal_neg.append(max(col))
+    
+    # Jarak
+    d_pos = []
+    d_neg = []
+    for i in range(n_alt):
+        dp = sum((data_weighted[i][j] - ideal_pos[j]) ** 2 for j in range(n_krit)) ** 0.5
+        dn = sum((data_weighted[i][j] - ideal_neg[j]) ** 2 for j in range(n_krit)) ** 0.5
+        d_pos.append(dp)
+        d_neg.append(dn)
+    
+    # Preferensi
+    preferensi = [d_neg[i] / (d_pos[i] + d_neg[i]) if (d_pos[i] + d_neg[i]) > 0 else 0 
+                  for i in range(n_alt)]
+    
+    return data_norm, data_weighted, ideal_pos, ideal_neg, d_pos, d_neg, preferensi
@@ -0,0 +1,152 @@
+"""Pencatatan waktu dan alokasi memori per tahap perhitungan.
+
+Nonaktif secara default. Aktifkan dengan variabel lingkungan::
+
+    SPK_PROFIL=1 streamlit run app.py
+    SPK_PROFIL=1 SPK_PROFIL_LOG=profil.jsonl streamlit run app.py
+
+Saat nonaktif, ``tahap`` mengembalikan context manager kosong yang sama
+setiap kali dan ``diukur`` mengembalikan fungsi aslinya, jadi biayanya
+hanya satu pemanggilan fungsi. Saat aktif, setiap tahap mencatat waktu,
+byte bersih dan puncak (tracemalloc, termasuk alokasi NumPy) serta
+selisih jumlah blok memori Python. Tahap boleh bersarang. Catatan
+disimpan per thread (Streamlit menjalankan setiap sesi di thread
+sendiri) dan, jika ``SPK_PROFIL_LOG`` diisi, ditambahkan ke file JSONL.
+Puncak memori bersifat global per proses sehingga bisa ikut menghitung
+alokasi sesi lain yang berjalan bersamaan.
+"""
+
+import contextlib
+import functools
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import uuid
+
+AKTIF = os.environ.get("SPK_PROFIL", "").strip().lower() not in ("", "0", "false", "no")
+PATH_LOG = os.environ.get("SPK_PROFIL_LOG") or None
+# Thread tanpa ``mulai`` (mis. worker pool) tidak menyimpan lebih dari ini
+BATAS_CATATAN = 10_000
+
+_KOSONG = contextlib.nullcontext()
+_lokal = threading.local()
+_kunci_log = threading.Lock()
+
+
+def _status():
+    status = getattr(_lokal, "status", None)
+    if status is None:
+        status = _lokal.status = {"id": uuid.uuid4().hex[:8], "label": None, "mulai": time.perf_counter(),
+                                  "catatan": [], "tumpukan": []}
+    return status
+
+
+def mulai(label=None):
+    """Mulai sesi pencatatan baru di thread ini (mis. satu rerun Streamlit)"""
+    if not AKTIF:
+        return
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _lokal.status = None
+    _status()["label"] = label
+
+
+def catatan():
+    """Catatan tahap sejak ``mulai`` di thread ini, urut waktu mulai (induk sebelum anak)"""
+    return sorted(_status()["catatan"], key=lambda c: c["mulai"]) if AKTIF else []
+
+
+def total_detik():
+    """Waktu sejak ``mulai`` di thread ini"""
+    return time.perf_counter() - _status()["mulai"] if AKTIF else 0.0
+
+
+class _Tahap:
+    __slots__ = ("nama", "t0", "byte_awal", "puncak", "blok_awal")
+
+    def __init__(self, nama):
+        self.nama = nama
+
+    def __enter__(self):
+        tumpukan = _status()["tumpukan"]
+        tracing = tracemalloc.is_tracing()
+        byte_awal, puncak = tracemalloc.get_traced_memory() if tracing else (0, 0)
+        if tumpukan:
+            # Puncak induk sebelum direset untuk tahap ini
+            tumpukan[-1].puncak = max(tumpukan[-1].puncak, puncak)
+        if tracing:
+            tracemalloc.reset_peak()
+        self.byte_awal = self.puncak = byte_awal
+        self.blok_awal = sys.getallocatedblocks()
+        tumpukan.append(self)
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        detik = time.perf_counter() - self.t0
+        blok = sys.getallocatedblocks() - self.blok_awal
+        byte_akhir, puncak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        puncak = max(self.puncak, puncak)
+        status = _status()
+        tumpukan = status["tumpukan"]
+        if tumpukan and tumpukan[-1] is self:
+            tumpukan.pop()
+        if tumpukan:
+            tumpukan[-1].puncak = max(tumpukan[-1].puncak, puncak)
+        baris = {
+            "tahap": " / ".join([t.nama for t in tumpukan] + [self.nama]),
+            "kedalaman": len(tumpukan),
+            "mulai": self.t0 - status["mulai"],
+            "detik": detik,
+            "byte_bersih": byte_akhir - self.byte_awal,
+            "byte_puncak": puncak - self.byte_awal,
+            "blok_bersih": blok,
+            "error": exc[0].__name__ if exc[0] is not None else None,
+        }
+        if len(status["catatan"]) < BATAS_CATATAN:
+            status["catatan"].append(baris)
+        if PATH_LOG:
+            _tulis_log(status, baris)
+        return False
+
+
+def _tulis_log(status, baris):
+    data = {"waktu": time.time(), "pid": os.getpid(), "thread": threading.current_thread().name,
+            "sesi": status["id"], "label": status["label"], **baris}
+    with _kunci_log, open(PATH_LOG, "a", encoding="utf-8") as f:
+        f.write(json.dumps(data) + "\n")
+
+
+def tahap(nama):
+    """Context manager yang mencatat satu tahap; tidak melakukan apa pun jika profil nonaktif"""
+    if not AKTIF:
+        return _KOSONG
+    return _Tahap(nama)
+
+
+def diukur(nama):
+    """Dekorator ``tahap``; jika profil nonaktif fungsi dikembalikan tanpa dibungkus"""
+    def dekorator(fungsi):
+        if not AKTIF:
+            return fungsi
+
+        @functools.wraps(fungsi)
+        def dibungkus(*args, **kwargs):
+            with _Tahap(nama):
+                return fungsi(*args, **kwargs)
+        return dibungkus
+    return dekorator
+
+
+def ringkasan(daftar=None):
+    """Total per nama tahap: list dict ``tahap``, ``jumlah``, ``detik``, ``byte_puncak``, urut waktu terbesar"""
+    total = {}
+    for c in (catatan() if daftar is None else daftar):
+        t = total.setdefault(c["tahap"], {"tahap": c["tahap"], "jumlah": 0, "detik": 0.0, "byte_puncak": 0})
+        t["jumlah"] += 1
+        t["detik"] += c["detik"]
+        t["byte_puncak"] = max(t["byte_puncak"], c["byte_puncak"])
+    return sorted(total.values(), key=lambda t: -t["detik"])
@@ -0,0 +1,215 @@
+"""Analisis sensitivitas bobot: Monte Carlo Dirichlet dan ambang pembalikan peringkat.
+
+Bobot yang dimasukkan pengguna diganggu dengan sampel Dirichlet di
+sekitarnya, setiap sampel dinilai dengan ``spk.engine.hitung_skor_batch``,
+lalu dihitung peluang setiap alternatif menjadi peringkat 1 dan sebaran
+peringkatnya. Sampel dibagi per chunk dan dikerjakan di ProcessPoolExecutor;
+hasil sementara di-yield setiap kali satu chunk selesai.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from spk.engine import hitung_skor_batch, mask_benefit, peringkat
+
+# Data yang sama dipakai semua chunk, jadi dikirim sekali per worker lewat
+# initializer, bukan sekali per chunk.
+_worker = {}
+
+
+def alpha_dirichlet(bobot, konsentrasi):
+    """Parameter Dirichlet dengan rata-rata = bobot ternormalisasi
+
+    Konsentrasi besar berarti sampel rapat di sekitar bobot asli.
+    """
+    w = np.asarray(bobot, dtype=float)
+    if np.any(w < 0) or w.sum() <= 0:
+        raise ValueError("Bobot harus non-negatif dan totalnya > 0")
+    if konsentrasi <= 0:
+        raise ValueError("Konsentrasi harus > 0")
+    # Bobot 0 tidak valid untuk Dirichlet, beri nilai sangat kecil
+    return np.maximum(w / w.sum(), 1e-6) * konsentrasi
+
+
+def _init_worker(metode, data, tipe, alpha, n_posisi, metrik="euclidean"):
+    _worker["metode"] = metode
+    _worker["metrik"] = metrik
+    _worker["data"] = np.asarray(data, dtype=float)
+    _worker["tipe"] = mask_benefit(tipe)
+    _worker["alpha"] = alpha
+    _worker["n_posisi"] = n_posisi
+
+
+def _proses_chunk(seed, ukuran):
+    """Nilai satu chunk sampel, kembalikan agregat kecil (bukan skor mentah)"""
+    data = _worker["data"]
+    n_alt = data.shape[0]
+    rng = np.random.default_rng(seed)
+    daftar_bobot = rng.dirichlet(_worker["alpha"], size=ukuran)
+    skor = hitung_skor_batch(_worker["metode"], data, daftar_bobot, _worker["tipe"], _worker["metrik"])
+    ranks = peringkat(skor)
+    # hitung_peringkat[a, r] = berapa kali alternatif a berada di peringkat r+1
+    # (hanya untuk n_posisi peringkat teratas agar memori tidak n_alt^2)
+    n_posisi = _worker["n_posisi"]
+    alt = np.broadcast_to(np.arange(n_alt), ranks.shape)
+    atas = ranks <= n_posisi
+    indeks = alt[atas] * n_posisi + (ranks[atas] - 1)
+    hitung_peringkat = np.bincount(indeks, minlength=n_alt * n_posisi).reshape(n_alt, n_posisi)
+    return ukuran, hitung_peringkat, ranks.sum(axis=0)
+
+
+def _ringkas(n_sampel, hitung_peringkat, jumlah_peringkat, selesai, total):
+    distribusi = hitung_peringkat / max(n_sampel, 1)
+    return {
+        "n_sampel": n_sampel,
+        "chunk_selesai": selesai,
+        "chunk_total": total,
+        "prob_terbaik": distribusi[:, 0].copy(),
+        "distribusi_peringkat": distribusi,
+        "rata_peringkat": jumlah_peringkat / max(n_sampel, 1),
+    }
+
+
+def monte_carlo(metode, data, bobot, tipe, n_sampel=10_000, konsentrasi=100.0,
+                ukuran_chunk=5_000, n_worker=None, seed=0, maks_posisi=None, metrik="euclidean"):
+    """Generator analisis sensitivitas Monte Carlo
+
+    Setiap kali satu chunk selesai, yield dict berisi ``n_sampel``,
+    ``chunk_selesai``, ``chunk_total``, ``prob_terbaik`` (peluang tiap
+    alternatif menjadi peringkat 1), ``distribusi_peringkat`` (alternatif x
+    peringkat) dan ``rata_peringkat``. Hasil terakhir adalah hasil akhir.
+    ``maks_posisi`` membatasi kolom distribusi peringkat ke sejumlah
+    peringkat teratas (default semua) agar tetap kecil untuk banyak alternatif.
+    ``metrik`` adalah jarak ke solusi ideal TOPSIS. Dengan ``n_worker=1`` semua chunk dikerjakan di proses ini.
+    """
+    data = np.asarray(data, dtype=float)
+    n_alt = data.shape[0]
+    n_posisi = min(n_alt, maks_posisi or n_alt)
+    alpha = alpha_dirichlet(bobot, konsentrasi)
+    if alpha.shape != (data.shape[1],):
+        raise ValueError("Jumlah bobot tidak sama dengan jumlah kriteria")
+    tipe = mask_benefit(tipe, data.shape[1])
+
+    ukuran = [ukuran_chunk] * (n_sampel // ukuran_chunk)
+    if n_sampel % ukuran_chunk:
+        ukuran.append(n_sampel % ukuran_chunk)
+    seeds = np.random.SeedSequence(seed).spawn(len(ukuran))
+
+    total_sampel = 0
+    hitung_peringkat = np.zeros((n_alt, n_posisi), dtype=np.int64)
+    jumlah_peringkat = np.zeros(n_alt, dtype=np.int64)
+    n_worker = n_worker or os.cpu_count() or 1
+
+    if n_worker == 1:
+        _init_worker(metode, data, tipe, alpha, n_posisi, metrik)
+        for selesai, (s, u) in enumerate(zip(seeds, ukuran), start=1):
+            n, hitung, jumlah = _proses_chunk(s, u)
+            total_sampel += n
+            hitung_peringkat += hitung
+            jumlah_peringkat += jumlah
+            yield _ringkas(total_sampel, hitung_peringkat, jumlah_peringkat, selesai, len(ukuran))
+        return
+
+    with ProcessPoolExecutor(max_workers=n_worker, initializer=_init_worker,
+                             initargs=(metode, data, tipe, alpha, n_posisi, metrik)) as pool:
+        futures = [pool.submit(_proses_chunk, s, u) for s, u in zip(seeds, ukuran)]
+        try:
+            for selesai, future in enumerate(as_completed(futures), start=1):
+                n, hitung, jumlah = future.result()
+                total_sampel += n
+                hitung_peringkat += hitung
+                jumlah_peringkat += jumlah
+                yield _ringkas(total_sampel, hitung_peringkat, jumlah_peringkat, selesai, len(ukuran))
+        finally:
+            # Jika pemanggil berhenti lebih awal, jangan tunggu chunk sisanya
+            for future in futures:
+                future.cancel()
+
+
+def _bobot_satu_kriteria(w, j, nilai):
+    """Bobot dengan w_j = nilai dan kriteria lain diskalakan proporsional (total 1)"""
+    nilai = np.asarray(nilai, dtype=float)
+    sisa = np.delete(w, j)
+    if sisa.sum() > 0:
+        sisa = sisa / sisa.sum()
+    else:
+        sisa = np.full(sisa.shape, 1.0 / sisa.size)
+    hasil = np.empty((nilai.size, w.size))
+    hasil[:, j] = nilai
+    hasil[:, np.arange(w.size) != j] = (1.0 - nilai)[:, None] * sisa
+    return hasil
+
+
+def _berubah_di_atas(r_kiri, r_kanan, posisi):
+    """Mask interval yang peringkat alternatif teratasnya (di salah satu ujung) berubah
+
+    Jika tidak ada alternatif di ``posisi`` teratas yang peringkatnya
+    berubah, tidak ada pasangan yang menyentuh posisi teratas bertukar urutan.
+    """
+    return np.any((r_kiri != r_kanan) & ((r_kiri <= posisi) | (r_kanan <= posisi)), axis=-1)
+
+
+def ambang_pembalikan(metode, data, bobot, tipe, titik=201, posisi=1, iterasi_zoom=2, metrik="euclidean",
+                      titik_zoom=34):
+    """Cari bobot ambang di mana peringkat berubah
+
+    Untuk setiap kriteria j, bobot w_j digeser dari 0 sampai 1 sementara
+    bobot lain diskalakan proporsional. Perubahan urutan dideteksi pada grid
+    ``titik`` lalu setiap sub-interval yang berubah dipersempit dengan grid
+    ``titik_zoom`` (``iterasi_zoom`` kali), sehingga beberapa pembalikan di
+    sel grid yang sama tetap terpisah. Hanya pembalikan yang melibatkan
+    ``posisi`` peringkat teratas yang dilaporkan. ``metrik`` seperti pada
+    ``monte_carlo``.
+
+    Mengembalikan list dict berisi ``kriteria``, ``bobot_awal``,
+    ``bobot_ambang``, ``naik`` (True jika ambang di atas bobot awal) dan
+    ``pasangan`` (indeks dua alternatif yang bertukar urutan).
+    """
+    data = np.asarray(data, dtype=float)
+    w = np.asarray(bobot, dtype=float)
+    w = w / w.sum()
+    tipe = mask_benefit(tipe, data.shape[1])
+    grid = np.linspace(0.0, 1.0, titik)
+    n_alt = data.shape[0]
+    blok = max(1, 2_000_000 // (titik_zoom * n_alt))
+    hasil = []
+
+    for j in range(w.size):
+        ranks = peringkat(hitung_skor_batch(metode, data, _bobot_satu_kriteria(w, j, grid), tipe, metrik))
+        berubah = np.flatnonzero(_berubah_di_atas(ranks[:-1], ranks[1:], posisi))
+        kiri, kanan = grid[berubah], grid[berubah + 1]
+        r_kiri, r_kanan = ranks[berubah], ranks[berubah + 1]
+        for _ in range(iterasi_zoom):
+            if kiri.size == 0:
+                break
+            # Interval dipersempit per blok: satu batch skor untuk banyak interval
+            sub = np.linspace(kiri, kanan, titik_zoom, axis=1)
+            baru = []
+            for awal in range(0, kiri.size, blok):
+                sub_blok = sub[awal:awal + blok]
+                sub_ranks = peringkat(hitung_skor_batch(metode, data, _bobot_satu_kriteria(w, j, sub_blok.ravel()),
+                                                        tipe, metrik)).reshape(sub_blok.shape[0], titik_zoom, n_alt)
+                interval, k = np.nonzero(_berubah_di_atas(sub_ranks[:, :-1], sub_ranks[:, 1:], posisi))
+                baru.append((sub_blok[interval, k], sub_blok[interval, k + 1],
+                             sub_ranks[interval, k], sub_ranks[interval, k + 1]))
+            kiri, kanan, r_kiri, r_kanan = (np.concatenate(bagian) for bagian in zip(*baru))
+
+        for ki, ka, rk, rn in zip(kiri, kanan, r_kiri, r_kanan):
+            # Pasangan yang urutannya terbalik dan menyentuh posisi teratas
+            atas = np.flatnonzero((rk <= posisi) | (rn <= posisi))
+            terbalik = (rk[atas, None] < rk[None, :]) != (rn[atas, None] < rn[None, :])
+            # Pasangan di antara dua alternatif teratas cukup dicatat sekali (a < b)
+            ulang = np.zeros((atas.size, n_alt), dtype=bool)
+            ulang[:, atas] = atas[None, :] <= atas[:, None]
+            ambang = float((ki + ka) / 2)
+            for a, b in zip(*np.nonzero(terbalik & ~ulang)):
+                hasil.append({
+                    "kriteria": j,
+                    "bobot_awal": float(w[j]),
+                    "bobot_ambang": ambang,
+                    "naik": bool(ambang > w[j]),
+                    "pasangan": (int(atas[a]), int(b)),
+                })
+    return hasil
@@ -0,0 +1,179 @@
+"""Simpan dan muat skenario lengkap dalam format biner yang bisa di-memmap.
+
+Satu skenario = satu direktori::
+
+    <direktori>/<nama>/meta.json       nama, jenis, kriteria, bobot, tipe, ringkasan, daftar array
+    <direktori>/<nama>/matriks.npy     matriks keputusan (alternatif x kriteria)
+    <direktori>/<nama>/alternatif.npy  nama alternatif
+    <direktori>/<nama>/hasil_*.npy     hasil perhitungan yang sudah ada di cache
+
+Skenario AHP menyimpan ``ahp_kriteria.npy`` (n x n) dan
+``ahp_alternatif.npy`` (kriteria x n x n) sebagai pengganti matriks.
+
+Setiap array adalah file .npy terpisah (bukan .npz yang terkompresi/zip)
+agar ``np.load(mmap_mode="r")`` bisa memetakannya langsung: membuka
+matriks berukuran GB tidak membaca isinya, hanya halaman yang disentuh
+yang dibaca dari disk. Daftar skenario hanya membaca meta.json. Skenario
+ditulis ke direktori sementara lalu di-rename sehingga tidak pernah
+tersimpan setengah jadi.
+"""
+
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from spk.cache import cache_hasil
+
+DIREKTORI = os.environ.get("SPK_SKENARIO_DIR", "skenario")
+VERSI_FORMAT = 1
+JENIS_SKENARIO = ("matriks", "ahp")
+
+
+def _nama_direktori(nama):
+    """Nama direktori yang aman dari nama skenario"""
+    bersih = re.sub(r"[^\w.-]+", "_", str(nama).strip()).strip("._")
+    if not bersih:
+        raise ValueError("Nama skenario tidak boleh kosong")
+    return bersih
+
+
+def _bagian_hasil(hasil):
+    """Pisahkan hasil (ndarray atau tuple ndarray/angka) menjadi array dan skalar; None jika tidak didukung"""
+    tunggal = not isinstance(hasil, tuple)
+    bagian = []
+    for item in ((hasil,) if tunggal else hasil):
+        if isinstance(item, np.ndarray):
+            bagian.append(item)
+        elif isinstance(item, (int, float, np.number)):
+            bagian.append(float(item))
+        else:
+            return None, tunggal
+    return bagian, tunggal
+
+
+def simpan_skenario(nama, jenis, kriteria, alternatif, *, matriks=None, bobot=None, tipe=None,
+                    ahp_kriteria=None, ahp_alternatif=None, metode=None, kunci_cache=(),
+                    direktori=DIREKTORI, timpa=False):
+    """Tulis skenario ke ``direktori/<nama>`` dan kembalikan meta-nya
+
+    ``kunci_cache`` berisi pasangan (metode, kunci hash) hasil yang ikut
+    disimpan jika masih ada di ``cache_hasil``; hasil berupa dict dilewati.
+    """
+    if jenis not in JENIS_SKENARIO:
+        raise ValueError(f"Jenis skenario tidak dikenal: {jenis!r}")
+    folder = os.path.join(direktori, _nama_direktori(nama))
+    if os.path.exists(folder) and not timpa:
+        raise FileExistsError(f"Skenario {nama!r} sudah ada")
+
+    array = {"alternatif": np.asarray([str(a) for a in alternatif])}
+    meta = {
+        "versi_format": VERSI_FORMAT, "nama": str(nama), "jenis": jenis, "metode": metode,
+        "dibuat": time.time(), "kriteria": [str(k) for k in kriteria], "n_alternatif": len(alternatif),
+    }
+    if jenis == "matriks":
+        X = np.asarray(matriks, dtype=float)
+        if X.shape != (len(alternatif), len(kriteria)):
+            raise ValueError(f"Matriks harus berukuran {len(alternatif)} x {len(kriteria)}, bukan {X.shape}")
+        array["matriks"] = X
+        meta["bobot"] = [float(b) for b in bobot]
+        meta["tipe"] = [str(t) for t in tipe]
+        # Ringkasan untuk validasi saat dimuat tanpa membaca seluruh matriks
+        meta["min"] = float(np.nanmin(X)) if X.size else 0.0
+        meta["ada_nan"] = bool(np.isnan(X).any())
+    else:
+        array["ahp_kriteria"] = np.asarray(ahp_kriteria, dtype=float)
+        array["ahp_alternatif"] = np.asarray(ahp_alternatif, dtype=float)
+
+    meta["hasil"] = []
+    for metode_hasil, kunci in kunci_cache:
+        hasil = cache_hasil.ambil(kunci)
+        if hasil is None:
+            continue
+        bagian, tunggal = _bagian_hasil(hasil)
+        if bagian is None:
+            continue
+        info = {"metode": metode_hasil, "kunci": kunci, "tunggal": tunggal, "bagian": []}
+        for b in bagian:
+            if isinstance(b, np.ndarray):
+                nama_array = f"hasil_{len(meta['hasil'])}_{len(info['bagian'])}"
+                array[nama_array] = b
+                info["bagian"].append({"array": nama_array})
+            else:
+                info["bagian"].append({"nilai": b})
+        meta["hasil"].append(info)
+
+    meta["array"] = {k: {"shape": list(a.shape), "dtype": a.dtype.str} for k, a in array.items()}
+    meta["ukuran_byte"] = int(sum(a.nbytes for a in array.values()))
+
+    os.makedirs(direktori, exist_ok=True)
+    sementara = tempfile.mkdtemp(prefix=".simpan-", dir=direktori)
+    try:
+        for k, a in array.items():
+            np.save(os.path.join(sementara, f"{k}.npy"), a, allow_pickle=False)
+        with open(os.path.join(sementara, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+        lama = None
+        if os.path.exists(folder):
+            lama = tempfile.mkdtemp(prefix=".hapus-", dir=direktori)
+            os.replace(folder, os.path.join(lama, "isi"))
+        os.replace(sementara, folder)
+    except BaseException:
+        shutil.rmtree(sementara, ignore_errors=True)
+        raise
+    if lama is not None:
+        shutil.rmtree(lama, ignore_errors=True)
+    return meta
+
+
+def baca_meta(folder):
+    with open(os.path.join(folder, "meta.json"), encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("versi_format", 0) > VERSI_FORMAT:
+        raise ValueError(f"Skenario {meta.get('nama')!r} memakai format versi baru ({meta['versi_format']})")
+    meta["folder"] = folder
+    return meta
+
+
+def daftar_skenario(direktori=DIREKTORI, jenis=None):
+    """Meta semua skenario (hanya meta.json yang dibaca), terbaru lebih dulu"""
+    if not os.path.isdir(direktori):
+        return []
+    hasil = []
+    for entri in os.scandir(direktori):
+        if entri.name.startswith(".") or not entri.is_dir():
+            continue
+        try:
+            meta = baca_meta(entri.path)
+        except (OSError, ValueError):
+            continue
+        if jenis is None or meta["jenis"] == jenis:
+            hasil.append(meta)
+    return sorted(hasil, key=lambda m: -m["dibuat"])
+
+
+def muat_skenario(nama, direktori=DIREKTORI, mmap=True, isi_cache=True):
+    """Muat skenario; array dibuka dengan memmap read-only (kecuali ``mmap=False``)
+
+    Mengembalikan meta dengan tambahan ``data`` (dict nama -> array). Jika
+    ``isi_cache``, hasil tersimpan dimasukkan ke ``cache_hasil`` dengan
+    kunci aslinya sehingga perhitungan dengan input yang sama langsung hit.
+    """
+    meta = baca_meta(os.path.join(direktori, _nama_direktori(nama)))
+    mode = "r" if mmap else None
+    meta["data"] = {k: np.load(os.path.join(meta["folder"], f"{k}.npy"), mmap_mode=mode, allow_pickle=False)
+                    for k in meta["array"]}
+    if isi_cache:
+        for info in meta["hasil"]:
+            bagian = tuple(meta["data"][b["array"]] if "array" in b else b["nilai"] for b in info["bagian"])
+            cache_hasil.simpan(info["kunci"], bagian[0] if info["tunggal"] else bagian)
+    return meta
+
+
+def hapus_skenario(nama, direktori=DIREKTORI):
+    shutil.rmtree(os.path.join(direktori, _nama_direktori(nama)))
+
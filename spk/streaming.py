@@ -0,0 +1,349 @@
+"""Penilaian dua lintasan untuk matriks keputusan yang lebih besar dari memori.
+
+Lintasan 1 membaca data per chunk untuk mengumpulkan statistik kolom (max,
+min, jumlah kuadrat; untuk WP juga log-sum-exp dari log S). Lintasan 2
+membaca ulang data per chunk dan menulis skor ke file .npy (memmap).
+Peringkat dihitung dari file skor tersebut dengan sort eksternal (run per
+chunk lalu penggabungan k-arah) tanpa memuat semuanya ke memori, lalu hasil
+ditulis ke CSV/Parquet per chunk. Memori puncak ditentukan oleh
+ukuran chunk, bukan jumlah alternatif.
+
+Sumber data yang didukung: CSV, Parquet (butuh pyarrow), .npy dan file
+biner mentah (np.memmap, butuh ``n_kriteria`` dan ``dtype``).
+"""
+
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from spk.engine import (
+    cek_metrik, hitung_log_s, jarak_topsis, mask_benefit, normalisasi_saw, normalisasi_topsis, solusi_ideal,
+)
+
+METODE_STREAMING = ("SAW", "WP", "TOPSIS")
+
+
+def _format_file(path, format=None):
+    if format:
+        return format.lower()
+    ext = os.path.splitext(path)[1].lower()
+    return {".csv": "csv", ".parquet": "parquet", ".pq": "parquet", ".npy": "npy"}.get(ext, "bin")
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Format Parquet membutuhkan pyarrow (pip install pyarrow)") from None
+    return pa, pq
+
+
+def iter_chunk(path, ukuran_chunk=100_000, format=None, kolom=None, kolom_id=None,
+               n_kriteria=None, dtype="float64"):
+    """Baca matriks keputusan per chunk
+
+    Yield pasangan (id, X) dengan X ndarray float (baris x kriteria) dan id
+    berupa array id alternatif (dari ``kolom_id``) atau None.
+    ``kolom`` memilih kolom kriteria untuk CSV/Parquet; default semua kolom
+    selain ``kolom_id``.
+    """
+    format = _format_file(path, format)
+    if format == "csv":
+        import pandas as pd
+        usecols = None if kolom is None else list(kolom) + ([kolom_id] if kolom_id else [])
+        for df in pd.read_csv(path, chunksize=ukuran_chunk, usecols=usecols):
+            ids = df.pop(kolom_id).to_numpy() if kolom_id else None
+            if kolom is not None:
+                df = df[list(kolom)]
+            yield ids, df.to_numpy(dtype=float)
+    elif format == "parquet":
+        _, pq = _import_pyarrow()
+        berkas = pq.ParquetFile(path)
+        nama_kolom = list(kolom) if kolom is not None else [n for n in berkas.schema_arrow.names if n != kolom_id]
+        baca = nama_kolom + ([kolom_id] if kolom_id else [])
+        for batch in berkas.iter_batches(batch_size=ukuran_chunk, columns=baca):
+            ids = batch.column(kolom_id).to_numpy(zero_copy_only=False) if kolom_id else None
+            if nama_kolom:
+                X = np.column_stack([batch.column(n).to_numpy(zero_copy_only=False) for n in nama_kolom]).astype(float, copy=False)
+            else:
+                X = np.empty((batch.num_rows, 0))
+            yield ids, X
+    elif format in ("npy", "bin"):
+        if format == "npy":
+            data = np.load(path, mmap_mode="r")
+        else:
+            if not n_kriteria:
+                raise ValueError("File biner mentah membutuhkan n_kriteria")
+            data = np.memmap(path, dtype=dtype, mode="r").reshape(-1, n_kriteria)
+        if data.ndim != 2:
+            raise ValueError("Matriks keputusan harus 2 dimensi (alternatif x kriteria)")
+        for awal in range(0, data.shape[0], ukuran_chunk):
+            yield None, np.asarray(data[awal:awal + ukuran_chunk], dtype=float)
+    else:
+        raise ValueError(f"Format tidak dikenal: {format!r}")
+
+
+def statistik_kolom(chunks, metode, bobot, tipe):
+    """Lintasan 1: kumpulkan statistik kolom dari iterator (id, X)"""
+    w = np.asarray(bobot, dtype=float)
+    benefit = mask_benefit(tipe, w.size)
+    w_perbaikan = np.where(benefit, w, -w)
+    stat = {"n_alt": 0, "col_max": None, "col_min": None, "sum_kuadrat": None, "log_total_s": -np.inf}
+
+    for _, X in chunks:
+        if X.shape[1] != w.size:
+            raise ValueError(f"Jumlah kolom kriteria ({X.shape[1]}) tidak sama dengan jumlah bobot ({w.size})")
+        if X.shape[0] == 0:
+            continue
+        stat["n_alt"] += X.shape[0]
+        if stat["col_max"] is None:
+            stat["col_max"] = X.max(axis=0)
+            stat["col_min"] = X.min(axis=0)
+            stat["sum_kuadrat"] = np.einsum("ij,ij->j", X, X)
+        else:
+            np.maximum(stat["col_max"], X.max(axis=0), out=stat["col_max"])
+            np.minimum(stat["col_min"], X.min(axis=0), out=stat["col_min"])
+            stat["sum_kuadrat"] += np.einsum("ij,ij->j", X, X)
+        if metode == "WP":
+            # log(total S) berjalan: logaddexp(log_total, logsumexp(log S chunk))
+            log_s = hitung_log_s(X, w_perbaikan)
+            maks = log_s.max()
+            if np.isfinite(maks):
+                stat["log_total_s"] = np.logaddexp(stat["log_total_s"], maks + np.log(np.exp(log_s - maks).sum()))
+
+    if stat["n_alt"] == 0:
+        raise ValueError("Matriks keputusan kosong")
+    return stat
+
+
+def skor_chunk(metode, X, bobot, tipe, stat, metrik="euclidean"):
+    """Lintasan 2: skor satu chunk memakai statistik seluruh data (``metrik`` hanya untuk TOPSIS)"""
+    w = np.asarray(bobot, dtype=float)
+    benefit = mask_benefit(tipe, w.size)
+    if metode == "SAW":
+        return normalisasi_saw(X, benefit, stat["col_max"], stat["col_min"]) @ w
+    if metode == "WP":
+        log_s = hitung_log_s(X, np.where(benefit, w, -w))
+        if not np.isfinite(stat["log_total_s"]):
+            return np.zeros(X.shape[0])
+        return np.exp(log_s - stat["log_total_s"])
+    if metode == "TOPSIS":
+        pembagi = np.sqrt(stat["sum_kuadrat"])
+        data_weighted = normalisasi_topsis(X, pembagi)
+        data_weighted *= w
+        # max/min kolom terbobot = w * (max/min kolom) / pembagi
+        a = w * normalisasi_topsis(stat["col_max"][None, :], pembagi)[0]
+        b = w * normalisasi_topsis(stat["col_min"][None, :], pembagi)[0]
+        ideal_pos, ideal_neg = solusi_ideal(np.maximum(a, b), np.minimum(a, b), benefit)
+        return jarak_topsis(data_weighted, ideal_pos, ideal_neg, metrik)[2]
+    raise ValueError(f"Metode streaming tidak dikenal: {metode!r}")
+
+
+# Jumlah run yang digabung sekaligus pada sort eksternal
+FAN_IN = 16
+
+
+def _buka(folder, nama, dtype, n):
+    return np.lib.format.open_memmap(os.path.join(folder, f"{nama}.npy"), mode="w+", dtype=dtype, shape=(n,))
+
+
+def _gabung_run(sumber, tujuan, batas, ukuran_blok):
+    """Gabungkan run terurut sumber[batas[r]:batas[r+1]] ke tujuan di posisi yang sama
+
+    ``sumber``/``tujuan`` adalah pasangan (kunci, indeks). Setiap run dibaca
+    per blok; di setiap langkah semua elemen <= nilai terakhir terkecil di
+    antara blok yang sedang dibaca pasti sudah lengkap, jadi bisa diurutkan
+    dan ditulis. Minimal satu blok habis per langkah sehingga I/O linear.
+    """
+    posisi, akhir = list(batas[:-1]), batas[1:]
+    buffer = [None] * len(posisi)
+
+    def isi(r):
+        a, b = posisi[r], min(posisi[r] + ukuran_blok, akhir[r])
+        buffer[r] = (np.asarray(sumber[0][a:b]), np.asarray(sumber[1][a:b])) if a < b else None
+        posisi[r] = b
+
+    for r in range(len(buffer)):
+        isi(r)
+    keluar = batas[0]
+    while True:
+        aktif = [r for r, b in enumerate(buffer) if b is not None]
+        if not aktif:
+            break
+        ambang = min(buffer[r][0][-1] for r in aktif)
+        kunci, indeks = [], []
+        for r in aktif:
+            k, i = buffer[r]
+            m = np.searchsorted(k, ambang, side="right")
+            kunci.append(k[:m])
+            indeks.append(i[:m])
+            if m == k.size:
+                isi(r)
+            else:
+                buffer[r] = (k[m:], i[m:])
+        kunci = np.concatenate(kunci)
+        indeks = np.concatenate(indeks)
+        urutan = np.argsort(kunci, kind="stable")
+        n = kunci.size
+        tujuan[0][keluar:keluar + n] = kunci[urutan]
+        tujuan[1][keluar:keluar + n] = indeks[urutan]
+        keluar += n
+
+
+def peringkat_memmap(skor, ukuran_chunk, direktori=None, fan_in=FAN_IN):
+    """Peringkat (1 = terbaik, seri mendapat peringkat terkecil) untuk array skor besar
+
+    Sort eksternal pasangan (-skor, indeks): setiap chunk diurutkan menjadi
+    run, run digabung ``fan_in`` sekaligus sampai tersisa satu (log_fan_in
+    lintasan berurutan), lalu satu lintasan atas urutan global menghitung
+    peringkat (posisi awal kelompok seri + 1) dan menuliskannya ke file
+    peringkat per indeks. Hasil di-yield per chunk dalam urutan indeks.
+    Memori yang dipakai sebanding dengan ukuran chunk.
+    """
+    n = skor.shape[0]
+    with tempfile.TemporaryDirectory(dir=direktori) as folder:
+        sumber = (_buka(folder, "kunci_a", np.float64, n), _buka(folder, "indeks_a", np.int64, n))
+        tujuan = (_buka(folder, "kunci_b", np.float64, n), _buka(folder, "indeks_b", np.int64, n))
+        batas = list(range(0, n, ukuran_chunk)) + [n]
+        for awal, akhir in zip(batas[:-1], batas[1:]):
+            kunci = -np.asarray(skor[awal:akhir], dtype=np.float64)
+            urutan = np.argsort(kunci, kind="stable")
+            sumber[0][awal:akhir] = kunci[urutan]
+            sumber[1][awal:akhir] = urutan + awal
+
+        ukuran_blok = max(1024, ukuran_chunk // fan_in)
+        while len(batas) > 2:
+            for g in range(0, len(batas) - 1, fan_in):
+                _gabung_run(sumber, tujuan, batas[g:g + fan_in + 1], ukuran_blok)
+            batas = batas[::fan_in] + ([n] if (len(batas) - 1) % fan_in else [])
+            sumber, tujuan = tujuan, sumber
+
+        ranks = _buka(folder, "peringkat", np.int64, n)
+        kunci_lalu, awal_lalu = np.nan, 0
+        for awal in range(0, n, ukuran_chunk):
+            kunci = np.asarray(sumber[0][awal:awal + ukuran_chunk])
+            posisi = np.arange(awal, awal + kunci.size)
+            baru = np.empty(kunci.size, dtype=bool)
+            baru[0] = kunci[0] != kunci_lalu
+            np.not_equal(kunci[1:], kunci[:-1], out=baru[1:])
+            mulai = np.maximum.accumulate(np.where(baru, posisi, awal_lalu))
+            ranks[np.asarray(sumber[1][awal:awal + ukuran_chunk])] = mulai + 1
+            kunci_lalu, awal_lalu = kunci[-1], mulai[-1]
+        del sumber, tujuan
+
+        for awal in range(0, n, ukuran_chunk):
+            yield awal, np.asarray(ranks[awal:awal + ukuran_chunk])
+        del ranks
+
+
+def _id_per_blok(chunks, ukuran):
+    """Potong ulang id dari iterator (id, X) menjadi blok berukuran tetap"""
+    sisa = []
+    n_sisa = 0
+    for ids, _ in chunks:
+        sisa.append(ids)
+        n_sisa += len(ids)
+        while n_sisa >= ukuran:
+            gabung = np.concatenate(sisa)
+            yield gabung[:ukuran]
+            sisa, n_sisa = [gabung[ukuran:]], n_sisa - ukuran
+    if n_sisa:
+        yield np.concatenate(sisa)
+
+
+def _penulis(path_output):
+    """Kembalikan (tulis(df), tutup()) untuk output CSV atau Parquet per chunk"""
+    if _format_file(path_output) == "parquet":
+        pa, pq = _import_pyarrow()
+        writer = {}
+
+        def tulis(df):
+            tabel = pa.Table.from_pandas(df, preserve_index=False)
+            if "w" not in writer:
+                writer["w"] = pq.ParquetWriter(path_output, tabel.schema)
+            writer["w"].write_table(tabel)
+
+        def tutup():
+            if "w" in writer:
+                writer["w"].close()
+        return tulis, tutup
+
+    pertama = [True]
+
+    def tulis(df):
+        df.to_csv(path_output, mode="w" if pertama[0] else "a", header=pertama[0], index=False)
+        pertama[0] = False
+    return tulis, lambda: None
+
+
+def skor_streaming(path, metode, bobot, tipe, path_output, ukuran_chunk=100_000,
+                   path_skor=None, metrik="euclidean", **opsi_sumber):
+    """Nilai file matriks keputusan secara streaming dan tulis skor + peringkat
+
+    ``opsi_sumber`` diteruskan ke ``iter_chunk`` (format, kolom, kolom_id,
+    n_kriteria, dtype). Skor mentah disimpan di ``path_skor`` (.npy), default
+    file sementara di samping output. ``metrik`` adalah jarak ke solusi
+    ideal TOPSIS. Mengembalikan ringkasan berisi jumlah
+    alternatif, waktu per tahap dan 10 alternatif teratas.
+    """
+    metode = metode.upper()
+    if metode not in METODE_STREAMING:
+        raise ValueError(f"Metode harus salah satu dari {', '.join(METODE_STREAMING)}")
+    cek_metrik(metrik)
+    waktu = {}
+
+    t0 = time.perf_counter()
+    stat = statistik_kolom(iter_chunk(path, ukuran_chunk, **opsi_sumber), metode, bobot, tipe)
+    waktu["lintasan_1"] = time.perf_counter() - t0
+    n_alt = stat["n_alt"]
+
+    hapus_skor = path_skor is None
+    if hapus_skor:
+        fd, path_skor = tempfile.mkstemp(suffix=".npy", dir=os.path.dirname(os.path.abspath(path_output)))
+        os.close(fd)
+    try:
+        t0 = time.perf_counter()
+        skor = np.lib.format.open_memmap(path_skor, mode="w+", dtype=np.float64, shape=(n_alt,))
+        ids_ada = False
+        posisi = 0
+        for ids, X in iter_chunk(path, ukuran_chunk, **opsi_sumber):
+            skor[posisi:posisi + X.shape[0]] = skor_chunk(metode, X, bobot, tipe, stat, metrik)
+            posisi += X.shape[0]
+            ids_ada = ids is not None
+        skor.flush()
+        waktu["lintasan_2"] = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        import pandas as pd
+        tulis, tutup = _penulis(path_output)
+        # Jika ada kolom id, hanya kolom itu yang dibaca ulang
+        sumber_id = None
+        if ids_ada:
+            sumber_id = _id_per_blok(iter_chunk(path, ukuran_chunk, **{**opsi_sumber, "kolom": []}), ukuran_chunk)
+        try:
+            for awal, ranks in peringkat_memmap(skor, ukuran_chunk, os.path.dirname(path_skor)):
+                akhir = awal + ranks.size
+                df = pd.DataFrame({"indeks": np.arange(awal, akhir), "skor": skor[awal:akhir], "peringkat": ranks})
+                if sumber_id is not None:
+                    df.insert(1, opsi_sumber["kolom_id"], next(sumber_id))
+                tulis(df)
+        finally:
+            tutup()
+        waktu["peringkat"] = time.perf_counter() - t0
+
+        k = min(10, n_alt)
+        teratas = []
+        for awal in range(0, n_alt, ukuran_chunk):
+            blok = np.asarray(skor[awal:awal + ukuran_chunk])
+            idx = np.argpartition(-blok, min(k, blok.size) - 1)[:k]
+            teratas.extend(zip(blok[idx].tolist(), (idx + awal).tolist()))
+            teratas = sorted(teratas, key=lambda p: -p[0])[:k]
+        del skor
+    finally:
+        if hapus_skor:
+            os.remove(path_skor)
+
+    return {"n_alt": n_alt, "waktu": waktu, "teratas": [(i, s) for s, i in teratas]}
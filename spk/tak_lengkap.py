@@ -0,0 +1,212 @@
+"""AHP dengan perbandingan berpasangan tidak lengkap.
+
+Hanya sebagian pasangan (i, j) yang dinilai, cukup asalkan grafnya
+terhubung: rantai 1-2, 2-3, ... atau pohon acak, ditambah beberapa
+pasangan acak. Prioritas dihitung dengan logarithmic least squares (LLSM):
+
+    min  sum_{(i,j)}  (log a_ij - (v_i - v_j))^2,     w = exp(v) / sum(exp(v))
+
+yang persamaan normalnya adalah sistem Laplacian graf perbandingan
+L v = b. Sistem ini diselesaikan dengan conjugate gradient yang hanya
+memakai daftar sisi, jadi biaya per iterasi O(jumlah pasangan), bukan O(n^2).
+"""
+
+import numpy as np
+
+
+def desain_perbandingan(n, jenis="rantai", tambahan=0.0, seed=0):
+    """Pasangan (E, 2) yang akan dinilai: kerangka terhubung plus pasangan acak
+
+    ``jenis`` "rantai" memakai (0,1), (1,2), ...; "acak" memakai pohon
+    merentang acak. ``tambahan`` adalah rata-rata jumlah perbandingan ekstra
+    per elemen (total round(tambahan * n / 2) pasangan acak berbeda).
+    """
+    rng = np.random.default_rng(seed)
+    if jenis == "rantai":
+        urutan = np.arange(n)
+        induk = urutan[:-1]
+    elif jenis == "acak":
+        # Setiap elemen disambungkan ke salah satu elemen sebelumnya pada permutasi acak
+        urutan = rng.permutation(n)
+        induk = urutan[(rng.random(n - 1) * np.arange(1, n)).astype(np.int64)]
+    else:
+        raise ValueError(f"Jenis desain tidak dikenal: {jenis!r} (gunakan 'rantai' atau 'acak')")
+    pasangan = np.column_stack([induk, urutan[1:]])
+
+    n_tambahan = min(int(round(tambahan * n / 2)), n * (n - 1) // 2 - (n - 1))
+    if n_tambahan > 0:
+        ada = set(map(tuple, np.sort(pasangan, axis=1).tolist()))
+        baru = []
+        while len(baru) < n_tambahan:
+            i, j = rng.integers(0, n, size=2)
+            kunci = (min(i, j), max(i, j))
+            if i != j and kunci not in ada:
+                ada.add(kunci)
+                baru.append(kunci)
+        pasangan = np.vstack([pasangan, np.array(baru, dtype=np.int64)])
+    return np.sort(pasangan, axis=1)
+
+
+def terhubung(n, pasangan):
+    """True jika graf perbandingan menghubungkan semua n elemen (union-find)"""
+    akar = list(range(n))
+
+    def cari(x):
+        while akar[x] != x:
+            akar[x] = akar[akar[x]]
+            x = akar[x]
+        return x
+
+    komponen = n
+    for i, j in np.asarray(pasangan).tolist():
+        ri, rj = cari(i), cari(j)
+        if ri != rj:
+            akar[ri] = rj
+            komponen -= 1
+    return komponen == 1
+
+
+def _kali_laplacian(x, i, j, derajat):
+    """L @ x untuk Laplacian dari daftar sisi; x bisa (n,) atau (n, k)"""
+    y = derajat.reshape((-1,) + (1,) * (x.ndim - 1)) * x
+    np.subtract.at(y, i, x[j])
+    np.subtract.at(y, j, x[i])
+    return y
+
+
+def cg_laplacian(n, i, j, b, toleransi=1e-10, maks_iterasi=None):
+    """Selesaikan L x = b (graf terhubung, b tegak lurus vektor 1) dengan PCG Jacobi
+
+    ``b`` boleh (n,) atau (n, k) untuk k ruas kanan sekaligus. Solusi
+    dipilih yang rata-ratanya 0.
+    """
+    derajat = np.bincount(i, minlength=n) + np.bincount(j, minlength=n)
+    pra = 1.0 / derajat.reshape((-1,) + (1,) * (b.ndim - 1))
+    b = b - b.mean(axis=0)
+    x = np.zeros_like(b)
+    r = b.copy()
+    z = pra * r
+    p = z.copy()
+    rz = (r * z).sum(axis=0)
+    batas = toleransi * np.maximum(np.sqrt((b * b).sum(axis=0)), 1e-300)
+    for _ in range(maks_iterasi or 10 * n):
+        if np.all(np.sqrt((r * r).sum(axis=0)) <= batas):
+            break
+        Lp = _kali_laplacian(p, i, j, derajat)
+        pLp = (p * Lp).sum(axis=0)
+        alpha = np.divide(rz, pLp, out=np.zeros_like(rz), where=pLp > 0)
+        x += alpha * p
+        r -= alpha * Lp
+        z = pra * r
+        rz_baru = (r * z).sum(axis=0)
+        beta = np.divide(rz_baru, rz, out=np.zeros_like(rz), where=rz > 0)
+        p = z + beta * p
+        rz = rz_baru
+    return x - x.mean(axis=0)
+
+
+def _siapkan_pasangan(n, pasangan, nilai):
+    pasangan = np.asarray(pasangan, dtype=np.int64).reshape(-1, 2)
+    nilai = np.asarray(nilai, dtype=float).ravel()
+    if nilai.shape[0] != pasangan.shape[0]:
+        raise ValueError("Jumlah nilai tidak sama dengan jumlah pasangan")
+    if np.any(~(nilai > 0)):
+        raise ValueError("Semua nilai perbandingan harus > 0")
+    if np.any(pasangan[:, 0] == pasangan[:, 1]) or pasangan.min(initial=0) < 0 or pasangan.max(initial=0) >= n:
+        raise ValueError("Pasangan harus berisi dua elemen berbeda antara 0 dan n-1")
+    if not terhubung(n, pasangan):
+        raise ValueError("Perbandingan belum menghubungkan semua elemen; tambahkan pasangan hingga graf terhubung")
+    return pasangan[:, 0], pasangan[:, 1], nilai
+
+
+def prioritas_llsm(n, pasangan, nilai, toleransi=1e-10):
+    """Prioritas LLSM dari perbandingan tidak lengkap
+
+    ``nilai[e]`` adalah a_ij untuk ``pasangan[e] = (i, j)`` (seberapa
+    penting i dibanding j). Mengembalikan dict berisi ``bobot`` (jumlah 1),
+    ``galat_rms`` (akar rata-rata kuadrat residual log) dan ``sigma2``
+    (taksiran varians galat log, NaN jika pasangan hanya pohon merentang).
+    """
+    i, j, nilai = _siapkan_pasangan(n, pasangan, nilai)
+    log_a = np.log(nilai)
+    b = np.bincount(i, weights=log_a, minlength=n) - np.bincount(j, weights=log_a, minlength=n)
+    v = cg_laplacian(n, i, j, b, toleransi)
+    bobot = np.exp(v - v.max())
+    bobot /= bobot.sum()
+    residual = log_a - (v[i] - v[j])
+    derajat_bebas = i.size - (n - 1)
+    return {
+        "bobot": bobot,
+        "galat_rms": float(np.sqrt(np.mean(residual ** 2))),
+        "sigma2": float(residual @ residual / derajat_bebas) if derajat_bebas > 0 else float("nan"),
+    }
+
+
+def _jangkar(Z, jumlah):
+    """Elemen di tepi embedding: ekstrem tiap koordinat plus ``jumlah`` elemen dengan norma terbesar
+
+    Pasangan terjauh (resistansi terbesar) punya ujung di selubung titik
+    embedding, dan titik ekstrem per koordinat adalah titik selubung.
+    """
+    n = Z.shape[0]
+    if jumlah >= n:
+        return np.arange(n)
+    # Z berpusat di 0 (solusi cg_laplacian), jadi norma = jarak ke pusat
+    norma = np.einsum("ij,ij->i", Z, Z)
+    jauh = np.argpartition(-norma, jumlah - 1)[:jumlah]
+    return np.unique(np.concatenate([Z.argmax(axis=0), Z.argmin(axis=0), jauh]))
+
+
+def saran_perbandingan(n, pasangan, jumlah=5, dimensi=None, seed=0, n_jangkar=None):
+    """Pasangan belum dinilai yang paling mengurangi ketidakpastian
+
+    Di bawah LLSM, Var(v_i - v_j) sebanding dengan resistansi efektif
+    R(i, j) antara i dan j pada graf perbandingan; pasangan dengan R
+    terbesar adalah yang paling tidak pasti. R didekati dengan proyeksi
+    Johnson-Lindenstrauss (Spielman-Srivastava): ``dimensi`` solusi
+    Laplacian sekaligus, lalu R(i, j) ~ ||z_i - z_j||^2.
+
+    Kandidat dibatasi ke pasangan yang salah satu ujungnya adalah elemen di
+    tepi embedding (``_jangkar``: ekstrem tiap koordinat plus ``n_jangkar``
+    elemen terjauh dari pusat), sehingga biayanya O(n * jangkar * dimensi)
+    dengan jangkar = O(dimensi + jumlah), bukan O(n^2 * dimensi).
+    ``n_jangkar`` >= n memeriksa semua pasangan.
+    Mengembalikan list (i, j, resistansi) terurut menurun.
+    """
+    pasangan = np.sort(np.asarray(pasangan, dtype=np.int64).reshape(-1, 2), axis=1)
+    i, j = pasangan[:, 0], pasangan[:, 1]
+    dimensi = dimensi or max(8, int(np.ceil(8 * np.log(max(n, 2)))))
+    rng = np.random.default_rng(seed)
+    # B^T Q^T: setiap sisi menyumbang +q ke i dan -q ke j
+    Q = rng.choice([-1.0, 1.0], size=(i.size, dimensi)) / np.sqrt(dimensi)
+    rhs = np.zeros((n, dimensi))
+    np.add.at(rhs, i, Q)
+    np.subtract.at(rhs, j, Q)
+    Z = cg_laplacian(n, i, j, rhs, toleransi=1e-6)
+
+    jangkar = _jangkar(Z, n_jangkar or max(4 * jumlah, 2 * dimensi))
+    norma = np.einsum("ij,ij->i", Z, Z)
+    posisi = np.full(n, -1)
+    posisi[jangkar] = np.arange(jangkar.size)
+    # Pasangan yang sudah dinilai, sebagai (posisi jangkar, elemen) ke arah mana pun
+    dinilai = [(posisi[a[posisi[a] >= 0]], c[posisi[a] >= 0]) for a, c in ((i, j), (j, i))]
+    terbaik = []
+    ukuran_blok = max(1, 2_000_000 // jangkar.size)
+    for awal in range(0, n, ukuran_blok):
+        blok = np.arange(awal, min(awal + ukuran_blok, n))
+        # ||z_a - z_c||^2 untuk a jangkar dan c di blok
+        R = norma[jangkar, None] + norma[None, blok] - 2.0 * (Z[jangkar] @ Z[blok].T)
+        # Pasangan antar-jangkar cukup sekali, dan tidak dengan dirinya sendiri
+        R[(posisi[None, blok] >= 0) & (posisi[None, blok] <= np.arange(jangkar.size)[:, None])] = -np.inf
+        for pa, c in dinilai:
+            di_blok = (c >= blok[0]) & (c <= blok[-1])
+            R[pa[di_blok], c[di_blok] - awal] = -np.inf
+        datar = R.ravel()
+        k = min(jumlah, int(np.isfinite(datar).sum()))
+        if k == 0:
+            continue
+        pilih = np.argpartition(-datar, k - 1)[:k]
+        terbaik.extend((float(datar[p]), *sorted((int(jangkar[p // blok.size]), int(blok[p % blok.size]))))
+                       for p in pilih)
+    terbaik.sort(reverse=True)
+    return [(a, c, r) for r, a, c in terbaik[:jumlah]]
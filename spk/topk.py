@@ -0,0 +1,159 @@
+"""Seleksi top-k dan prefilter Pareto (skyline) sebelum perangkingan.
+
+``top_k`` memakai argpartition (O(n)) lalu hanya mengurutkan k hasilnya.
+``skyband`` membuang alternatif yang didominasi oleh k alternatif lain atau
+lebih berdasarkan tipe Benefit/Cost. Alternatif seperti itu tidak mungkin
+masuk k teratas untuk fungsi skor yang monoton (SAW, WP, TOPSIS dengan
+bobot non-negatif), asalkan statistik normalisasi tetap dihitung dari
+seluruh data.
+"""
+
+import time
+
+import numpy as np
+
+from spk.engine import mask_benefit
+from spk.streaming import skor_chunk, statistik_kolom
+
+# Batas jumlah elemen array perbandingan (pendominasi x kandidat)
+_MAKS_ELEMEN = 4_000_000
+
+
+def top_k(skor, k):
+    """Indeks k skor terbesar, terurut dari yang terbaik (seri: indeks kecil dulu)"""
+    skor = np.asarray(skor)
+    n = skor.shape[0]
+    if k <= 0 or k >= n:
+        return np.argsort(-skor, kind="stable")
+    batas = -np.partition(-skor, k - 1)[k - 1]
+    # Semua yang lebih besar dari skor ke-k, lalu yang seri diambil dari indeks terkecil
+    atas = np.flatnonzero(skor > batas)
+    seri = np.flatnonzero(skor == batas)[:k - atas.size]
+    kandidat = np.concatenate([atas, seri])
+    # lexsort: kunci terakhir paling utama -> skor menurun, lalu indeks menaik
+    return kandidat[np.lexsort((kandidat, -skor[kandidat]))]
+
+
+def jumlah_pendominasi(P, B):
+    """Untuk setiap baris B, berapa baris P yang mendominasinya (arah: besar lebih baik)
+
+    Dibandingkan per kolom dengan array 2-D, jauh lebih cepat daripada
+    broadcast 3-D untuk jumlah kriteria kecil.
+    """
+    ge = np.ones((P.shape[0], B.shape[0]), dtype=bool)
+    gt = np.zeros((P.shape[0], B.shape[0]), dtype=bool)
+    for j in range(B.shape[1]):
+        pj = P[:, j, None]
+        bj = B[None, :, j]
+        ge &= pj >= bj
+        gt |= pj > bj
+    ge &= gt
+    return ge.sum(axis=0)
+
+
+def skyband(data, tipe, k=1, n_pivot=None, batas_eksak=20_000, min_pangkas=0.1):
+    """Indeks kandidat yang mungkin masuk k teratas (dipangkas dengan dominasi Pareto)
+
+    Tahap 1 (pivot): ``n_pivot`` alternatif dengan jumlah nilai terbesar
+    (arah Benefit) dipakai sebagai pendominasi; alternatif yang didominasi
+    oleh k pivot atau lebih dibuang. Biayanya O(n * n_pivot * kriteria).
+    Tahap 2 (eksak): jika sisa kandidat tidak lebih dari ``batas_eksak``,
+    k-skyband dihitung tepat dengan membandingkan setiap kandidat dengan
+    kandidat yang jumlah nilainya lebih besar. Tanpa tahap 2 hasilnya
+    superset dari k-skyband, tetap aman untuk top-k.
+
+    Pada data berdimensi tinggi hampir tidak ada yang terdominasi; jika
+    sampel 2048 alternatif memangkas kurang dari ``min_pangkas`` bagian, prefilter
+    dihentikan dan semua indeks dikembalikan.
+
+    Mengembalikan indeks kandidat terurut.
+    """
+    X = np.asarray(data, dtype=float)
+    benefit = mask_benefit(tipe, X.shape[1])
+    Y = np.where(benefit, X, -X)
+    n = Y.shape[0]
+    if k >= n:
+        return np.arange(n)
+
+    n_pivot = min(n, n_pivot or k)
+    jumlah = Y.sum(axis=1)
+    P = Y[np.argpartition(-jumlah, n_pivot - 1)[:n_pivot]]
+    ukuran = max(1, _MAKS_ELEMEN // n_pivot)
+    lolos = np.zeros(n, dtype=bool)
+    # Uji coba pada sampel kecil dulu sebelum memindai semua alternatif
+    sampel = Y[np.linspace(0, n - 1, min(n, 2048)).astype(np.int64)]
+    if n > 2048 and (jumlah_pendominasi(P, sampel) < k).mean() > 1 - min_pangkas:
+        return np.arange(n)
+    for awal in range(0, n, ukuran):
+        lolos[awal:awal + ukuran] = jumlah_pendominasi(P, Y[awal:awal + ukuran]) < k
+    kandidat = np.flatnonzero(lolos)
+
+    if kandidat.size > batas_eksak:
+        return kandidat
+
+    # Pendominasi selalu punya jumlah nilai lebih besar, jadi cukup cek yang di depannya
+    urutan = kandidat[np.argsort(-jumlah[kandidat], kind="stable")]
+    Y_urut = Y[urutan]
+    dominasi = np.zeros(urutan.size, dtype=np.int64)
+    ukuran = max(1, _MAKS_ELEMEN // max(urutan.size, 1))
+    for awal in range(0, urutan.size, ukuran):
+        B = Y_urut[awal:awal + ukuran]
+        dominasi[awal:awal + ukuran] = jumlah_pendominasi(Y_urut[:awal + len(B)], B)
+    return np.sort(urutan[dominasi < k])
+
+
+def peringkat_top_k(metode, data, bobot, tipe, k=50, prefilter=False, bandingkan=False, metrik="euclidean"):
+    """Skor dan k alternatif teratas, opsional dengan prefilter skyline
+
+    Statistik normalisasi (max/min, jumlah kuadrat, total S) selalu dihitung
+    dari seluruh data sehingga skor alternatif yang tersisa sama persis
+    dengan perhitungan penuh. Untuk WP, total S butuh log S semua
+    alternatif, jadi prefilter tidak menghemat waktu. Prefilter hanya
+    valid jika semua bobot >= 0 (bobot negatif membalik arah dominasi).
+    ``metrik`` adalah jarak ke solusi ideal TOPSIS.
+
+    Mengembalikan dict berisi ``indeks``, ``skor`` (k teratas), ``n_alt``,
+    ``n_dipangkas`` dan ``waktu`` per tahap; jika
+    ``bandingkan=True`` juga ``waktu_penuh`` (skor semua + urut penuh) dan
+    ``waktu_hemat``.
+    """
+    X = np.asarray(data, dtype=float)
+    metode = metode.upper()
+    waktu = {}
+
+    t0 = time.perf_counter()
+    stat = statistik_kolom([(None, X)], metode, bobot, tipe)
+    waktu["statistik"] = time.perf_counter() - t0
+
+    kandidat = None
+    if prefilter:
+        if np.any(np.asarray(bobot, dtype=float) < 0):
+            raise ValueError("Prefilter Pareto hanya valid jika semua bobot >= 0")
+        t0 = time.perf_counter()
+        kandidat = skyband(X, tipe, k=k if k > 0 else X.shape[0])
+        waktu["prefilter"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    X_kandidat = X if kandidat is None else X[kandidat]
+    skor = skor_chunk(metode, X_kandidat, bobot, tipe, stat, metrik)
+    waktu["skor"] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    pilih = top_k(skor, k)
+    indeks = pilih if kandidat is None else kandidat[pilih]
+    waktu["seleksi"] = time.perf_counter() - t0
+
+    hasil = {
+        "indeks": indeks,
+        "skor": skor[pilih],
+        "n_alt": X.shape[0],
+        "n_dipangkas": 0 if kandidat is None else X.shape[0] - kandidat.size,
+        "waktu": waktu,
+    }
+    if bandingkan:
+        t0 = time.perf_counter()
+        skor_penuh = skor_chunk(metode, X, bobot, tipe, stat, metrik)
+        np.argsort(-skor_penuh, kind="stable")
+        hasil["waktu_penuh"] = waktu["statistik"] + time.perf_counter() - t0
+        hasil["waktu_hemat"] = hasil["waktu_penuh"] - sum(waktu.values())
+    return hasil
@@ -0,0 +1,140 @@
+"""TOPSIS untuk matriks besar: alternatif dibagi per chunk dan dihitung paralel.
+
+Dua lintasan atas data, keduanya per chunk di thread pool:
+
+1. Jumlah kuadrat (akumulasi float64), max dan min setiap kolom. Karena
+   faktor f_j = w_j / sqrt(sum x_j^2) tidak bergantung baris, solusi ideal
+   A+/A- langsung didapat dari f * max/min kolom tanpa membentuk matriks
+   terbobot.
+2. Setiap chunk disalin ke buffer kerja milik thread, dinormalisasi dan
+   dibobot sekaligus di tempat (x * f), lalu jarak ke A+ dan A- ditulis
+   langsung ke array hasil.
+
+Buffer kerja dialokasikan sekali per thread (bukan per chunk) dan semua
+operasi memakai ``out=``, sehingga memori tambahan hanya beberapa MB per
+thread di luar data dan hasil. Operasi NumPy melepas GIL, jadi thread
+sudah memakai semua core tanpa menyalin data ke proses lain; ``data``
+boleh berupa np.memmap dan hanya dibaca per chunk. ``dtype=np.float32``
+membuat buffer dan hasil float32 (separuh memori float64).
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from spk.engine import cek_metrik, jarak_baris, mask_benefit, preferensi_topsis, solusi_ideal
+from spk.profil import tahap
+
+# Ukuran target satu buffer kerja (byte); cukup kecil untuk tetap di cache L2/L3
+BYTE_PER_CHUNK = 2 * 1024 * 1024
+
+
+def _jalankan_per_chunk(n_alt, baris_per_chunk, n_worker, kerja):
+    """Panggil ``kerja(ambil_chunk)`` di ``n_worker`` thread; chunk dibagi dinamis
+
+    ``ambil_chunk()`` mengembalikan (awal, akhir) berikutnya atau None jika habis.
+    Mengembalikan daftar hasil ``kerja`` per thread.
+    """
+    batas = iter(range(0, n_alt, baris_per_chunk))
+    kunci = threading.Lock()
+
+    def ambil_chunk():
+        with kunci:
+            awal = next(batas, None)
+        return None if awal is None else (awal, min(awal + baris_per_chunk, n_alt))
+
+    if n_worker == 1:
+        return [kerja(ambil_chunk)]
+    with ThreadPoolExecutor(max_workers=n_worker) as pool:
+        return list(pool.map(lambda _: kerja(ambil_chunk), range(n_worker)))
+
+
+def hitung_topsis_paralel(data, bobot, tipe, metrik="euclidean", dtype=None, n_worker=None,
+                          baris_per_chunk=None, out_terbobot=None):
+    """TOPSIS per chunk alternatif di thread pool
+
+    ``data`` (alternatif x kriteria) tidak disalin maupun diubah. ``dtype``
+    menentukan buffer kerja dan hasil (default dtype data jika float32,
+    selain itu float64). ``out_terbobot`` opsional diisi matriks
+    ternormalisasi terbobot; boleh ``data`` itu sendiri (jika bisa ditulis)
+    agar normalisasi dan pembobotan terjadi di tempat.
+
+    Mengembalikan (ideal_pos, ideal_neg, d_pos, d_neg, preferensi) yang
+    sama dengan ``hitung_topsis_np`` untuk metrik yang sama.
+    """
+    cek_metrik(metrik)
+    X = data if isinstance(data, np.ndarray) else np.asarray(data, dtype=float)
+    if X.ndim != 2:
+        raise ValueError("Matriks keputusan harus 2 dimensi (alternatif x kriteria)")
+    n_alt, n_krit = X.shape
+    w = np.asarray(bobot, dtype=float)
+    if w.shape != (n_krit,):
+        raise ValueError(f"Jumlah bobot ({w.size}) tidak sama dengan jumlah kriteria ({n_krit})")
+    benefit = mask_benefit(tipe, n_krit)
+    if dtype is None:
+        dtype = np.float32 if X.dtype == np.float32 else np.float64
+    dtype = np.dtype(dtype)
+    if out_terbobot is not None and out_terbobot.shape != X.shape:
+        raise ValueError(f"out_terbobot harus berukuran {X.shape}, bukan {out_terbobot.shape}")
+    n_worker = max(1, int(n_worker or os.cpu_count() or 1))
+    if baris_per_chunk is None:
+        baris_per_chunk = max(1024, BYTE_PER_CHUNK // max(1, n_krit * dtype.itemsize))
+    # Buffer kerja tidak perlu lebih besar dari datanya
+    baris_per_chunk = max(1, min(int(baris_per_chunk), n_alt))
+    n_worker = min(n_worker, max(1, -(-n_alt // baris_per_chunk)))
+
+    def statistik(ambil_chunk):
+        buf = np.empty((baris_per_chunk, n_krit), dtype=dtype)
+        jumlah_kuadrat = np.zeros(n_krit)
+        col_max = np.full(n_krit, -np.inf)
+        col_min = np.full(n_krit, np.inf)
+        while (chunk := ambil_chunk()) is not None:
+            b = buf[:chunk[1] - chunk[0]]
+            np.copyto(b, X[chunk[0]:chunk[1]], casting="unsafe")
+            np.maximum(col_max, b.max(axis=0), out=col_max)
+            np.minimum(col_min, b.min(axis=0), out=col_min)
+            np.square(b, out=b)
+            jumlah_kuadrat += b.sum(axis=0, dtype=np.float64)
+        return jumlah_kuadrat, col_max, col_min
+
+    with tahap("statistik kolom"):
+        hasil = _jalankan_per_chunk(n_alt, baris_per_chunk, n_worker, statistik)
+        jumlah_kuadrat = np.sum([h[0] for h in hasil], axis=0)
+        col_max = np.max([h[1] for h in hasil], axis=0)
+        col_min = np.min([h[2] for h in hasil], axis=0)
+
+    with tahap("solusi ideal"):
+        pembagi = np.sqrt(jumlah_kuadrat)
+        faktor = np.zeros(n_krit)
+        np.divide(w, pembagi, out=faktor, where=pembagi > 0)
+        # Faktor negatif (bobot negatif) membalik max dan min kolom
+        terbobot_max = np.where(faktor >= 0, faktor * col_max, faktor * col_min)
+        terbobot_min = np.where(faktor >= 0, faktor * col_min, faktor * col_max)
+        ideal_pos, ideal_neg = solusi_ideal(terbobot_max, terbobot_min, benefit)
+        faktor_k, pos_k, neg_k = (a.astype(dtype) for a in (faktor, ideal_pos, ideal_neg))
+
+    d_pos = np.empty(n_alt, dtype=dtype)
+    d_neg = np.empty(n_alt, dtype=dtype)
+    preferensi = np.empty(n_alt, dtype=dtype)
+
+    def jarak(ambil_chunk):
+        buf = np.empty((baris_per_chunk, n_krit), dtype=dtype)
+        selisih = np.empty_like(buf)
+        while (chunk := ambil_chunk()) is not None:
+            awal, akhir = chunk
+            b, s = buf[:akhir - awal], selisih[:akhir - awal]
+            np.copyto(b, X[awal:akhir], casting="unsafe")
+            np.multiply(b, faktor_k, out=b)
+            if out_terbobot is not None:
+                out_terbobot[awal:akhir] = b
+            np.subtract(b, pos_k, out=s)
+            jarak_baris(s, metrik, out=d_pos[awal:akhir])
+            np.subtract(b, neg_k, out=s)
+            jarak_baris(s, metrik, out=d_neg[awal:akhir])
+            preferensi_topsis(d_pos[awal:akhir], d_neg[awal:akhir], out=preferensi[awal:akhir])
+
+    with tahap("jarak & preferensi"):
+        _jalankan_per_chunk(n_alt, baris_per_chunk, n_worker, jarak)
+    return ideal_pos, ideal_neg, d_pos, d_neg, preferensi
@@ -0,0 +1,70 @@
+"""Mesin AHP (spk.ahp): eigenvektor, konsistensi dan tabel RI."""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from spk.ahp import hitung_ahp_batch, indeks_acak, prioritas_eigen
+from spk.indeks_acak import matriks_acak
+
+# Tabel RI Saaty untuk n = 1..10
+RI_SAATY = [0.0, 0.0, 0.58, 0.9, 1.12, 1.24, 1.32, 1.41, 1.45, 1.49]
+
+
+def eigen_numpy(A):
+    """Eigenvektor utama (jumlah 1) dan lambda max dengan np.linalg.eig"""
+    nilai, vektor = np.linalg.eig(A)
+    utama = np.argmax(nilai.real)
+    v = np.abs(vektor[:, utama].real)
+    return v / v.sum(), nilai[utama].real
+
+
+@pytest.mark.parametrize("n", [3, 4, 7, 10, 15])
+def test_eigen_sama_dengan_linalg(n):
+    A = matriks_acak(np.random.default_rng(n), 20, n)
+    bobot, lambda_max, konvergen = prioritas_eigen(A)
+    assert konvergen.all()
+    for k in range(A.shape[0]):
+        v, lam = eigen_numpy(A[k])
+        np.testing.assert_allclose(bobot[k], v, atol=1e-8)
+        assert abs(lambda_max[k] - lam) < 1e-8
+
+
+def test_matriks_konsisten():
+    w = np.array([0.5, 0.25, 0.15, 0.1])
+    bobot, lambda_max, ci, cr = hitung_ahp_batch(w[:, None] / w[None, :])
+    np.testing.assert_allclose(bobot[0], w)
+    np.testing.assert_allclose([lambda_max[0], ci[0], cr[0]], [4.0, 0.0, 0.0], atol=1e-12)
+
+
+def test_cr_dari_lambda_dan_ri():
+    A = matriks_acak(np.random.default_rng(0), 10, 6)
+    _, lambda_max, ci, cr = hitung_ahp_batch(A)
+    np.testing.assert_allclose(ci, (lambda_max - 6) / 5)
+    np.testing.assert_allclose(cr, ci / 1.24)
+
+
+@pytest.mark.parametrize("n", range(1, 11))
+def test_ri_saaty(n):
+    assert indeks_acak(n) == RI_SAATY[n - 1]
+
+
+def test_ri_monte_carlo_naik_dan_batas_tabel():
+    ri = [indeks_acak(n) for n in range(11, 101)]
+    assert ri[0] > RI_SAATY[-1] - 0.05
+    assert all(b >= a - 0.01 for a, b in zip(ri, ri[1:]))
+    with pytest.raises(ValueError):
+        indeks_acak(10_000)
+
+
+def test_tidak_konvergen_diberi_peringatan():
+    A = matriks_acak(np.random.default_rng(1), 5, 8)
+    with pytest.warns(RuntimeWarning, match="belum konvergen"):
+        _, _, konvergen = prioritas_eigen(A, maks_iterasi=1)
+    assert not konvergen.any()
+    with pytest.warns(RuntimeWarning, match="belum konvergen"):
+        hitung_ahp_batch(A, maks_iterasi=1)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        hitung_ahp_batch(A)
@@ -0,0 +1,84 @@
+"""Cache hasil (spk.cache): kunci hash, eviksi LRU dan batas byte."""
+
+import numpy as np
+import pytest
+
+from spk.cache import BYTE_MEMMAP, CacheHasil, _ukuran, kunci_hash
+
+
+def array_kb(kb, isi=0.0):
+    return np.full(kb * 128, isi)
+
+
+def test_kunci_hash_isi_dtype_dan_bentuk():
+    x = np.arange(6.0)
+    assert kunci_hash("SAW", x) == kunci_hash("SAW", x.copy()) == kunci_hash("SAW", x.tolist())
+    assert kunci_hash("SAW", x) != kunci_hash("WP", x)
+    assert kunci_hash("SAW", x) != kunci_hash("SAW", x.reshape(2, 3))
+    assert kunci_hash("SAW", x) != kunci_hash("SAW", x.astype(np.float32))
+    assert kunci_hash("SAW", ["a", "b"]) != kunci_hash("SAW", ["ab"])
+
+
+def test_hit_miss_dan_hasil_dibekukan():
+    cache = CacheHasil(1 << 20)
+    panggilan = []
+
+    def fungsi(x):
+        panggilan.append(x)
+        return {"skor": np.arange(x)}
+
+    a = cache.hitung("k", fungsi, 3)
+    b = cache.hitung("k", fungsi, 3)
+    assert a is b and panggilan == [3]
+    assert cache.statistik()["hit"] == 1 and cache.statistik()["miss"] == 1
+    with pytest.raises(ValueError):
+        a["skor"][0] = 5
+
+
+def test_eviksi_lru_dan_batas_byte():
+    ukuran = _ukuran(array_kb(100))
+    cache = CacheHasil(3 * ukuran)
+    for k in "abc":
+        cache.simpan(k, array_kb(100))
+    # Akses "a" membuatnya terbaru, jadi "b" yang tertua dan dikeluarkan lebih dulu
+    assert cache.ambil("a") is not None
+    cache.simpan("d", array_kb(100))
+    assert cache.ambil("b") is None
+    assert all(cache.ambil(k) is not None for k in "acd")
+    assert cache.ukuran_byte == 3 * ukuran <= cache.batas_byte
+    # Entri dua kali lebih besar mengeluarkan dua entri tertua (c lalu a, d baru diakses)
+    cache.ambil("d")
+    cache.simpan("e", array_kb(200))
+    assert [cache.ambil(k) is not None for k in "acde"] == [False, False, True, True]
+    assert cache.statistik()["eviksi"] == 3
+    assert cache.ukuran_byte <= cache.batas_byte
+
+
+def test_hasil_lebih_besar_dari_batas_tidak_disimpan():
+    cache = CacheHasil(1000)
+    hasil = cache.simpan("besar", array_kb(10))
+    assert hasil.flags.writeable
+    assert cache.ambil("besar") is None and cache.ukuran_byte == 0
+
+
+def test_simpan_ulang_mengganti_ukuran():
+    cache = CacheHasil(1 << 20)
+    cache.simpan("k", array_kb(100))
+    cache.simpan("k", array_kb(10))
+    assert cache.ukuran_byte == _ukuran(array_kb(10))
+    cache.kosongkan()
+    assert cache.ukuran_byte == 0 and cache.statistik()["entri"] == 0
+
+
+def test_memmap_dihitung_nominal(tmp_path):
+    np.save(tmp_path / "x.npy", np.zeros((1000, 100)))
+    X = np.load(tmp_path / "x.npy", mmap_mode="r")
+    for arr in (X, X[10:20], np.asarray(X)):
+        assert _ukuran(arr) == BYTE_MEMMAP + 112
+    # Hasil hitungan dari memmap ada di RAM dan dihitung penuh
+    assert _ukuran(X * 2) == X.nbytes + 112
+    # Skenario memmap besar tidak mengeluarkan hasil di memori
+    cache = CacheHasil(_ukuran(array_kb(100)) + 2 * (BYTE_MEMMAP + 112))
+    cache.simpan("hasil", array_kb(100))
+    cache.simpan("skenario", {"data": X})
+    assert cache.ambil("hasil") is not None and cache.ambil("skenario") is not None
@@ -0,0 +1,98 @@
+"""Parity mesin NumPy (spk.engine) terhadap implementasi manual (spk.manual)."""
+
+import numpy as np
+import pytest
+
+from spk.engine import hitung_saw_np, hitung_topsis_batch, hitung_topsis_np, hitung_wp_batch, hitung_wp_np
+from spk.manual import hitung_saw, hitung_topsis, hitung_wp
+
+TOLERANSI = 1e-9
+
+
+def kasus_acak(seed, kolom_nol=False, bobot_nol=False, cost_nol=True):
+    """Matriks keputusan, bobot dan tipe acak dari seed
+
+    ``kolom_nol`` mengosongkan satu kolom (semua 0), ``bobot_nol`` membuat
+    satu bobot 0. Jika ``cost_nol`` False, kolom nol selalu Benefit (WP
+    tidak terdefinisi untuk 0 pada kriteria Cost berbobot).
+    """
+    rng = np.random.default_rng(seed)
+    n_alt, n_krit = int(rng.integers(2, 30)), int(rng.integers(2, 8))
+    data = rng.uniform(1, 100, (n_alt, n_krit))
+    bobot = rng.dirichlet(np.ones(n_krit))
+    tipe = list(rng.choice(["Benefit", "Cost"], n_krit))
+    tipe[0], tipe[-1] = "Benefit", "Cost"
+    if kolom_nol:
+        j = int(rng.integers(n_krit))
+        data[:, j] = 0.0
+        if not cost_nol:
+            tipe[j] = "Benefit"
+    if bobot_nol:
+        bobot[int(rng.integers(n_krit))] = 0.0
+    return data, bobot, tipe
+
+
+def assert_sama(hasil_np, hasil_manual):
+    for a, b in zip(hasil_np, hasil_manual):
+        np.testing.assert_allclose(a, np.asarray(b, dtype=float), rtol=TOLERANSI, atol=TOLERANSI)
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("kolom_nol", [False, True])
+@pytest.mark.parametrize("bobot_nol", [False, True])
+def test_saw(seed, kolom_nol, bobot_nol):
+    data, bobot, tipe = kasus_acak(seed, kolom_nol, bobot_nol)
+    assert_sama(hitung_saw_np(data, bobot, tipe), hitung_saw(data.tolist(), bobot.tolist(), tipe))
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("kolom_nol", [False, True])
+@pytest.mark.parametrize("bobot_nol", [False, True])
+def test_wp(seed, kolom_nol, bobot_nol):
+    data, bobot, tipe = kasus_acak(seed, kolom_nol, bobot_nol, cost_nol=False)
+    assert_sama(hitung_wp_np(data, bobot, tipe), hitung_wp(data.tolist(), bobot.tolist(), tipe))
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("kolom_nol", [False, True])
+@pytest.mark.parametrize("bobot_nol", [False, True])
+def test_topsis(seed, kolom_nol, bobot_nol):
+    data, bobot, tipe = kasus_acak(seed, kolom_nol, bobot_nol)
+    assert_sama(hitung_topsis_np(data, bobot, tipe), hitung_topsis(data.tolist(), bobot.tolist(), tipe))
+
+
+def test_wp_nol_pada_cost_ditolak():
+    with pytest.raises(ValueError):
+        hitung_wp_np([[0.0, 2.0], [3.0, 4.0]], [0.5, 0.5], ["Cost", "Benefit"])
+
+
+def test_wp_nol_pada_cost_berbobot_nol():
+    data, bobot, tipe = [[0.0, 2.0], [3.0, 4.0]], [0.0, 1.0], ["Cost", "Benefit"]
+    assert_sama(hitung_wp_np(data, bobot, tipe), hitung_wp(data, bobot, tipe))
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("kolom_nol", [False, True])
+@pytest.mark.parametrize("bobot_nol", [False, True])
+def test_wp_batch_sama_dengan_wp_np(seed, kolom_nol, bobot_nol):
+    data, bobot, tipe = kasus_acak(seed, kolom_nol, bobot_nol, cost_nol=False)
+    daftar_bobot = [bobot, np.roll(bobot, 1), np.ones_like(bobot)]
+    skor = hitung_wp_batch(data, daftar_bobot, tipe)
+    for w, v in zip(daftar_bobot, skor):
+        np.testing.assert_allclose(v, hitung_wp_np(data, w, tipe)[2], rtol=TOLERANSI, atol=TOLERANSI)
+
+
+def test_wp_batch_nol_pada_benefit():
+    skor = hitung_wp_batch([[0.0, 2.0], [3.0, 4.0]], [[0.5, 0.5], [0.0, 1.0]], ["Benefit", "Benefit"])
+    np.testing.assert_allclose(skor, [[0.0, 1.0], [1 / 3, 2 / 3]])
+    with pytest.raises(ValueError):
+        hitung_wp_batch([[0.0, 2.0], [3.0, 4.0]], [[0.5, 0.5]], ["Cost", "Benefit"])
+
+
+@pytest.mark.parametrize("metrik", ["euclidean", "manhattan", "chebyshev"])
+def test_topsis_batch_per_metrik(metrik):
+    data, bobot, tipe = kasus_acak(3, kolom_nol=True)
+    daftar_bobot = [bobot, np.roll(bobot, 1), np.ones_like(bobot)]
+    skor = hitung_topsis_batch(data, daftar_bobot, tipe, metrik)
+    for w, v in zip(daftar_bobot, skor):
+        np.testing.assert_allclose(v, hitung_topsis_np(data, w, tipe, metrik)[6], rtol=TOLERANSI, atol=TOLERANSI)
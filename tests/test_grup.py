@@ -0,0 +1,72 @@
+"""Agregasi AHP kelompok (spk.grup): AIJ, AIP dan pembacaan per chunk."""
+
+import io
+
+import numpy as np
+import pytest
+
+from spk.ahp import hitung_ahp_batch
+from spk.grup import AkumulatorGrup, agregasi_grup, dari_segitiga_atas
+from spk.indeks_acak import matriks_acak
+
+
+def responden(seed=0, r=37, n=5):
+    return matriks_acak(np.random.default_rng(seed), r, n)
+
+
+@pytest.mark.parametrize("ukuran_chunk", [1, 7, 1000])
+def test_aij_rata_geometrik_per_elemen(ukuran_chunk):
+    A = responden()
+    hasil = agregasi_grup(A, "AIJ", ukuran_chunk=ukuran_chunk)
+    geomean = np.exp(np.log(A).mean(axis=0))
+    np.testing.assert_allclose(hasil["matriks"], geomean, rtol=1e-12)
+    np.testing.assert_allclose(hasil["bobot"], hitung_ahp_batch(geomean)[0][0], rtol=1e-10)
+    assert hasil["n_responden"] == hasil["n_dipakai"] == A.shape[0]
+
+
+@pytest.mark.parametrize("ukuran_chunk", [1, 7, 1000])
+def test_aip_rata_geometrik_prioritas(ukuran_chunk):
+    A = responden()
+    hasil = agregasi_grup(A, "AIP", ukuran_chunk=ukuran_chunk)
+    geomean = np.exp(np.log(hitung_ahp_batch(A)[0]).mean(axis=0))
+    np.testing.assert_allclose(hasil["bobot"], geomean / geomean.sum(), rtol=1e-10)
+    np.testing.assert_allclose(hasil["matriks"], hasil["bobot"][:, None] / hasil["bobot"][None, :])
+    assert hasil["cr"] == 0.0
+
+
+def test_buang_tidak_konsisten():
+    A = responden(r=50)
+    cr = hitung_ahp_batch(A)[3]
+    hasil = agregasi_grup(A, "AIJ", batas_cr=0.2, buang_tidak_konsisten=True, ukuran_chunk=9)
+    konsisten = cr <= 0.2
+    assert 0 < konsisten.sum() < A.shape[0]
+    np.testing.assert_array_equal(hasil["tidak_konsisten"], np.flatnonzero(~konsisten))
+    assert hasil["n_dipakai"] == konsisten.sum()
+    np.testing.assert_allclose(hasil["matriks"], np.exp(np.log(A[konsisten]).mean(axis=0)), rtol=1e-12)
+
+
+def test_semua_dibuang_ditolak():
+    akumulator = AkumulatorGrup(5, batas_cr=-1.0, buang_tidak_konsisten=True)
+    akumulator.tambah(responden(r=3))
+    with pytest.raises(ValueError):
+        akumulator.hasil()
+
+
+def test_csv_dan_npy_sama_dengan_array():
+    A = responden(r=12, n=4)
+    atas = np.triu_indices(4, 1)
+    csv = "id," + ",".join(f"a{i + 1}{j + 1}" for i, j in zip(*atas)) + "\n"
+    csv += "".join(f"r{r}," + ",".join(repr(v) for v in A[r][atas]) + "\n" for r in range(A.shape[0]))
+    npy = io.BytesIO()
+    np.save(npy, A)
+    npy.name = "penilaian.npy"
+    dari_array = agregasi_grup(A, "AIJ")
+    for sumber, format in [(io.StringIO(csv), "csv"), (npy, None)]:
+        hasil = agregasi_grup(sumber, "AIJ", ukuran_chunk=5, format=format)
+        np.testing.assert_allclose(hasil["matriks"], dari_array["matriks"], rtol=1e-12)
+    np.testing.assert_allclose(dari_segitiga_atas(A[:, atas[0], atas[1]]), A, rtol=1e-12)
+
+
+def test_ukuran_n_salah_ditolak():
+    with pytest.raises(ValueError):
+        agregasi_grup(responden(n=5), "AIJ", n=4)
@@ -0,0 +1,56 @@
+"""PeringkatInkremental terhadap perhitungan penuh spk.engine."""
+
+import numpy as np
+import pytest
+
+from spk.engine import hitung_saw_np, hitung_topsis_np, hitung_wp_np
+from spk.inkremental import PeringkatInkremental
+
+PENUH = {
+    "SAW": lambda X, w, t: hitung_saw_np(X, w, t)[1],
+    "WP": lambda X, w, t: hitung_wp_np(X, w, t)[2],
+    "TOPSIS": lambda X, w, t: hitung_topsis_np(X, w, t)[6],
+}
+
+
+@pytest.mark.parametrize("metode", list(PENUH))
+def test_tambah_dan_ubah_sama_dengan_penuh(metode):
+    rng = np.random.default_rng(0)
+    bobot, tipe = [0.4, 0.35, 0.25], ["Benefit", "Cost", "Benefit"]
+    peringkat = PeringkatInkremental(metode, bobot, tipe, k=5, data=rng.uniform(1, 10, (50, 3)))
+    for baris in rng.uniform(1, 10, (20, 3)):
+        peringkat.tambah(baris)
+    for _ in range(100):
+        peringkat.ubah(int(rng.integers(peringkat.n)), int(rng.integers(3)), float(rng.uniform(1, 10)))
+    X = peringkat.data.copy()
+    np.testing.assert_allclose(peringkat.skor(), PENUH[metode](X, bobot, tipe), atol=1e-12)
+
+
+def test_ubah_wp_ditolak_tidak_mengubah_statistik():
+    data = [[1.0, 1.0], [2.0, 2.0], [4.0, 4.0]]
+    peringkat = PeringkatInkremental("WP", [0.5, 0.5], ["Benefit", "Cost"], data=data)
+    statistik = (peringkat.col_max.copy(), peringkat.col_min.copy(), peringkat.sum_kuadrat.copy())
+    skor = peringkat.skor()
+    with pytest.raises(ValueError):
+        peringkat.ubah(0, 1, 0.0)
+    np.testing.assert_array_equal(peringkat.data, data)
+    for a, b in zip((peringkat.col_max, peringkat.col_min, peringkat.sum_kuadrat), statistik):
+        np.testing.assert_array_equal(a, b)
+    np.testing.assert_allclose(peringkat.skor(), skor)
+
+
+def test_ubah_indeks_kriteria_di_luar_batas():
+    peringkat = PeringkatInkremental("SAW", [0.5, 0.5], ["Benefit", "Cost"], data=[[1.0, 2.0]])
+    for j in (2, -1):
+        with pytest.raises(IndexError):
+            peringkat.ubah(0, j, 3.0)
+
+
+def test_ubah_wp_tidak_memindai_kolom():
+    data = np.random.default_rng(1).uniform(1, 10, (30, 2))
+    peringkat = PeringkatInkremental("WP", [0.5, 0.5], ["Benefit", "Cost"], data=data)
+    for j in range(2):
+        peringkat.ubah(int(data[:, j].argmax()), j, 5.0)
+        peringkat.ubah(int(data[:, j].argmin()), j, 5.0)
+    assert peringkat.statistik["ekstrem_hilang"] == 0
+    np.testing.assert_allclose(peringkat.skor(), PENUH["WP"](peringkat.data.copy(), [0.5, 0.5], ["Benefit", "Cost"]))
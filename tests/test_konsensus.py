@@ -0,0 +1,101 @@
+"""Korelasi dan agregasi peringkat di spk.konsensus terhadap versi brute force."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from spk.konsensus import (
+    borda, copeland, jalankan_konsensus, kendall, kendall_tau, peringkat_rata, spearman,
+)
+
+
+def kendall_brute(x, y):
+    """Kendall tau-b dari definisi: semua pasangan i < j"""
+    konkordan = diskordan = seri_x = seri_y = 0
+    for i, j in itertools.combinations(range(len(x)), 2):
+        dx, dy = np.sign(x[i] - x[j]), np.sign(y[i] - y[j])
+        if dx == 0 and dy == 0:
+            continue
+        if dx == 0:
+            seri_x += 1
+        elif dy == 0:
+            seri_y += 1
+        elif dx == dy:
+            konkordan += 1
+        else:
+            diskordan += 1
+    penyebut = np.sqrt((konkordan + diskordan + seri_x) * (konkordan + diskordan + seri_y))
+    return (konkordan - diskordan) / penyebut if penyebut else float("nan")
+
+
+def peringkat_acak(seed, m=4, n=40, seri=True):
+    rng = np.random.default_rng(seed)
+    skor = rng.integers(0, 8, (m, n)) if seri else rng.permutation(np.tile(np.arange(n), (m, 1)), axis=1)
+    return np.array([peringkat_rata(s) for s in skor])
+
+
+def test_peringkat_rata():
+    np.testing.assert_array_equal(peringkat_rata([0.3, 0.9, 0.3, 0.1, 0.9]), [3.5, 1.5, 3.5, 5.0, 1.5])
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("n", [2, 3, 17, 64, 129])
+def test_kendall_tau_sama_dengan_brute_force(seed, n):
+    rng = np.random.default_rng(seed)
+    x, y = rng.integers(0, max(2, n // 3), n), rng.integers(0, max(2, n // 3), n)
+    a, b = kendall_tau(x, y), kendall_brute(x, y)
+    assert (np.isnan(a) and np.isnan(b)) or a == pytest.approx(b, abs=1e-12)
+
+
+def test_kendall_tau_batas():
+    assert kendall_tau([1, 2, 3, 4], [1, 2, 3, 4]) == pytest.approx(1.0)
+    assert kendall_tau([1, 2, 3, 4], [4, 3, 2, 1]) == pytest.approx(-1.0)
+    assert np.isnan(kendall_tau([1, 1, 1], [1, 2, 3]))
+
+
+def test_kendall_matriks():
+    P = peringkat_acak(0)
+    K = kendall(P)
+    for a, b in itertools.combinations(range(P.shape[0]), 2):
+        assert K[a, b] == K[b, a] == pytest.approx(kendall_brute(P[a], P[b]))
+    np.testing.assert_array_equal(np.diag(K), 1.0)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_spearman_pearson_dari_peringkat(seed):
+    P = peringkat_acak(seed)
+    S = spearman(P)
+    for a, b in itertools.product(range(P.shape[0]), repeat=2):
+        x, y = P[a] - P[a].mean(), P[b] - P[b].mean()
+        assert S[a, b] == pytest.approx(x @ y / np.sqrt((x @ x) * (y @ y)))
+
+
+def test_spearman_tanpa_variasi():
+    S = spearman(np.array([[1.0, 2.0, 3.0], [2.0, 2.0, 2.0]]))
+    assert S[0, 0] == S[1, 1] == 1.0
+    assert np.isnan(S[0, 1])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_borda_dan_copeland(seed):
+    P = peringkat_acak(seed, m=3, n=25)
+    n = P.shape[1]
+    np.testing.assert_allclose(borda(P), [sum(n - P[m, i] for m in range(3)) for i in range(n)])
+    harapan = np.zeros(n)
+    for i, j in itertools.permutations(range(n), 2):
+        # i menang atas j jika lebih banyak metode menempatkan i lebih tinggi (peringkat lebih kecil)
+        harapan[i] += np.sign(np.sign(P[:, j] - P[:, i]).sum())
+    np.testing.assert_array_equal(copeland(P, ukuran_blok=7), harapan)
+
+
+def test_jalankan_konsensus_dan_metode_gagal():
+    data = np.random.default_rng(0).uniform(1, 100, (30, 4))
+    data[0, 1] = 0.0
+    hasil = jalankan_konsensus(data, [0.4, 0.3, 0.2, 0.1], ["Benefit", "Cost", "Benefit", "Cost"])
+    # Nilai 0 pada Cost: WP dan AHP rasio gagal, SAW dan TOPSIS tetap dihitung
+    assert hasil["metode"] == ["SAW", "TOPSIS"]
+    assert set(hasil["error"]) == {"WP", "AHP"}
+    P = np.array([hasil["peringkat"][m] for m in hasil["metode"]])
+    np.testing.assert_allclose(hasil["borda"], borda(P))
+    np.testing.assert_allclose(hasil["spearman"], spearman(P))
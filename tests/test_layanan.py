@@ -0,0 +1,123 @@
+"""Layanan HTTP spk.layanan di localhost: penggabungan batch, status galat dan process pool."""
+
+import asyncio
+import json
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pytest
+
+from spk.engine import hitung_saw_np
+from spk.layanan import BATAS_BODY, Layanan
+
+MATRIKS = [[70.0, 3.0, 80.0], [90.0, 5.0, 60.0], [60.0, 2.0, 90.0], [80.0, 4.0, 70.0]]
+BOBOT = [0.5, 0.2, 0.3]
+TIPE = ["Benefit", "Cost", "Benefit"]
+
+
+def permintaan(**ubah):
+    return {"metode": "SAW", "matriks": MATRIKS, "bobot": BOBOT, "tipe": TIPE, **ubah}
+
+
+async def kirim_mentah(port, data):
+    """Kirim bytes HTTP apa adanya; kembalikan (status, body JSON)"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(data)
+        await writer.drain()
+        status = int((await reader.readline()).split()[1])
+        header = {}
+        while (baris := await reader.readline()) not in (b"\r\n", b""):
+            nama, _, nilai = baris.decode("latin-1").partition(":")
+            header[nama.strip().lower()] = nilai.strip()
+        return status, json.loads(await reader.readexactly(int(header["content-length"])))
+    finally:
+        writer.close()
+
+
+async def kirim(port, isi, metode_http="POST", path="/hitung"):
+    body = isi if isinstance(isi, bytes) else json.dumps(isi).encode()
+    kepala = f"{metode_http} {path} HTTP/1.1\r\nHost: x\r\nConnection: close\r\nContent-Length: {len(body)}\r\n\r\n"
+    return await kirim_mentah(port, kepala.encode() + body)
+
+
+def jalankan(skenario, **opsi):
+    """Jalankan ``skenario(layanan, port)`` terhadap server di port acak"""
+    async def utama():
+        layanan = Layanan(**opsi)
+        server = await layanan.mulai(port=0)
+        try:
+            async with server:
+                return await skenario(layanan, server.sockets[0].getsockname()[1])
+        finally:
+            layanan.tutup()
+    return asyncio.run(utama())
+
+
+def test_permintaan_bersamaan_digabung():
+    async def skenario(layanan, port):
+        hasil = await asyncio.gather(*(kirim(port, permintaan(bobot=[0.5, 0.2 + i / 100, 0.3])) for i in range(5)))
+        return hasil, layanan.metrik.ringkasan()
+
+    hasil, ringkasan = jalankan(skenario, jendela=0.2)
+    assert [s for s, _ in hasil] == [200] * 5
+    assert ringkasan["ukuran_batch"] == {"5": 1}
+    for i, (_, isi) in enumerate(hasil):
+        skor = hitung_saw_np(MATRIKS, [0.5, 0.2 + i / 100, 0.3], TIPE)[1]
+        np.testing.assert_allclose(isi["skor"], skor)
+
+
+def test_top_k_lebih_besar_dari_n():
+    _, isi = jalankan(lambda layanan, port: kirim(port, permintaan(top_k=50)))
+    assert isi["n_alt"] == 4
+    assert len(isi["teratas"]) == 4
+    skor = [t["skor"] for t in isi["teratas"]]
+    assert skor == sorted(skor, reverse=True)
+
+
+@pytest.mark.parametrize("isi", [
+    b"{bukan json",
+    permintaan(bobot=[0.5, 0.5]),
+    permintaan(metode="WP", matriks=[[1.0, 0.0, 2.0], [2.0, 1.0, 3.0]]),
+    permintaan(metode="XYZ"),
+    permintaan(top_k=0),
+])
+def test_permintaan_salah_400(isi):
+    status, body = jalankan(lambda layanan, port: kirim(port, isi))
+    assert status == 400
+    assert "error" in body
+
+
+@pytest.mark.parametrize("panjang, status", [("-5", 400), ("abc", 400), (str(BATAS_BODY + 1), 413)])
+def test_content_length_tidak_valid(panjang, status):
+    data = f"POST /hitung HTTP/1.1\r\nHost: x\r\nContent-Length: {panjang}\r\n\r\n".encode()
+    assert jalankan(lambda layanan, port: kirim_mentah(port, data))[0] == status
+
+
+def test_path_dan_metode_http():
+    async def skenario(layanan, port):
+        return [(await kirim(port, b"", "GET", "/sehat"))[0],
+                (await kirim(port, b"", "GET", "/hitung"))[0],
+                (await kirim(port, b"", "GET", "/tidak-ada"))[0]]
+
+    assert jalankan(skenario) == [200, 405, 404]
+
+
+def test_batch_di_process_pool_dan_pulih_dari_pool_rusak():
+    async def skenario(layanan, port):
+        sebelum = await kirim(port, permintaan())
+        pool_lama = layanan.batch.executor()
+        # Worker yang mati membuat pool rusak; pool harus dibuang dan dibuat ulang
+        with pytest.raises(BrokenProcessPool):
+            await layanan.batch.jalankan(os._exit, 1)
+        assert layanan.batch._pool is None
+        sesudah = await kirim(port, permintaan())
+        assert layanan.batch._pool is not pool_lama
+        return sebelum, sesudah, layanan.metrik.ringkasan()
+
+    sebelum, sesudah, ringkasan = jalankan(skenario, batas_inline=0, n_proses=1)
+    assert sebelum == sesudah
+    assert sebelum[0] == 200
+    np.testing.assert_allclose(sebelum[1]["skor"], hitung_saw_np(MATRIKS, BOBOT, TIPE)[1])
+    assert ringkasan["batch_proses"] == 2
@@ -0,0 +1,45 @@
+"""Ambang pembalikan peringkat di spk.sensitivitas terhadap grid halus."""
+
+import numpy as np
+import pytest
+
+from spk.engine import hitung_skor_batch
+from spk.sensitivitas import _bobot_satu_kriteria, ambang_pembalikan
+
+TIPE = ["Benefit", "Cost", "Benefit", "Cost"]
+
+
+def kasus(seed):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(1, 100, (60, 4)), rng.dirichlet(np.ones(4))
+
+
+def ringkas(hasil):
+    return sorted((a["kriteria"], a["pasangan"]) for a in hasil)
+
+
+@pytest.mark.parametrize("metode", ["SAW", "TOPSIS"])
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("posisi", [1, 3])
+def test_sama_dengan_grid_halus(metode, seed, posisi):
+    X, bobot = kasus(seed)
+    zoom = ambang_pembalikan(metode, X, bobot, TIPE, posisi=posisi)
+    halus = ambang_pembalikan(metode, X, bobot, TIPE, titik=20001, iterasi_zoom=0, posisi=posisi)
+    assert ringkas(zoom) == ringkas(halus)
+    ambang_halus = {(a["kriteria"], a["pasangan"]): a["bobot_ambang"] for a in halus}
+    for a in zoom:
+        assert abs(a["bobot_ambang"] - ambang_halus[(a["kriteria"], a["pasangan"])]) <= 1e-4
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_saw_ambang_sesuai_titik_potong(seed):
+    # Skor SAW linear terhadap bobot yang digeser, jadi titik potong dua
+    # alternatif punya bentuk tertutup; galat <= setengah sel zoom terakhir
+    X, bobot = kasus(seed)
+    w = bobot / bobot.sum()
+    lebar_sel = 1 / 200 / 33 ** 2
+    for a in ambang_pembalikan("SAW", X, bobot, TIPE):
+        s0, s1 = hitung_skor_batch("SAW", X, _bobot_satu_kriteria(w, a["kriteria"], [0.0, 1.0]), TIPE)
+        p, q = a["pasangan"]
+        d0, d1 = s0[p] - s0[q], s1[p] - s1[q]
+        assert abs(a["bobot_ambang"] - d0 / (d0 - d1)) <= lebar_sel / 2 + 1e-12
@@ -0,0 +1,49 @@
+"""Peringkat sort eksternal di spk.streaming."""
+
+import numpy as np
+import pytest
+
+from cli import main
+from spk.engine import METRIK_JARAK, hitung_topsis_np
+from spk.streaming import peringkat_memmap, skor_streaming
+
+
+def peringkat_acuan(skor):
+    """1 + jumlah skor yang lebih besar (seri mendapat peringkat terkecil)"""
+    return 1 + np.searchsorted(np.sort(-skor), -skor, side="left")
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_peringkat_memmap(seed, tmp_path):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1, 3000))
+    # Separuh kasus dengan banyak skor seri
+    skor = rng.integers(0, 20, n).astype(float) if seed % 2 else rng.random(n)
+    ukuran_chunk = int(rng.integers(1, 400))
+    hasil = list(peringkat_memmap(skor, ukuran_chunk, tmp_path, fan_in=int(rng.integers(2, 6))))
+    assert [awal for awal, _ in hasil] == list(range(0, n, ukuran_chunk))
+    np.testing.assert_array_equal(np.concatenate([r for _, r in hasil]), peringkat_acuan(skor))
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize("metrik", METRIK_JARAK)
+def test_skor_streaming_topsis_mengikuti_metrik(metrik, tmp_path):
+    X = np.random.default_rng(0).uniform(1, 100, (500, 3))
+    bobot, tipe = [0.5, 0.3, 0.2], ["Benefit", "Cost", "Benefit"]
+    np.save(tmp_path / "x.npy", X)
+    skor_streaming(tmp_path / "x.npy", "TOPSIS", bobot, tipe, tmp_path / "hasil.csv", ukuran_chunk=37,
+                   path_skor=tmp_path / "skor.npy", metrik=metrik)
+    np.testing.assert_allclose(np.load(tmp_path / "skor.npy"), hitung_topsis_np(X, bobot, tipe, metrik)[6], rtol=1e-12)
+
+
+def test_cli_metrik(tmp_path, capsys):
+    X = np.random.default_rng(1).uniform(1, 100, (200, 2))
+    np.save(tmp_path / "x.npy", X)
+    argumen = [str(tmp_path / "x.npy"), "--metode", "topsis", "--bobot", "0.6,0.4", "--tipe", "B,C",
+               "--output", str(tmp_path / "hasil.csv"), "--simpan-skor", str(tmp_path / "skor.npy"), "--chunk", "64"]
+    assert main(argumen + ["--metrik", "chebyshev"]) == 0
+    np.testing.assert_allclose(np.load(tmp_path / "skor.npy"),
+                               hitung_topsis_np(X, [0.6, 0.4], ["Benefit", "Cost"], "chebyshev")[6], rtol=1e-12)
+    assert "chebyshev" in capsys.readouterr().out
+    with pytest.raises(SystemExit):
+        main(argumen + ["--metrik", "minkowski"])
@@ -0,0 +1,104 @@
+"""AHP tidak lengkap (spk.tak_lengkap): desain, LLSM, CG Laplacian dan saran pasangan."""
+
+import numpy as np
+import pytest
+
+from spk.tak_lengkap import cg_laplacian, desain_perbandingan, prioritas_llsm, saran_perbandingan, terhubung
+
+
+def laplacian(n, pasangan):
+    L = np.zeros((n, n))
+    for i, j in pasangan:
+        L[i, i] += 1
+        L[j, j] += 1
+        L[i, j] -= 1
+        L[j, i] -= 1
+    return L
+
+
+def kasus(seed, n=40, jenis="acak", tambahan=2.0):
+    rng = np.random.default_rng(seed)
+    pasangan = desain_perbandingan(n, jenis, tambahan, seed)
+    w = rng.dirichlet(np.ones(n))
+    # Nilai dari bobot sebenarnya dengan galat log-normal
+    nilai = w[pasangan[:, 0]] / w[pasangan[:, 1]] * np.exp(rng.normal(0, 0.3, len(pasangan)))
+    return pasangan, nilai
+
+
+@pytest.mark.parametrize("jenis", ["rantai", "acak"])
+@pytest.mark.parametrize("tambahan", [0.0, 0.5, 3.0, 100.0])
+@pytest.mark.parametrize("n", [2, 3, 17, 200])
+def test_desain_selalu_terhubung(jenis, tambahan, n):
+    for seed in range(5):
+        pasangan = desain_perbandingan(n, jenis, tambahan, seed)
+        assert terhubung(n, pasangan)
+        assert np.all(pasangan[:, 0] < pasangan[:, 1])
+        assert len({tuple(p) for p in pasangan.tolist()}) == len(pasangan)
+        assert len(pasangan) == min(n - 1 + round(tambahan * n / 2), n * (n - 1) // 2)
+
+
+def test_terhubung_mendeteksi_graf_terputus():
+    assert not terhubung(4, [(0, 1), (2, 3)])
+    assert terhubung(4, [(0, 1), (2, 3), (1, 2)])
+    with pytest.raises(ValueError, match="menghubungkan"):
+        prioritas_llsm(4, [(0, 1), (2, 3)], [2.0, 3.0])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_llsm_sama_dengan_lstsq(seed):
+    n = 40
+    pasangan, nilai = kasus(seed, n)
+    B = np.zeros((len(pasangan), n))
+    B[np.arange(len(pasangan)), pasangan[:, 0]] = 1.0
+    B[np.arange(len(pasangan)), pasangan[:, 1]] = -1.0
+    v = np.linalg.lstsq(B, np.log(nilai), rcond=None)[0]
+    w = np.exp(v - v.max())
+    hasil = prioritas_llsm(n, pasangan, nilai, toleransi=1e-13)
+    np.testing.assert_allclose(hasil["bobot"], w / w.sum(), rtol=1e-9)
+    residual = np.log(nilai) - B @ v
+    assert hasil["galat_rms"] == pytest.approx(np.sqrt(np.mean(residual ** 2)))
+    assert hasil["sigma2"] == pytest.approx(residual @ residual / (len(pasangan) - n + 1))
+
+
+def test_llsm_konsisten_dan_pohon():
+    w = np.array([0.4, 0.3, 0.2, 0.1])
+    pasangan = np.array([[0, 1], [1, 2], [2, 3]])
+    hasil = prioritas_llsm(4, pasangan, w[pasangan[:, 0]] / w[pasangan[:, 1]])
+    np.testing.assert_allclose(hasil["bobot"], w)
+    assert hasil["galat_rms"] < 1e-9
+    assert np.isnan(hasil["sigma2"])
+
+
+def test_cg_laplacian_banyak_ruas_kanan():
+    n = 60
+    pasangan = desain_perbandingan(n, "acak", 1.5, 3)
+    b = np.random.default_rng(0).normal(size=(n, 4))
+    x = cg_laplacian(n, pasangan[:, 0], pasangan[:, 1], b, toleransi=1e-13)
+    b = b - b.mean(axis=0)
+    np.testing.assert_allclose(x, np.linalg.pinv(laplacian(n, pasangan)) @ b, atol=1e-9)
+    np.testing.assert_allclose(x.mean(axis=0), 0.0, atol=1e-12)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_saran_jangkar_sama_dengan_semua_pasangan(seed):
+    n = [30, 120, 300][seed % 3]
+    pasangan = desain_perbandingan(n, ["rantai", "acak"][seed % 2], seed % 3, seed)
+    jangkar = saran_perbandingan(n, pasangan, 5, seed=seed)
+    semua = saran_perbandingan(n, pasangan, 5, seed=seed, n_jangkar=n)
+    assert [s[:2] for s in jangkar] == [s[:2] for s in semua]
+    np.testing.assert_allclose([s[2] for s in jangkar], [s[2] for s in semua])
+
+
+def test_saran_resistansi_besar_dan_belum_dinilai():
+    n = 80
+    pasangan = desain_perbandingan(n, "acak", 1.0, 7)
+    saran = saran_perbandingan(n, pasangan, 5)
+    ada = {tuple(p) for p in pasangan.tolist()}
+    assert all(i < j and (i, j) not in ada for i, j, _ in saran)
+    assert [r for _, _, r in saran] == sorted((r for _, _, r in saran), reverse=True)
+    # Resistansi efektif eksak: R(i, j) = L+_ii + L+_jj - 2 L+_ij
+    Lp = np.linalg.pinv(laplacian(n, pasangan))
+    R = np.diag(Lp)[:, None] + np.diag(Lp)[None, :] - 2 * Lp
+    i, j = np.triu_indices(n, 1)
+    belum = np.array([(a, b) not in ada for a, b in zip(i, j)])
+    assert R[saran[0][0], saran[0][1]] >= 0.7 * R[i[belum], j[belum]].max()
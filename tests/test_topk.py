@@ -0,0 +1,35 @@
+"""Top-k dengan dan tanpa prefilter skyline di spk.topk."""
+
+import numpy as np
+import pytest
+
+from spk.engine import hitung_topsis_np
+from spk.topk import peringkat_top_k
+
+
+@pytest.mark.parametrize("metode", ["SAW", "WP", "TOPSIS"])
+@pytest.mark.parametrize("seed", range(5))
+def test_prefilter_sama_dengan_tanpa_prefilter(metode, seed):
+    rng = np.random.default_rng(seed)
+    X = rng.uniform(1, 100, (2000, 3))
+    bobot, tipe = rng.dirichlet(np.ones(3)), ["Benefit", "Cost", "Benefit"]
+    penuh = peringkat_top_k(metode, X, bobot, tipe, k=5)
+    dipangkas = peringkat_top_k(metode, X, bobot, tipe, k=5, prefilter=True)
+    np.testing.assert_array_equal(dipangkas["indeks"], penuh["indeks"])
+    np.testing.assert_allclose(dipangkas["skor"], penuh["skor"])
+
+
+def test_prefilter_bobot_negatif_ditolak():
+    X = np.random.default_rng(0).uniform(1, 100, (2000, 3))
+    with pytest.raises(ValueError):
+        peringkat_top_k("SAW", X, [1, -0.5, 0.2], ["Benefit"] * 3, k=5, prefilter=True)
+
+
+@pytest.mark.parametrize("metrik", ["euclidean", "manhattan", "chebyshev"])
+def test_topsis_mengikuti_metrik(metrik):
+    X = np.random.default_rng(1).uniform(1, 100, (500, 4))
+    bobot, tipe = [0.4, 0.3, 0.2, 0.1], ["Benefit", "Cost", "Benefit", "Cost"]
+    hasil = peringkat_top_k("TOPSIS", X, bobot, tipe, k=10, metrik=metrik)
+    skor = hitung_topsis_np(X, bobot, tipe, metrik)[6]
+    np.testing.assert_array_equal(hasil["indeks"], np.argsort(-skor, kind="stable")[:10])
+    np.testing.assert_allclose(hasil["skor"], skor[hasil["indeks"]])
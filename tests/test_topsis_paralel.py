@@ -0,0 +1,70 @@
+"""TOPSIS per chunk (spk.topsis_paralel) terhadap hitung_topsis_np."""
+
+import numpy as np
+import pytest
+
+from spk.engine import METRIK_JARAK, hitung_topsis_np
+from spk.topsis_paralel import hitung_topsis_paralel
+
+TIPE = ["Benefit", "Cost", "Benefit", "Cost", "Benefit"]
+
+
+def kasus(n_alt=1000, seed=0):
+    rng = np.random.default_rng(seed)
+    data = rng.uniform(1, 100, (n_alt, 5))
+    data[:, 2] = 0.0
+    return data, rng.dirichlet(np.ones(5))
+
+
+@pytest.mark.parametrize("metrik", METRIK_JARAK)
+@pytest.mark.parametrize("n_worker, baris_per_chunk", [(1, None), (3, 7), (4, 333), (2, 1)])
+def test_sama_dengan_topsis_np(metrik, n_worker, baris_per_chunk):
+    data, bobot = kasus()
+    acuan = hitung_topsis_np(data, bobot, TIPE, metrik)
+    hasil = hitung_topsis_paralel(data, bobot, TIPE, metrik, n_worker=n_worker, baris_per_chunk=baris_per_chunk)
+    for a, b in zip(hasil, acuan[2:]):
+        np.testing.assert_allclose(a, b, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("metrik", METRIK_JARAK)
+def test_float32(metrik):
+    data, bobot = kasus()
+    acuan = hitung_topsis_np(data, bobot, TIPE, metrik)
+    for X, dtype in [(data.astype(np.float32), None), (data, np.float32)]:
+        hasil = hitung_topsis_paralel(X, bobot, TIPE, metrik, dtype=dtype, n_worker=3, baris_per_chunk=101)
+        assert all(a.dtype == np.float32 for a in hasil[2:])
+        for a, b in zip(hasil, acuan[2:]):
+            np.testing.assert_allclose(a, b, rtol=1e-5, atol=1e-6)
+
+
+def test_out_terbobot_di_tempat():
+    data, bobot = kasus(500)
+    acuan = hitung_topsis_np(data, bobot, TIPE)
+    out = np.empty_like(data)
+    hitung_topsis_paralel(data, bobot, TIPE, n_worker=2, baris_per_chunk=64, out_terbobot=out)
+    np.testing.assert_allclose(out, acuan[1], rtol=1e-12)
+    # data itu sendiri sebagai tujuan: dinormalisasi dan dibobot di tempat
+    X = data.copy()
+    hasil = hitung_topsis_paralel(X, bobot, TIPE, n_worker=2, baris_per_chunk=64, out_terbobot=X)
+    np.testing.assert_allclose(X, acuan[1], rtol=1e-12)
+    np.testing.assert_allclose(hasil[4], acuan[6], rtol=1e-12)
+
+
+def test_memmap(tmp_path):
+    data, bobot = kasus(777)
+    X = np.lib.format.open_memmap(tmp_path / "x.npy", mode="w+", dtype=np.float64, shape=data.shape)
+    X[:] = data
+    X.flush()
+    X = np.load(tmp_path / "x.npy", mmap_mode="r")
+    hasil = hitung_topsis_paralel(X, bobot, TIPE, n_worker=2, baris_per_chunk=100)
+    np.testing.assert_allclose(hasil[4], hitung_topsis_np(data, bobot, TIPE)[6], rtol=1e-12)
+
+
+def test_ukuran_salah_ditolak():
+    data, bobot = kasus(10)
+    with pytest.raises(ValueError):
+        hitung_topsis_paralel(data, bobot[:3], TIPE)
+    with pytest.raises(ValueError):
+        hitung_topsis_paralel(data, bobot, TIPE, out_terbobot=np.empty((5, 5)))
+    with pytest.raises(ValueError):
+        hitung_topsis_paralel(data, bobot, TIPE, metrik="minkowski")